@@ -1 +1,19 @@
-from .inter import Inter  # noqa: F401
+from typing import TYPE_CHECKING
+
+from .misc.importacao import exportacoes_preguicosas
+
+if TYPE_CHECKING:
+    from .async_inter import AsyncInter  # noqa: F401
+    from .inter import Inter  # noqa: F401
+    from .pool_inter import CredenciaisConta, PoolInter  # noqa: F401
+
+_EXPORTACOES = {
+    "AsyncInter": ".async_inter",
+    "Inter": ".inter",
+    "CredenciaisConta": ".pool_inter",
+    "PoolInter": ".pool_inter",
+}
+
+__all__ = list(_EXPORTACOES)
+
+__getattr__, __dir__ = exportacoes_preguicosas(__name__, _EXPORTACOES)
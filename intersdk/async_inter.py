@@ -0,0 +1,24 @@
+from types import TracebackType
+
+from .autenticacao import AsyncAutenticacao
+from .cobranca import AsyncCobranca
+
+
+class AsyncInter:
+    def __init__(self, autenticacao: AsyncAutenticacao) -> None:
+        self.autenticacao = autenticacao
+        self.cobranca = AsyncCobranca(self.autenticacao)
+
+    async def aclose(self) -> None:
+        await self.autenticacao.aclose()
+
+    async def __aenter__(self) -> "AsyncInter":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -1 +1,4 @@
+from .async_autenticacao import AsyncAutenticacao  # noqa: F401
 from .autenticacao import Autenticacao  # noqa: F401
+from .token import Token  # noqa: F401
+from .token_store import FileTokenStore, MemoryTokenStore, TokenStore  # noqa: F401
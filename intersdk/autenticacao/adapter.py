@@ -0,0 +1,32 @@
+from requests.adapters import HTTPAdapter
+
+from .contexto_ssl import criar_contexto_ssl
+
+
+class MTLSAdapter(HTTPAdapter):
+    def __init__(
+        self,
+        certificate_path: str,
+        private_key_path: str,
+        ca_certificate_path: str | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+    ) -> None:
+        self.ssl_context = criar_contexto_ssl(certificate_path, private_key_path, ca_certificate_path)
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs["ssl_context"] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        return super().proxy_manager_for(*args, **kwargs)
+
+    def cert_verify(self, conn, url, verify, cert) -> None:
+        super().cert_verify(conn, url, verify, cert)
+        if verify is True:
+            # o contexto SSL já carrega as CAs; evita recarregá-las a cada nova conexão
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
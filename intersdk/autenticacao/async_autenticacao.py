@@ -0,0 +1,125 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+import loguru
+
+from intersdk.misc.log import amostrar, conferir_resposta
+from intersdk.misc.metricas import ColetorMetricas, Medicao
+from intersdk.misc.politica_requisicao import PoliticaRequisicao
+from intersdk.misc.typing import TokenScope
+
+from .autenticacao_base import AutenticacaoBase
+from .contexto_ssl import criar_contexto_ssl
+from .token import Token
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncAutenticacao(AutenticacaoBase):
+    def __init__(
+        self,
+        certificate_path: str,
+        private_key_path: str,
+        client_id: str,
+        client_secret: str,
+        base_url: str = "https://cdpj.partners.bancointer.com.br",
+        ca_certificate_path: str | None = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        politica: PoliticaRequisicao | None = None,
+        metricas: ColetorMetricas | None = None,
+    ) -> None:
+        # repassa os mesmos argumentos que Autenticacao
+        # pylint: disable=duplicate-code
+        super().__init__(
+            certificate_path,
+            private_key_path,
+            client_id,
+            client_secret,
+            base_url,
+            ca_certificate_path,
+            politica,
+            metricas,
+        )
+        # pylint: enable=duplicate-code
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.__token: Token | None = None
+        self.__token_lock = asyncio.Lock()
+        self.__client: "httpx.AsyncClient | None" = None
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        if self.__client is None:
+            self.__client = self.__create_client()
+        return self.__client
+
+    def __create_client(self) -> "httpx.AsyncClient":
+        try:
+            import httpx  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise ImportError("o cliente assíncrono requer o pacote httpx: pip install intersdk[async]") from error
+        if amostrar():
+            loguru.logger.info("Criando cliente HTTP assíncrono com mTLS")
+        return httpx.AsyncClient(
+            verify=criar_contexto_ssl(self.certificate_path, self.private_key_path, self.ca_certificate_path),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            # requisições além de max_connections aguardam uma conexão livre em vez de falhar
+            timeout=httpx.Timeout(30, pool=None),
+        )
+
+    async def aclose(self) -> None:
+        if self.__client is not None:
+            await self.__client.aclose()
+            self.__client = None
+
+    async def __request_token(self, scope: list[TokenScope]) -> dict:
+        data = self._corpo_token(scope)
+        response = await self.politica.executar_async(
+            "token",
+            lambda: self.client.post(
+                url=f"{self.base_url}/oauth/v2/token",
+                data=data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            ),
+            idempotente=True,
+            metricas=self.metricas,
+        )
+        conferir_resposta(response, response.is_success, "Erro ao obter token de acesso")
+        return response.json()
+
+    async def __buscar_token(self, scope: list[TokenScope]) -> Token:
+        metricas = self.metricas
+        if metricas is None:
+            return Token.from_dict(await self.__request_token(scope))
+        inicio = time.perf_counter()
+        try:
+            token = Token.from_dict(await self.__request_token(scope))
+        except Exception as error:
+            metricas.registrar(Medicao("token", "obter", time.perf_counter() - inicio, erro=type(error).__name__))
+            raise
+        metricas.registrar(Medicao("token", "obter", time.perf_counter() - inicio))
+        return token
+
+    async def token(self, scope: list[TokenScope]) -> Token:
+        if (token := self._token_vigente(self.__token, scope)) is not None:
+            return token
+        async with self.__token_lock:
+            return await self.__obtain_token(scope)
+
+    async def __obtain_token(self, scope: list[TokenScope]) -> Token:
+        if (token := self._token_vigente(self.__token, scope)) is not None:
+            return token
+        request_scope, old_scope = self._escopo_requisicao(self.__token, scope)
+        new_token = await self.__buscar_token(request_scope)
+        self._conferir_token(new_token, scope, old_scope)
+        self.__token = new_token
+        return new_token
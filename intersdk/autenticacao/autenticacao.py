@@ -1,79 +1,195 @@
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
+from threading import Event, Lock, Thread
 from urllib import parse
 
 import loguru
 import requests
 from requests.exceptions import SSLError
 
+from intersdk.misc.log import amostrar, conferir_resposta
+from intersdk.misc.metricas import ColetorMetricas, Medicao
+from intersdk.misc.politica_requisicao import PoliticaRequisicao
 from intersdk.misc.typing import TokenScope
+from intersdk.transporte.transporte import Transporte
+from intersdk.transporte.transporte_requests import TransporteRequests
 
+from .autenticacao_base import AutenticacaoBase
 from .token import Token
+from .token_store import MemoryTokenStore, TokenStore
 
 
-class Autenticacao:
-    def __init__(self, certificate_path: str, private_key_path: str, client_id: str, client_secret: str) -> None:
-        self.certificate_path = certificate_path
-        self.private_key_path = private_key_path
-        self.client_id = client_id
-        self.client_secret = client_secret
+class Autenticacao(AutenticacaoBase):
+    def __init__(
+        self,
+        certificate_path: str,
+        private_key_path: str,
+        client_id: str,
+        client_secret: str,
+        base_url: str = "https://cdpj.partners.bancointer.com.br",
+        ca_certificate_path: str | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        token_store: TokenStore | None = None,
+        politica: PoliticaRequisicao | None = None,
+        metricas: ColetorMetricas | None = None,
+        transporte: Transporte | None = None,
+    ) -> None:
+        super().__init__(
+            certificate_path,
+            private_key_path,
+            client_id,
+            client_secret,
+            base_url,
+            ca_certificate_path,
+            politica,
+            metricas,
+        )
+        self.pool_maxsize = pool_maxsize
+        self.token_store = token_store if token_store is not None else MemoryTokenStore()
         self.__token: Token | None = None
-
-    @staticmethod
-    def __dict_to_token(data: dict) -> Token:
-        return Token(
-            token_type=data["token_type"],
-            access_token=data["access_token"],
-            scope=data["scope"].split(),
-            expires_in=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=data["expires_in"]),
+        self.__token_lock = Lock()
+        self.__renovacao: Thread | None = None
+        self.__renovacao_fracao = 0.75
+        self.__renovacao_parar = Event()
+        # o transporte padrão só abre a sessão na primeira requisição
+        self.__transporte = (
+            transporte
+            if transporte is not None
+            else TransporteRequests(
+                certificate_path=certificate_path,
+                private_key_path=private_key_path,
+                ca_certificate_path=ca_certificate_path,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+            )
         )
 
+    @property
+    def transporte(self) -> Transporte:
+        return self.__transporte
+
+    @property
+    def session(self) -> requests.Session:
+        """Sessão do transporte padrão; mantida para quem configurava a sessão antes dos transportes."""
+        transporte = self.transporte
+        if not isinstance(transporte, TransporteRequests):
+            raise AttributeError(f"session não existe com {type(transporte).__name__}")
+        return transporte.session
+
+    def close(self) -> None:
+        self.parar_renovacao()
+        self.__transporte.close()
+
     def __request_token(self, scope: list[TokenScope]) -> dict:
-        data = {
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "grant_type": "client_credentials",
-            "scope": " ".join(scope),
-        }
-        loguru.logger.info(f"Obtendo token de acesso com escopo {scope}")
+        corpo = parse.urlencode(self._corpo_token(scope)).encode()
         try:
-            response = requests.post(
-                url="https://cdpj.partners.bancointer.com.br/oauth/v2/token",
-                data=parse.urlencode(data),
-                cert=(self.certificate_path, self.private_key_path),
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                timeout=30,
+            response = self.politica.executar(
+                "token",
+                lambda: self.transporte.requisitar(
+                    "POST",
+                    f"{self.base_url}/oauth/v2/token",
+                    headers={"Content-Type": "application/x-www-form-urlencoded"},
+                    corpo=corpo,
+                    timeout=30,
+                ),
+                idempotente=True,
+                metricas=self.metricas,
             )
         except SSLError as error:
             loguru.logger.error("Erro de SSL: verifique se o certificado e a chave privada estão corretos")
             raise error
-        if not response.ok:
-            loguru.logger.error(f"Erro ao obter token de acesso: {response.text}")
-            response.raise_for_status()
-        loguru.logger.debug(f"Resposta da requisição: {response.text}")
+        conferir_resposta(response, response.ok, "Erro ao obter token de acesso")
         return response.json()
 
+    def __buscar_token(self, scope: list[TokenScope], motivo: str) -> Token:
+        metricas = self.metricas
+        if metricas is None:
+            return Token.from_dict(self.__request_token(scope))
+        inicio = time.perf_counter()
+        try:
+            token = Token.from_dict(self.__request_token(scope))
+        except Exception as error:
+            metricas.registrar(Medicao("token", motivo, time.perf_counter() - inicio, erro=type(error).__name__))
+            raise
+        metricas.registrar(Medicao("token", motivo, time.perf_counter() - inicio))
+        return token
+
     def token(self, scope: list[TokenScope]) -> Token:
-        old_scope: list[TokenScope] | None = None
-        request_scope: list[TokenScope] | None = None
-        if self.__token is not None:
-            if not self.__token.expired:
-                if all(item in self.__token.scope for item in scope):
-                    return self.__token
-                loguru.logger.info("Token de acesso já existe, mas não abrange o escopo solicitado")
-                old_scope = self.__token.scope
-                request_scope = list(set(self.__token.scope + scope))
-            else:
-                loguru.logger.info("Token de acesso já existe, mas está expirado")
-                self.__token = None
-        else:
-            loguru.logger.info("Token de acesso não existe")
-        request_scope = scope if request_scope is None else request_scope
-        new_token = self.__dict_to_token(self.__request_token(request_scope))
-        if not all(item in new_token.scope for item in scope):
-            loguru.logger.error("Erro ao obter token de acesso: escopo solicitado não foi concedido")
-            raise AssertionError("escopo solicitado não foi concedido")
-        if old_scope is not None and not all(item in new_token.scope for item in old_scope):
-            loguru.logger.warning("Escopo anterior não foi concedido e será substituído pelo novo escopo")
-        loguru.logger.success("Token de acesso obtido com sucesso")
+        if (token := self._token_vigente(self.__token, scope)) is not None:
+            return token
+        with self.__token_lock, self.token_store.lock(self.client_id):
+            return self.__obtain_token(scope)
+
+    def __obtain_token(self, scope: list[TokenScope]) -> Token:
+        stored_token = self.token_store.get(self.client_id)
+        if stored_token is not None:
+            self.__token = stored_token
+        if (token := self._token_vigente(self.__token, scope)) is not None:
+            return token
+        request_scope, old_scope = self._escopo_requisicao(self.__token, scope)
+        new_token = self.__buscar_token(request_scope, "obter")
+        self._conferir_token(new_token, scope, old_scope)
         self.__token = new_token
-        return self.__token
+        self.token_store.set(self.client_id, new_token)
+        return new_token
+
+    def iniciar_renovacao(self, fracao: float = 0.75) -> None:
+        if not 0 < fracao < 1:
+            raise ValueError("fracao deve ser maior que 0 e menor que 1")
+        self.__renovacao_fracao = fracao
+        if self.__renovacao is not None and self.__renovacao.is_alive():
+            return
+        self.__renovacao_parar.clear()
+        self.__renovacao = Thread(target=self.__renovar, name="intersdk-renovacao-token", daemon=True)
+        self.__renovacao.start()
+        if amostrar():
+            loguru.logger.info("Renovação automática do token iniciada em {:.0%} da validade", fracao)
+
+    def parar_renovacao(self) -> None:
+        if self.__renovacao is None:
+            return
+        self.__renovacao_parar.set()
+        self.__renovacao.join()
+        self.__renovacao = None
+        if amostrar():
+            loguru.logger.info("Renovação automática do token encerrada")
+
+    def __renovar(self) -> None:
+        while not self.__renovacao_parar.is_set():
+            token = self.__token
+            if token is None:
+                self.__renovacao_parar.wait(1)
+                continue
+            espera = token.renewal_time(self.__renovacao_fracao) - datetime.now(timezone.utc).replace(tzinfo=None)
+            if espera.total_seconds() > 0:
+                self.__renovacao_parar.wait(espera.total_seconds())
+                continue
+            try:
+                self.__renew_token(token)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                loguru.logger.error("Erro ao renovar token de acesso: {}", error)
+                self.__renovacao_parar.wait(5)
+
+    def __renew_token(self, token: Token) -> None:
+        # o token antigo continua em uso até a troca
+        with self.__token_lock, self.token_store.lock(self.client_id):
+            if self.__token is not token:
+                return
+            stored_token = self.token_store.get(self.client_id)
+            if stored_token is not None and stored_token.issued_at > token.issued_at:
+                if amostrar():
+                    loguru.logger.info("Token de acesso já foi renovado por outro processo")
+                self.__token = stored_token
+                return
+            if amostrar():
+                loguru.logger.info("Renovando token de acesso antes da expiração")
+            new_token = self.__buscar_token(token.scope, "renovar")
+            self.__token = new_token
+            self.token_store.set(self.client_id, new_token)
+        if amostrar():
+            loguru.logger.success("Token de acesso renovado com sucesso")
@@ -0,0 +1,74 @@
+import loguru
+
+from intersdk.misc.log import amostrar
+from intersdk.misc.metricas import ColetorMetricas
+from intersdk.misc.politica_requisicao import PoliticaRequisicao
+from intersdk.misc.typing import TokenScope
+
+from .token import Token
+
+
+class AutenticacaoBase:
+    """Configuração e regras de obtenção do token comuns a `Autenticacao` e `AsyncAutenticacao`, que
+    diferem apenas no cliente HTTP."""
+
+    def __init__(
+        self,
+        certificate_path: str,
+        private_key_path: str,
+        client_id: str,
+        client_secret: str,
+        base_url: str,
+        ca_certificate_path: str | None,
+        politica: PoliticaRequisicao | None,
+        metricas: ColetorMetricas | None,
+    ) -> None:
+        self.certificate_path = certificate_path
+        self.private_key_path = private_key_path
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.base_url = base_url
+        self.ca_certificate_path = ca_certificate_path
+        self.politica = politica if politica is not None else PoliticaRequisicao()
+        self.metricas = metricas
+
+    def _corpo_token(self, scope: list[TokenScope]) -> dict[str, str]:
+        if amostrar():
+            loguru.logger.info("Obtendo token de acesso com escopo {}", scope)
+        return {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "grant_type": "client_credentials",
+            "scope": " ".join(scope),
+        }
+
+    @staticmethod
+    def _token_vigente(token: Token | None, scope: list[TokenScope]) -> Token | None:
+        return token if token is not None and not token.expired and token.covers(scope) else None
+
+    @staticmethod
+    def _escopo_requisicao(
+        token: Token | None, scope: list[TokenScope]
+    ) -> tuple[list[TokenScope], list[TokenScope] | None]:
+        """Escopo a pedir para um `token` que não atende `scope` e o escopo que ele ainda tinha, se válido."""
+        if token is None:
+            if amostrar():
+                loguru.logger.info("Token de acesso não existe")
+            return scope, None
+        if token.expired:
+            if amostrar():
+                loguru.logger.info("Token de acesso já existe, mas está expirado")
+            return scope, None
+        if amostrar():
+            loguru.logger.info("Token de acesso já existe, mas não abrange o escopo solicitado")
+        return list(set(token.scope + scope)), token.scope
+
+    @staticmethod
+    def _conferir_token(token: Token, scope: list[TokenScope], old_scope: list[TokenScope] | None) -> None:
+        if not token.covers(scope):
+            loguru.logger.error("Erro ao obter token de acesso: escopo solicitado não foi concedido")
+            raise AssertionError("escopo solicitado não foi concedido")
+        if old_scope is not None and not token.covers(old_scope):
+            loguru.logger.warning("Escopo anterior não foi concedido e será substituído pelo novo escopo")
+        if amostrar():
+            loguru.logger.success("Token de acesso obtido com sucesso")
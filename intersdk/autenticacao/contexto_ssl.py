@@ -0,0 +1,11 @@
+import ssl
+
+import certifi
+
+
+def criar_contexto_ssl(
+    certificate_path: str, private_key_path: str, ca_certificate_path: str | None = None
+) -> ssl.SSLContext:
+    context = ssl.create_default_context(cafile=ca_certificate_path or certifi.where())
+    context.load_cert_chain(certfile=certificate_path, keyfile=private_key_path)
+    return context
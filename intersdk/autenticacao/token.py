@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 
 from intersdk.misc.typing import TokenScope
@@ -10,6 +10,7 @@ class Token:
     access_token: str
     scope: list[TokenScope]
     expires_in: datetime
+    issued_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
 
     @property
     def expired(self) -> bool:
@@ -18,3 +19,22 @@ class Token:
     @property
     def authorization_header(self) -> str:
         return f"{self.token_type} {self.access_token}"
+
+    def renewal_time(self, fraction: float) -> datetime:
+        return min(
+            self.issued_at + (self.expires_in - self.issued_at) * fraction, self.expires_in - timedelta(minutes=1)
+        )
+
+    def covers(self, scope: list[TokenScope]) -> bool:
+        return all(item in self.scope for item in scope)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Token":
+        issued_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        return cls(
+            token_type=data["token_type"],
+            access_token=data["access_token"],
+            scope=data["scope"].split(),
+            expires_in=issued_at + timedelta(seconds=data["expires_in"]),
+            issued_at=issued_at,
+        )
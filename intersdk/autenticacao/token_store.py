@@ -0,0 +1,121 @@
+import json
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import IO
+
+from intersdk.misc.arquivo import escrita_atomica
+
+from .token import Token
+
+
+class TokenStore(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Token | None:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, token: Token) -> None:
+        ...
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:  # pylint: disable=unused-argument
+        yield
+
+    @staticmethod
+    def token_to_dict(token: Token) -> dict:
+        return {
+            "token_type": token.token_type,
+            "access_token": token.access_token,
+            "scope": token.scope,
+            "expires_in": token.expires_in.isoformat(),
+            "issued_at": token.issued_at.isoformat(),
+        }
+
+    @staticmethod
+    def dict_to_token(data: dict) -> Token:
+        return Token(
+            token_type=data["token_type"],
+            access_token=data["access_token"],
+            scope=data["scope"],
+            expires_in=datetime.fromisoformat(data["expires_in"]),
+            issued_at=datetime.fromisoformat(data["issued_at"]),
+        )
+
+
+class MemoryTokenStore(TokenStore):
+    def __init__(self) -> None:
+        self.__tokens: dict[str, Token] = {}
+        # um lock por chave: compartilhado entre contas, a obtenção do token de uma não bloqueia as demais
+        self.__locks: dict[str, Lock] = {}
+        self.__locks_lock = Lock()
+
+    def get(self, key: str) -> Token | None:
+        return self.__tokens.get(key)
+
+    def set(self, key: str, token: Token) -> None:
+        self.__tokens[key] = token
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with self.__locks_lock:
+            lock = self.__locks.setdefault(key, Lock())
+        with lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+
+    def __read(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    def get(self, key: str) -> Token | None:
+        data = self.__read().get(key)
+        return self.dict_to_token(data) if data is not None else None
+
+    def set(self, key: str, token: Token) -> None:
+        data = self.__read() | {key: self.token_to_dict(token)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with escrita_atomica(self.path, mode=0o600) as file:
+            file.write(json.dumps(data).encode("utf-8"))
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a+b") as file:
+            _lock_file(file)
+            try:
+                yield
+            finally:
+                _unlock_file(file)
+
+
+if sys.platform == "win32":
+    import msvcrt  # pylint: disable=import-error
+
+    def _lock_file(file: IO) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(file: IO) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(file: IO) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(file: IO) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
@@ -1,2 +1,53 @@
-from .cobranca import Cobranca  # noqa: F401
-from .components import Boleto, ComponenteFinanceiro, Endereco, Pessoa  # noqa: F401
+from typing import TYPE_CHECKING
+
+from intersdk.misc.importacao import exportacoes_preguicosas
+
+if TYPE_CHECKING:
+    from .async_cobranca import AsyncCobranca  # noqa: F401
+    from .cache_boletos import CacheBoletos  # noqa: F401
+    from .cobranca import Cobranca  # noqa: F401
+    from .codigo_barras import CodigoBarras  # noqa: F401
+    from .components import (  # noqa: F401
+        Boleto,
+        BoletoBase,
+        BoletoBatch,
+        BoletoRecuperado,
+        ComponenteFinanceiro,
+        Endereco,
+        Pessoa,
+    )
+    from .cursor_watch import CursorWatch  # noqa: F401
+    from .diario_emissao import DiarioEmissao, RegistroEmissao  # noqa: F401
+    from .espelho_boletos import EspelhoBoletos  # noqa: F401
+    from .webhook import (  # noqa: F401
+        AtualizacaoBoleto,
+        ReceptorWebhook,
+        ServidorWebhook,
+        Webhook,
+    )
+
+_EXPORTACOES = {
+    "AsyncCobranca": ".async_cobranca",
+    "CacheBoletos": ".cache_boletos",
+    "Cobranca": ".cobranca",
+    "CodigoBarras": ".codigo_barras",
+    "Boleto": ".components",
+    "BoletoBase": ".components",
+    "BoletoBatch": ".components",
+    "BoletoRecuperado": ".components",
+    "ComponenteFinanceiro": ".components",
+    "Endereco": ".components",
+    "Pessoa": ".components",
+    "CursorWatch": ".cursor_watch",
+    "DiarioEmissao": ".diario_emissao",
+    "RegistroEmissao": ".diario_emissao",
+    "EspelhoBoletos": ".espelho_boletos",
+    "AtualizacaoBoleto": ".webhook",
+    "ReceptorWebhook": ".webhook",
+    "ServidorWebhook": ".webhook",
+    "Webhook": ".webhook",
+}
+
+__all__ = list(_EXPORTACOES)
+
+__getattr__, __dir__ = exportacoes_preguicosas(__name__, _EXPORTACOES)
@@ -0,0 +1,202 @@
+import asyncio
+import io
+import json
+import sys
+import typing
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+import loguru
+
+if TYPE_CHECKING:
+    import httpx
+
+    from intersdk.autenticacao import AsyncAutenticacao
+
+from intersdk.misc.arquivo import escrita_atomica
+from intersdk.misc.base64_json import DecodificadorBase64Json
+from intersdk.misc.log import amostrar, conferir_resposta, resumir
+from intersdk.misc.typing import MetodoHttp, MotivoCancelamento
+from intersdk.misc.validators import PathValidator
+
+from .components import Boleto, BoletoRecuperado
+from .serializacao import validar_e_serializar
+from .webhook import Webhook
+
+
+async def _descarregar(pendente: io.BytesIO, destino: BinaryIO) -> None:
+    # o que foi decodificado de um chunk é gravado fora do event loop antes do próximo ser lido
+    if pendente.tell():
+        await asyncio.to_thread(destino.write, pendente.getvalue())
+        pendente.seek(0)
+        pendente.truncate()
+
+
+class AsyncCobranca:
+    def __init__(self, autenticacao: "AsyncAutenticacao") -> None:
+        self.__autenticacao = autenticacao
+        self.__boletos_emitidos: dict = {}
+
+    @property
+    def boletos_emitidos(self) -> dict:
+        return self.__boletos_emitidos
+
+    async def __request_recuperar_boleto(self, nosso_numero: str) -> dict:
+        if amostrar():
+            loguru.logger.info("Recuperando dados do boleto {}", nosso_numero)
+        token = await self.__autenticacao.token(["boleto-cobranca.read"])
+        response = await self.__autenticacao.politica.executar_async(
+            "consulta",
+            lambda: self.__autenticacao.client.get(
+                url=f"{self.__autenticacao.base_url}/cobranca/v2/boletos/{nosso_numero}",
+                headers={"Authorization": token.authorization_header},
+            ),
+            idempotente=True,
+            metricas=self.__autenticacao.metricas,
+        )
+        conferir_resposta(response, response.is_success, "Erro ao recuperar boleto {}", nosso_numero)
+        return response.json()
+
+    async def __request_recuperar_boleto_pdf(self, nosso_numero: str, destino: BinaryIO) -> None:
+        if amostrar():
+            loguru.logger.info("Recuperando PDF do boleto {}", nosso_numero)
+        token = await self.__autenticacao.token(["boleto-cobranca.read"])
+        client = self.__autenticacao.client
+        request = client.build_request(
+            "GET",
+            url=f"{self.__autenticacao.base_url}/cobranca/v2/boletos/{nosso_numero}/pdf",
+            headers={"Authorization": token.authorization_header},
+        )
+        response = await self.__autenticacao.politica.executar_async(
+            "pdf",
+            lambda: client.send(request, stream=True),
+            idempotente=True,
+            metricas=self.__autenticacao.metricas,
+        )
+        try:
+            if not response.is_success:
+                await response.aread()
+                loguru.logger.error("Erro ao recuperar boleto {}: {}", nosso_numero, resumir(response.text))
+                response.raise_for_status()
+            pendente = io.BytesIO()
+            decodificador = DecodificadorBase64Json("pdf", pendente)
+            async for chunk in response.aiter_bytes(chunk_size=64 * 1024):
+                decodificador.feed(chunk)
+                await _descarregar(pendente, destino)
+            decodificador.finalizar()
+            await _descarregar(pendente, destino)
+        finally:
+            await response.aclose()
+        if amostrar():
+            loguru.logger.debug("Resposta da requisição: PDF com {} bytes", decodificador.bytes_escritos)
+
+    async def __request_emitir_boleto(self, seu_numero: str, corpo: bytes) -> dict:
+        if amostrar():
+            loguru.logger.info("Emitindo boleto {}", seu_numero)
+        token = await self.__autenticacao.token(["boleto-cobranca.write"])
+        response = await self.__autenticacao.politica.executar_async(
+            "emissao",
+            lambda: self.__autenticacao.client.post(
+                url=f"{self.__autenticacao.base_url}/cobranca/v2/boletos",
+                headers={"Authorization": token.authorization_header, "Content-Type": "application/json"},
+                content=corpo,
+            ),
+            idempotente=False,
+            metricas=self.__autenticacao.metricas,
+        )
+        conferir_resposta(response, response.is_success, "Erro ao emitir boleto {}", seu_numero)
+        return response.json()
+
+    async def __request_cancelar_boleto(self, nosso_numero: str, motivo: MotivoCancelamento) -> None:
+        if amostrar():
+            loguru.logger.info("cancelando boleto {}", nosso_numero)
+        token = await self.__autenticacao.token(["boleto-cobranca.write"])
+        response = await self.__autenticacao.politica.executar_async(
+            "cancelamento",
+            lambda: self.__autenticacao.client.post(
+                url=f"{self.__autenticacao.base_url}/cobranca/v2/boletos/{nosso_numero}/cancelar",
+                headers={"Authorization": token.authorization_header},
+                json={"motivoCancelamento": motivo},
+            ),
+            idempotente=False,
+            metricas=self.__autenticacao.metricas,
+        )
+        conferir_resposta(response, response.is_success, "Erro ao cancelar boleto {}", nosso_numero)
+
+    async def __request_webhook(self, metodo: MetodoHttp, corpo: bytes | None = None) -> "httpx.Response":
+        token = await self.__autenticacao.token(
+            ["boleto-cobranca.read" if metodo == "GET" else "boleto-cobranca.write"]
+        )
+        headers = {"Content-Type": "application/json"} if corpo is not None else {}
+        return await self.__autenticacao.politica.executar_async(
+            "webhook",
+            lambda: self.__autenticacao.client.request(
+                metodo,
+                url=f"{self.__autenticacao.base_url}/cobranca/v2/boletos/webhook",
+                headers=headers | {"Authorization": token.authorization_header},
+                content=corpo,
+            ),
+            idempotente=True,
+            metricas=self.__autenticacao.metricas,
+        )
+
+    async def registrar_webhook(self, webhook_url: str) -> None:
+        response = await self.__request_webhook("PUT", json.dumps({"webhookUrl": webhook_url}).encode())
+        if not response.is_success:
+            loguru.logger.error("Erro ao registrar webhook: {}", resumir(response.text))
+            response.raise_for_status()
+        if amostrar():
+            loguru.logger.success("Webhook registrado em {}", webhook_url)
+
+    async def consultar_webhook(self) -> Webhook | None:
+        response = await self.__request_webhook("GET")
+        if response.status_code == 404:
+            return None
+        conferir_resposta(response, response.is_success, "Erro ao consultar webhook")
+        return Webhook.from_dict(response.json())
+
+    async def excluir_webhook(self) -> None:
+        response = await self.__request_webhook("DELETE")
+        if not response.is_success:
+            loguru.logger.error("Erro ao excluir webhook: {}", resumir(response.text))
+            response.raise_for_status()
+        if amostrar():
+            loguru.logger.success("Webhook excluído")
+
+    async def recuperar_boleto(self, nosso_numero: str) -> BoletoRecuperado:
+        boleto = BoletoRecuperado(await self.__request_recuperar_boleto(nosso_numero))
+        if amostrar():
+            loguru.logger.success("Boleto {} recuperado com sucesso", nosso_numero)
+        return boleto
+
+    async def recuperar_boleto_pdf(self, nosso_numero: str, file_path: str) -> None:
+        path = Path(file_path)
+        PathValidator(path, must_exist=False, extension=".pdf").validate()
+        # criação, escrita, fsync e renomeação do arquivo temporário rodam fora do event loop
+        escrita = escrita_atomica(path)
+        destino = await asyncio.to_thread(escrita.__enter__)
+        try:
+            await self.__request_recuperar_boleto_pdf(nosso_numero, destino)
+        except BaseException:
+            await asyncio.to_thread(escrita.__exit__, *sys.exc_info())
+            raise
+        await asyncio.to_thread(escrita.__exit__, None, None, None)
+        if amostrar():
+            loguru.logger.success("Boleto {} salvo em {}", nosso_numero, path.absolute())
+
+    async def emitir_boleto(self, boleto: Boleto) -> None:
+        corpo = validar_e_serializar(boleto, self.__autenticacao.metricas)
+        response = await self.__request_emitir_boleto(boleto.seu_numero, corpo)
+        if amostrar():
+            loguru.logger.success("Boleto {} emitido com sucesso", boleto.seu_numero)
+        self.__boletos_emitidos[boleto.seu_numero] = response
+        boleto.set_emissao(self)
+        self.__boletos_emitidos.pop(boleto.seu_numero)
+
+    async def cancelar_boleto(self, nosso_numero: str, motivo: MotivoCancelamento) -> None:
+        motivos_cancelamento = typing.get_args(MotivoCancelamento)
+        if motivo not in motivos_cancelamento:
+            raise ValueError(f"Motivo de cancelamento deve ser um dos seguintes: {motivos_cancelamento}")
+        await self.__request_cancelar_boleto(nosso_numero, motivo)
+        if amostrar():
+            loguru.logger.success("Boleto {} cancelado com sucesso", nosso_numero)
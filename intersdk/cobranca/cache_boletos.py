@@ -0,0 +1,101 @@
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from threading import Lock
+
+from intersdk.misc.typing import TipoSituacao
+
+TTLS_PADRAO: dict[TipoSituacao, float] = {
+    "PAGO": math.inf,
+    "CANCELADO": math.inf,
+    "EXPIRADO": 3600.0,
+    "VENCIDO": 60.0,
+    "EMABERTO": 30.0,
+}
+
+
+class CacheBoletos:
+    def __init__(
+        self,
+        ttls: dict[TipoSituacao, float] | None = None,
+        ttl_padrao: float = 30.0,
+        maxsize: int = 1024,
+        relogio: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize deve ser maior ou igual a 1")
+        self.ttls = TTLS_PADRAO | (ttls or {})
+        self.ttl_padrao = ttl_padrao
+        self.maxsize = maxsize
+        self.__relogio = relogio
+        self.__entradas: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self.__pendentes: dict[str, Future[dict]] = {}
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entradas)
+
+    def get(self, nosso_numero: str) -> dict | None:
+        with self.__lock:
+            entrada = self.__entradas.get(nosso_numero)
+            if entrada is None:
+                return None
+            if entrada[0] <= self.__relogio():
+                del self.__entradas[nosso_numero]
+                return None
+            self.__entradas.move_to_end(nosso_numero)
+            return entrada[1]
+
+    def set(self, nosso_numero: str, data: dict) -> None:
+        with self.__lock:
+            self.__armazenar(nosso_numero, data)
+
+    def __armazenar(self, nosso_numero: str, data: dict) -> None:
+        ttl = self.ttls.get(data.get("situacao"), self.ttl_padrao)  # type: ignore[arg-type]
+        if ttl <= 0:
+            return
+        self.__entradas[nosso_numero] = (self.__relogio() + ttl, data)
+        self.__entradas.move_to_end(nosso_numero)
+        while len(self.__entradas) > self.maxsize:
+            self.__entradas.popitem(last=False)
+
+    def invalidar(self, nosso_numero: str) -> None:
+        with self.__lock:
+            self.__entradas.pop(nosso_numero, None)
+            # uma busca em andamento começou antes da invalidação: seu resultado não deve ser armazenado
+            self.__pendentes.pop(nosso_numero, None)
+
+    def limpar(self) -> None:
+        with self.__lock:
+            self.__entradas.clear()
+            self.__pendentes.clear()
+
+    def obter(self, nosso_numero: str, buscar: Callable[[str], dict]) -> dict:
+        data = self.get(nosso_numero)
+        if data is not None:
+            return data
+        with self.__lock:
+            pendente = self.__pendentes.get(nosso_numero)
+            if pendente is None:
+                pendente = self.__pendentes[nosso_numero] = Future()
+                responsavel = True
+            else:
+                responsavel = False
+        if not responsavel:
+            return pendente.result()
+        try:
+            data = buscar(nosso_numero)
+        except BaseException as error:
+            with self.__lock:
+                if self.__pendentes.get(nosso_numero) is pendente:
+                    del self.__pendentes[nosso_numero]
+            pendente.set_exception(error)
+            raise
+        with self.__lock:
+            if self.__pendentes.get(nosso_numero) is pendente:
+                del self.__pendentes[nosso_numero]
+                self.__armazenar(nosso_numero, data)
+        pendente.set_result(data)
+        return data
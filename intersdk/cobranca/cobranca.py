@@ -1,7 +1,12 @@
-import base64
+import json
 import typing
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from threading import Event, Lock
+from typing import TYPE_CHECKING, BinaryIO
 
 import loguru
 import requests
@@ -9,97 +14,408 @@ import requests
 if TYPE_CHECKING:
     from intersdk.autenticacao import Autenticacao
 
-from intersdk.misc.typing import MotivoCancelamento
-from intersdk.misc.validators import BoletoValidator, PathValidator
+from intersdk.misc.arquivo import escrita_atomica
+from intersdk.misc.base64_json import DecodificadorBase64Json
+from intersdk.misc.log import amostrar, conferir_resposta, resumir
+from intersdk.misc.lote import ResultadoLote, executar_em_lote
+from intersdk.misc.typing import (
+    MetodoHttp,
+    MotivoCancelamento,
+    OrdenarPor,
+    TipoFiltroData,
+    TipoOrdenacao,
+    TipoSituacao,
+    TokenScope,
+)
+from intersdk.misc.validators import PathValidator
 
-from .components import Boleto
+from .cache_boletos import CacheBoletos
+from .components import Boleto, BoletoRecuperado
+from .cursor_watch import CursorWatch, hoje_inter
+from .diario_emissao import DiarioEmissao
+from .espelho_boletos import EspelhoBoletos
+from .serializacao import validar_e_serializar
+from .webhook import Webhook
 
 
 class Cobranca:
-    def __init__(self, autenticacao: "Autenticacao") -> None:
+    def __init__(
+        self,
+        autenticacao: "Autenticacao",
+        cache: CacheBoletos | None = None,
+        diario: DiarioEmissao | None = None,
+        espelho: EspelhoBoletos | None = None,
+    ) -> None:
         self.__autenticacao = autenticacao
+        self.cache = cache
+        self.diario = diario
+        self.espelho = espelho
         self.__boletos_emitidos: dict = {}
+        self.__boletos_emitidos_lock = Lock()
 
     @property
     def boletos_emitidos(self) -> dict:
         return self.__boletos_emitidos
 
-    def __request_recuperar_boleto(self, nosso_numero: str, _type: Literal["DATA", "PDF"] = "DATA") -> dict:
-        url = f"https://cdpj.partners.bancointer.com.br/cobranca/v2/boletos/{nosso_numero}"
-        if _type == "PDF":
-            url += "/pdf"
-            loguru.logger.info(f"Recuperando PDF do boleto {nosso_numero}")
-        else:
-            loguru.logger.info(f"Recuperando dados do boleto {nosso_numero}")
-        response = requests.get(
-            url=url,
-            headers={"Authorization": self.__autenticacao.token(["boleto-cobranca.read"]).authorization_header},
-            cert=(self.__autenticacao.certificate_path, self.__autenticacao.private_key_path),
-            timeout=30,
+    def __request_recuperar_boleto(self, nosso_numero: str) -> dict:
+        if amostrar():
+            loguru.logger.info("Recuperando dados do boleto {}", nosso_numero)
+        response = self.__autenticacao.politica.executar(
+            "consulta",
+            lambda: self.__autenticacao.transporte.requisitar(
+                "GET",
+                f"{self.__autenticacao.base_url}/cobranca/v2/boletos/{nosso_numero}",
+                headers={"Authorization": self.__autenticacao.token(["boleto-cobranca.read"]).authorization_header},
+                timeout=30,
+            ),
+            idempotente=True,
+            metricas=self.__autenticacao.metricas,
         )
-        if not response.ok:
-            loguru.logger.error(f"Erro ao recuperar boleto {nosso_numero}: {response.text}")
-            response.raise_for_status()
-        loguru.logger.debug(f"Resposta da requisição: {response.text}")
+        conferir_resposta(response, response.ok, "Erro ao recuperar boleto {}", nosso_numero)
         return response.json()
 
-    def __request_emitir_boleto(self, boleto: dict) -> dict:
-        loguru.logger.info(f"Emitindo boleto {boleto['seuNumero']}")
-        response = requests.post(
-            url="https://cdpj.partners.bancointer.com.br/cobranca/v2/boletos",
-            headers={"Authorization": self.__autenticacao.token(["boleto-cobranca.write"]).authorization_header},
-            cert=(self.__autenticacao.certificate_path, self.__autenticacao.private_key_path),
-            json=boleto,
-            timeout=30,
+    def __request_recuperar_boleto_pdf(self, nosso_numero: str, destino: BinaryIO) -> None:
+        if amostrar():
+            loguru.logger.info("Recuperando PDF do boleto {}", nosso_numero)
+        with self.__autenticacao.politica.executar(
+            "pdf",
+            lambda: self.__autenticacao.transporte.requisitar(
+                "GET",
+                f"{self.__autenticacao.base_url}/cobranca/v2/boletos/{nosso_numero}/pdf",
+                headers={"Authorization": self.__autenticacao.token(["boleto-cobranca.read"]).authorization_header},
+                timeout=30,
+                stream=True,
+            ),
+            idempotente=True,
+            metricas=self.__autenticacao.metricas,
+        ) as response:
+            if not response.ok:
+                loguru.logger.error("Erro ao recuperar boleto {}: {}", nosso_numero, resumir(response.text))
+                response.raise_for_status()
+            decodificador = DecodificadorBase64Json("pdf", destino)
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                decodificador.feed(chunk)
+            decodificador.finalizar()
+        if amostrar():
+            loguru.logger.debug("Resposta da requisição: PDF com {} bytes", decodificador.bytes_escritos)
+
+    def __request_listar_boletos(self, params: dict) -> dict:
+        if amostrar():
+            loguru.logger.info("Listando boletos: página {}", params["paginaAtual"])
+        response = self.__autenticacao.politica.executar(
+            "listagem",
+            lambda: self.__autenticacao.transporte.requisitar(
+                "GET",
+                f"{self.__autenticacao.base_url}/cobranca/v2/boletos",
+                headers={"Authorization": self.__autenticacao.token(["boleto-cobranca.read"]).authorization_header},
+                params=params,
+                timeout=30,
+            ),
+            idempotente=True,
+            metricas=self.__autenticacao.metricas,
         )
-        if not response.ok:
-            loguru.logger.error(f"Erro ao emitir boleto {boleto['seuNumero']}: {response.text}")
-            response.raise_for_status()
-        loguru.logger.debug(f"Resposta da requisição: {response.text}")
+        conferir_resposta(response, response.ok, "Erro ao listar boletos")
+        return response.json()
+
+    def __request_emitir_boleto(self, seu_numero: str, corpo: bytes) -> dict:
+        if amostrar():
+            loguru.logger.info("Emitindo boleto {}", seu_numero)
+        response = self.__autenticacao.politica.executar(
+            "emissao",
+            lambda: self.__autenticacao.transporte.requisitar(
+                "POST",
+                f"{self.__autenticacao.base_url}/cobranca/v2/boletos",
+                headers={
+                    "Authorization": self.__autenticacao.token(["boleto-cobranca.write"]).authorization_header,
+                    "Content-Type": "application/json",
+                },
+                corpo=corpo,
+                timeout=30,
+            ),
+            idempotente=False,
+            metricas=self.__autenticacao.metricas,
+        )
+        conferir_resposta(response, response.ok, "Erro ao emitir boleto {}", seu_numero)
         return response.json()
 
     def __request_cancelar_boleto(self, nosso_numero: str, motivo: MotivoCancelamento) -> None:
-        loguru.logger.info(f"cancelando boleto {nosso_numero}")
-        response = requests.post(
-            url=f"https://cdpj.partners.bancointer.com.br/cobranca/v2/boletos/{nosso_numero}/cancelar",
-            headers={"Authorization": self.__autenticacao.token(["boleto-cobranca.write"]).authorization_header},
-            cert=(self.__autenticacao.certificate_path, self.__autenticacao.private_key_path),
-            json={"motivoCancelamento": motivo},
-            timeout=30,
+        if amostrar():
+            loguru.logger.info("cancelando boleto {}", nosso_numero)
+        response = self.__autenticacao.politica.executar(
+            "cancelamento",
+            lambda: self.__autenticacao.transporte.requisitar(
+                "POST",
+                f"{self.__autenticacao.base_url}/cobranca/v2/boletos/{nosso_numero}/cancelar",
+                headers={
+                    "Authorization": self.__autenticacao.token(["boleto-cobranca.write"]).authorization_header,
+                    "Content-Type": "application/json",
+                },
+                corpo=json.dumps({"motivoCancelamento": motivo}).encode(),
+                timeout=30,
+            ),
+            idempotente=False,
+            metricas=self.__autenticacao.metricas,
+        )
+        conferir_resposta(response, response.ok, "Erro ao cancelar boleto {}", nosso_numero)
+
+    def __request_webhook(self, metodo: MetodoHttp, corpo: bytes | None = None) -> requests.Response:
+        escopo: TokenScope = "boleto-cobranca.read" if metodo == "GET" else "boleto-cobranca.write"
+        headers = {"Content-Type": "application/json"} if corpo is not None else {}
+        return self.__autenticacao.politica.executar(
+            "webhook",
+            lambda: self.__autenticacao.transporte.requisitar(
+                metodo,
+                f"{self.__autenticacao.base_url}/cobranca/v2/boletos/webhook",
+                headers=headers | {"Authorization": self.__autenticacao.token([escopo]).authorization_header},
+                corpo=corpo,
+                timeout=30,
+            ),
+            # registrar e excluir o webhook são operações idempotentes
+            idempotente=True,
+            metricas=self.__autenticacao.metricas,
         )
+
+    def registrar_webhook(self, webhook_url: str) -> None:
+        response = self.__request_webhook("PUT", json.dumps({"webhookUrl": webhook_url}).encode())
+        if not response.ok:
+            loguru.logger.error("Erro ao registrar webhook: {}", resumir(response.text))
+            response.raise_for_status()
+        if amostrar():
+            loguru.logger.success("Webhook registrado em {}", webhook_url)
+
+    def consultar_webhook(self) -> Webhook | None:
+        response = self.__request_webhook("GET")
+        if response.status_code == 404:
+            return None
+        conferir_resposta(response, response.ok, "Erro ao consultar webhook")
+        return Webhook.from_dict(response.json())
+
+    def excluir_webhook(self) -> None:
+        response = self.__request_webhook("DELETE")
         if not response.ok:
-            loguru.logger.error(f"Erro ao cancelar boleto {nosso_numero}: {response.text}")
+            loguru.logger.error("Erro ao excluir webhook: {}", resumir(response.text))
             response.raise_for_status()
-        loguru.logger.debug(f"Resposta da requisição: {response.text}")
-
-    def recuperar_boleto(self, nosso_numero: str) -> Boleto:
-        response = self.__request_recuperar_boleto(nosso_numero)
-        boleto = Boleto.from_dict(response)
-        self.__boletos_emitidos[boleto.seu_numero] = response
-        boleto.set_emissao(self)
-        boleto.set_atualizacao(self)
-        self.__boletos_emitidos.pop(boleto.seu_numero)
-        loguru.logger.success(f"Boleto {nosso_numero} recuperado com sucesso")
+        if amostrar():
+            loguru.logger.success("Webhook excluído")
+
+    def __buscar_boleto(self, nosso_numero: str) -> dict:
+        data = self.__request_recuperar_boleto(nosso_numero)
+        if self.espelho is not None:
+            self.espelho.salvar(data)
+        return data
+
+    def recuperar_boleto(self, nosso_numero: str) -> BoletoRecuperado:
+        if self.cache is not None:
+            boleto = BoletoRecuperado(self.cache.obter(nosso_numero, self.__buscar_boleto))
+        else:
+            boleto = BoletoRecuperado(self.__buscar_boleto(nosso_numero))
+        if amostrar():
+            loguru.logger.success("Boleto {} recuperado com sucesso", nosso_numero)
         return boleto
 
+    def listar_boletos(  # pylint: disable=too-many-locals
+        self,
+        data_inicial: date,
+        data_final: date,
+        filtrar_data_por: TipoFiltroData = "VENCIMENTO",
+        situacao: TipoSituacao | None = None,
+        nome: str | None = None,
+        email: str | None = None,
+        cpf_cnpj: str | None = None,
+        ordenar_por: OrdenarPor | None = None,
+        tipo_ordenacao: TipoOrdenacao | None = None,
+        itens_por_pagina: int = 100,
+    ) -> Iterator[BoletoRecuperado]:
+        if data_inicial > data_final:
+            raise ValueError("data_inicial deve ser menor ou igual a data_final")
+        if not 1 <= itens_por_pagina <= 1000:
+            raise ValueError("itens_por_pagina deve estar entre 1 e 1000")
+        filtros = {
+            "dataInicial": data_inicial.strftime("%Y-%m-%d"),
+            "dataFinal": data_final.strftime("%Y-%m-%d"),
+            "filtrarDataPor": filtrar_data_por,
+            "situacao": situacao,
+            "nome": nome,
+            "email": email,
+            "cpfCnpj": cpf_cnpj,
+            "ordenarPor": ordenar_por,
+            "tipoOrdenacao": tipo_ordenacao,
+            "itensPorPagina": itens_por_pagina,
+        }
+        filtros = {chave: valor for chave, valor in filtros.items() if valor is not None}
+        numero_pagina = 0
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pagina: Future[dict] | None = executor.submit(
+                self.__request_listar_boletos, filtros | {"paginaAtual": numero_pagina}
+            )
+            try:
+                while pagina is not None:
+                    response = pagina.result()
+                    pagina = None
+                    if response["content"] and not response.get("ultimaPagina", True):
+                        # a próxima página é buscada enquanto a atual é consumida
+                        numero_pagina += 1
+                        pagina = executor.submit(
+                            self.__request_listar_boletos, filtros | {"paginaAtual": numero_pagina}
+                        )
+                    for item in response["content"]:
+                        yield BoletoRecuperado(item)
+            finally:
+                if pagina is not None:
+                    pagina.cancel()
+
+    def watch(
+        self,
+        cursor_path: str | None = None,
+        desde: date | None = None,
+        intervalo: float = 60.0,
+        parar: Event | None = None,
+    ) -> Generator[BoletoRecuperado, None, None]:
+        """Entrega os boletos cuja situação mudou, consultando a listagem filtrada pela data da situação a
+        cada `intervalo` segundos. Com `cursor_path`, o cursor é salvo após cada consulta e uma nova
+        execução continua de onde a anterior parou; a entrega é pelo menos uma vez."""
+        path = Path(cursor_path) if cursor_path is not None else None
+        cursor = CursorWatch.carregar(path, desde) if path is not None else CursorWatch(desde or hoje_inter())
+        parar = parar if parar is not None else Event()
+        while not parar.is_set():
+            hoje = hoje_inter()
+            for boleto in self.listar_boletos(
+                cursor.data, max(hoje, cursor.data), filtrar_data_por="SITUACAO", itens_por_pagina=1000
+            ):
+                if cursor.registrar(boleto):
+                    yield boleto
+            cursor.avancar(hoje)
+            if path is not None:
+                cursor.salvar(path)
+            parar.wait(intervalo)
+
+    def sincronizar_espelho(
+        self, data_inicial: date, data_final: date, filtrar_data_por: TipoFiltroData = "SITUACAO"
+    ) -> int:
+        """Grava no espelho os boletos da listagem do período; com o filtro padrão, os que mudaram de
+        situação nele. Retorna quantos boletos foram gravados."""
+        if self.espelho is None:
+            raise ValueError("Cobranca criada sem espelho de boletos")
+        total = self.espelho.salvar_lote(
+            self.listar_boletos(data_inicial, data_final, filtrar_data_por=filtrar_data_por, itens_por_pagina=1000)
+        )
+        if amostrar():
+            loguru.logger.success("{} boletos sincronizados com o espelho", total)
+        return total
+
     def recuperar_boleto_pdf(self, nosso_numero: str, file_path: str) -> None:
         path = Path(file_path)
         PathValidator(path, must_exist=False, extension=".pdf").validate()
-        response = self.__request_recuperar_boleto(nosso_numero, _type="PDF")
-        path.write_bytes(base64.b64decode(response["pdf"]))
-        loguru.logger.success(f"Boleto {nosso_numero} salvo em {path.absolute()}")
-
-    def emitir_boleto(self, boleto: Boleto) -> None:
-        BoletoValidator(boleto).validate()
-        response = self.__request_emitir_boleto(boleto.to_dict())
-        loguru.logger.success(f"Boleto {boleto.seu_numero} emitido com sucesso")
-        self.__boletos_emitidos[boleto.seu_numero] = response
-        boleto.set_emissao(self)
-        self.__boletos_emitidos.pop(boleto.seu_numero)
+        with escrita_atomica(path) as destino:
+            self.__request_recuperar_boleto_pdf(nosso_numero, destino)
+        if amostrar():
+            loguru.logger.success("Boleto {} salvo em {}", nosso_numero, path.absolute())
+
+    def recuperar_boletos_pdf(
+        self, nossos_numeros: Iterable[str], directory_path: str, max_workers: int | None = None
+    ) -> Iterator[ResultadoLote[str, Path]]:
+        directory = Path(directory_path)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        def recuperar(nosso_numero: str) -> Path:
+            path = directory / f"{nosso_numero}.pdf"
+            self.recuperar_boleto_pdf(nosso_numero, str(path))
+            return path
+
+        max_workers = max_workers or self.__autenticacao.pool_maxsize
+        for resultado in executar_em_lote(recuperar, nossos_numeros, max_workers):
+            if not resultado.ok:
+                loguru.logger.error("Erro ao recuperar PDF do boleto {}: {}", resultado.item, resultado.erro)
+            yield resultado
+
+    def __marcar_emitido(self, boleto: Boleto, response: dict) -> None:
+        with self.__boletos_emitidos_lock:
+            self.__boletos_emitidos[boleto.seu_numero] = response
+            boleto.set_emissao(self)
+            self.__boletos_emitidos.pop(boleto.seu_numero)
+
+    def __conciliar(self, boleto: Boleto) -> dict | None:
+        # uma única consulta: boletos do pagador com o mesmo vencimento
+        for emitido in self.listar_boletos(
+            boleto.data_vencimento, boleto.data_vencimento, cpf_cnpj=boleto.pagador.cpf_cnpj
+        ):
+            if emitido.seu_numero == boleto.seu_numero:
+                return dict(emitido.data)
+        return None
+
+    def __retomar(self, boleto: Boleto, diario: DiarioEmissao) -> bool:
+        registro = diario.estado(boleto.seu_numero)
+        if registro is None or registro.estado == "FALHOU":
+            return False
+        if registro.estado == "CONFIRMADO":
+            response = registro.to_response()
+        else:
+            if amostrar():
+                loguru.logger.info("Conciliando emissão pendente do boleto {}", boleto.seu_numero)
+            conciliado = self.__conciliar(boleto)
+            if conciliado is None:
+                return False
+            diario.registrar_confirmacao(boleto.seu_numero, conciliado)
+            response = conciliado
+        if amostrar():
+            loguru.logger.info("Boleto {} já emitido: {}", boleto.seu_numero, response["nossoNumero"])
+        if self.espelho is not None:
+            self.espelho.registrar_emissao(boleto, response)
+        self.__marcar_emitido(boleto, response)
+        return True
+
+    def emitir_boleto(self, boleto: Boleto, retomar: bool = False) -> None:
+        corpo = validar_e_serializar(boleto, self.__autenticacao.metricas)
+        diario = self.diario
+        if diario is not None and retomar and self.__retomar(boleto, diario):
+            return
+        if diario is not None:
+            diario.registrar_intencao(boleto.seu_numero)
+        try:
+            response = self.__request_emitir_boleto(boleto.seu_numero, corpo)
+        except requests.HTTPError as error:
+            # 4xx: o banco recusou a emissão; demais falhas deixam a emissão pendente para conciliação
+            if diario is not None and error.response is not None and 400 <= error.response.status_code < 500:
+                diario.registrar_falha(boleto.seu_numero, str(error))
+            raise
+        if diario is not None:
+            diario.registrar_confirmacao(boleto.seu_numero, response)
+        if amostrar():
+            loguru.logger.success("Boleto {} emitido com sucesso", boleto.seu_numero)
+        if self.cache is not None:
+            self.cache.invalidar(response["nossoNumero"])
+        if self.espelho is not None:
+            self.espelho.registrar_emissao(boleto, response)
+        self.__marcar_emitido(boleto, response)
+
+    def emitir_boletos(
+        self,
+        boletos: Iterable[Boleto],
+        max_workers: int | None = None,
+        fail_fast: bool = False,
+        retomar: bool = False,
+    ) -> Iterator[ResultadoLote[Boleto, None]]:
+        max_workers = max_workers or self.__autenticacao.pool_maxsize
+        if max_workers > self.__autenticacao.pool_maxsize:
+            loguru.logger.warning(
+                "max_workers ({}) maior que pool_maxsize ({}): conexões excedentes não serão reaproveitadas",
+                max_workers,
+                self.__autenticacao.pool_maxsize,
+            )
+        emitir = partial(self.emitir_boleto, retomar=retomar)
+        for resultado in executar_em_lote(emitir, boletos, max_workers, fail_fast):
+            if not resultado.ok:
+                loguru.logger.error("Erro ao emitir boleto {}: {}", resultado.item.seu_numero, resultado.erro)
+            yield resultado
 
     def cancelar_boleto(self, nosso_numero: str, motivo: MotivoCancelamento) -> None:
         motivos_cancelamento = typing.get_args(MotivoCancelamento)
         if motivo not in motivos_cancelamento:
             raise ValueError(f"Motivo de cancelamento deve ser um dos seguintes: {motivos_cancelamento}")
         self.__request_cancelar_boleto(nosso_numero, motivo)
-        loguru.logger.success(f"Boleto {nosso_numero} cancelado com sucesso")
+        if self.cache is not None:
+            self.cache.invalidar(nosso_numero)
+        if self.espelho is not None:
+            self.espelho.registrar_cancelamento(nosso_numero, motivo)
+        if amostrar():
+            loguru.logger.success("Boleto {} cancelado com sucesso", nosso_numero)
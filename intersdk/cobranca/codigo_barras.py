@@ -0,0 +1,184 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from operator import mul
+
+# fator de vencimento: dias desde 07/10/1997; ao passar de 9999 (21/02/2025) volta a 1000, um ciclo de 9000 dias
+_BASE_VENCIMENTO = date(1997, 10, 7)
+_CICLO_FATOR = 9000
+
+_MASCARA = str.maketrans("", "", " .-")
+# peso 2 do módulo 10: cada dígito é trocado pela soma dos algarismos do seu dobro
+_DOBRO = bytes.maketrans(b"0123456789", b"0246813579")
+# pesos 2 a 9 do módulo 11, da direita para a esquerda, sobre os 43 dígitos sem o DV geral
+_PESOS_MOD11 = tuple(2 + i % 8 for i in range(43))[::-1]
+_DESLOCAMENTO_MOD11 = 48 * sum(_PESOS_MOD11)
+
+
+def _dv_mod10(campo: bytes) -> int:
+    # os bytes são dígitos ASCII: o deslocamento de 48 por dígito é descontado uma única vez
+    soma = sum(campo[-1::-2].translate(_DOBRO)) + sum(campo[-2::-2]) - 48 * len(campo)
+    return -soma % 10
+
+
+def _dv_mod11(codigo: bytes) -> int:
+    digito = 11 - (sum(map(mul, codigo, _PESOS_MOD11)) - _DESLOCAMENTO_MOD11) % 11
+    return 1 if digito > 9 else digito
+
+
+def _codigo_valido(codigo: bytes) -> bool:
+    return codigo[4] - 48 == _dv_mod11(codigo[:4] + codigo[5:])
+
+
+def _linha_para_codigo(linha: bytes) -> bytes | None:
+    if (
+        _dv_mod10(linha[0:9]) != linha[9] - 48
+        or _dv_mod10(linha[10:20]) != linha[20] - 48
+        or _dv_mod10(linha[21:31]) != linha[31] - 48
+    ):
+        return None
+    codigo = linha[0:4] + linha[32:47] + linha[4:9] + linha[10:20] + linha[21:31]
+    return codigo if _codigo_valido(codigo) else None
+
+
+def _normalizar(texto: str, tamanho: int) -> bytes | None:
+    texto = texto.translate(_MASCARA)
+    if len(texto) != tamanho or not texto.isascii() or not texto.isdigit():
+        return None
+    return texto.encode("ascii")
+
+
+def _com_dv(campo: bytes) -> bytes:
+    return campo + bytes((48 + _dv_mod10(campo),))
+
+
+@dataclass(slots=True, frozen=True)
+class CodigoBarras:
+    """Código de barras de boleto no padrão FEBRABAN (44 dígitos), validado na construção; converte de e
+    para a linha digitável (47 dígitos) sem acessar a API."""
+
+    codigo: str
+
+    def __post_init__(self) -> None:
+        codigo = _normalizar(self.codigo, 44)
+        if codigo is None:
+            raise ValueError("código de barras deve ter 44 dígitos")
+        if not _codigo_valido(codigo):
+            raise ValueError("dígito verificador do código de barras inválido")
+        object.__setattr__(self, "codigo", codigo.decode("ascii"))
+
+    @classmethod
+    def from_linha_digitavel(cls, linha_digitavel: str) -> "CodigoBarras":
+        linha = _normalizar(linha_digitavel, 47)
+        if linha is None:
+            raise ValueError("linha digitável deve ter 47 dígitos")
+        codigo = _linha_para_codigo(linha)
+        if codigo is None:
+            raise ValueError("dígito verificador da linha digitável inválido")
+        return cls(codigo.decode("ascii"))
+
+    @classmethod
+    def gerar(
+        cls, vencimento: date | None, valor: int | float, campo_livre: str, banco: str = "077", moeda: str = "9"
+    ) -> "CodigoBarras":
+        centavos = round(valor * 100)
+        if not 0 <= centavos < 10**10:
+            raise ValueError("valor deve estar entre 0 e 99999999.99")
+        if len(campo_livre) != 25 or len(banco) != 3 or len(moeda) != 1:
+            raise ValueError("campo livre, banco e moeda devem ter 25, 3 e 1 dígitos")
+        fator = 0 if vencimento is None else ((vencimento - _BASE_VENCIMENTO).days - 1000) % _CICLO_FATOR + 1000
+        sem_dv = f"{banco}{moeda}{fator:04d}{centavos:010d}{campo_livre}".encode("ascii")
+        return cls(f"{sem_dv[:4].decode()}{_dv_mod11(sem_dv)}{sem_dv[4:].decode()}")
+
+    @property
+    def banco(self) -> str:
+        return self.codigo[0:3]
+
+    @property
+    def moeda(self) -> str:
+        return self.codigo[3]
+
+    @property
+    def fator_vencimento(self) -> int:
+        return int(self.codigo[5:9])
+
+    @property
+    def valor(self) -> float:
+        return int(self.codigo[9:19]) / 100
+
+    @property
+    def campo_livre(self) -> str:
+        return self.codigo[19:44]
+
+    @property
+    def linha_digitavel(self) -> str:
+        codigo = self.codigo.encode("ascii")
+        return (
+            _com_dv(codigo[0:4] + codigo[19:24]) + _com_dv(codigo[24:34]) + _com_dv(codigo[34:44]) + codigo[4:19]
+        ).decode("ascii")
+
+    def vencimento(self, referencia: date | None = None) -> date | None:
+        """O mesmo fator corresponde a uma data a cada 9000 dias: vale a mais próxima de `referencia`
+        (hoje, por padrão). Fator zero indica boleto sem vencimento."""
+        fator = self.fator_vencimento
+        if fator == 0:
+            return None
+        primeira = _BASE_VENCIMENTO + timedelta(days=fator)
+        ciclos = round(((referencia or date.today()) - primeira).days / _CICLO_FATOR)
+        return primeira + timedelta(days=max(ciclos, 0) * _CICLO_FATOR)
+
+
+def codigo_barras_valido(codigo_barras: str) -> bool:
+    codigo = _normalizar(codigo_barras, 44)
+    return codigo is not None and _codigo_valido(codigo)
+
+
+def linha_digitavel_valida(linha_digitavel: str) -> bool:
+    linha = _normalizar(linha_digitavel, 47)
+    return linha is not None and _linha_para_codigo(linha) is not None
+
+
+def validar_linhas_digitaveis(linhas_digitaveis: Iterable[str]) -> list[bool]:
+    """Equivale a `linha_digitavel_valida` em cada linha, com o cálculo dos dígitos verificadores feito no
+    próprio laço: sem chamadas de função por linha e com a máscara removida apenas quando existe."""
+    dobro, pesos, deslocamento, mascara = _DOBRO, _PESOS_MOD11, _DESLOCAMENTO_MOD11, _MASCARA
+    resultado: list[bool] = []
+    adicionar = resultado.append
+    for texto in linhas_digitaveis:
+        if len(texto) != 47 or not texto.isascii() or not texto.isdigit():
+            texto = texto.translate(mascara)
+            if len(texto) != 47 or not texto.isascii() or not texto.isdigit():
+                adicionar(False)
+                continue
+        linha = texto.encode("ascii")
+        campo1, campo2, campo3 = linha[0:9], linha[10:20], linha[21:31]
+        # campo mais DV somam um múltiplo de 10; 480 e 528 descontam o deslocamento ASCII de 10 e 11 dígitos
+        if (
+            (sum(campo1[-1::-2].translate(dobro)) + sum(campo1[-2::-2]) + linha[9] - 480) % 10
+            or (sum(campo2[-1::-2].translate(dobro)) + sum(campo2[-2::-2]) + linha[20] - 528) % 10
+            or (sum(campo3[-1::-2].translate(dobro)) + sum(campo3[-2::-2]) + linha[31] - 528) % 10
+        ):
+            adicionar(False)
+            continue
+        digito = (
+            11 - (sum(map(mul, linha[0:4] + linha[33:47] + campo1[4:] + campo2 + campo3, pesos)) - deslocamento) % 11
+        )
+        adicionar((1 if digito > 9 else digito) == linha[32] - 48)
+    return resultado
+
+
+def analisar_linhas_digitaveis(linhas_digitaveis: Iterable[str]) -> list[CodigoBarras | None]:
+    """Converte cada linha digitável no seu código de barras; as inválidas viram None, sem exceções."""
+    normalizar, converter = _normalizar, _linha_para_codigo
+    resultado: list[CodigoBarras | None] = []
+    for texto in linhas_digitaveis:
+        linha = normalizar(texto, 47)
+        codigo = converter(linha) if linha is not None else None
+        if codigo is None:
+            resultado.append(None)
+            continue
+        # a linha já foi validada: o código é criado sem repetir a validação de __post_init__
+        codigo_barras = object.__new__(CodigoBarras)
+        object.__setattr__(codigo_barras, "codigo", codigo.decode("ascii"))
+        resultado.append(codigo_barras)
+    return resultado
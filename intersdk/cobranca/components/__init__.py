@@ -1,4 +1,7 @@
 from .boleto import Boleto  # noqa F401
+from .boleto_base import BoletoBase  # noqa F401
+from .boleto_batch import BoletoBatch  # noqa F401
+from .boleto_recuperado import BoletoRecuperado  # noqa F401
 from .componente_financeiro import ComponenteFinanceiro  # noqa F401
 from .endereco import Endereco  # noqa F401
 from .pessoa import Pessoa  # noqa F401
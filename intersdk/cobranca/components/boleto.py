@@ -2,7 +2,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
-    from intersdk.cobranca import Cobranca
+    from intersdk.cobranca import AsyncCobranca, Cobranca
 
 from intersdk.misc.exceptions import (
     BoletoJaEmitido,
@@ -11,11 +11,39 @@ from intersdk.misc.exceptions import (
 )
 from intersdk.misc.typing import MotivoCancelamento, TipoSituacao
 
+from .boleto_base import BoletoBase
 from .componente_financeiro import ComponenteFinanceiro
 from .pessoa import Pessoa
 
 
-class Boleto:
+class Boleto(BoletoBase):
+    __slots__ = (
+        "__emitido",
+        "__atualizado",
+        "__seu_numero",
+        "__valor_nominal",
+        "__data_vencimento",
+        "__num_dias_agenda",
+        "__pagador",
+        "__beneficiario_final",
+        "__mensagem",
+        "__descontos",
+        "__multa",
+        "__mora",
+        "__nosso_numero",
+        "__codigo_barras",
+        "__linha_digitavel",
+        "__data_emissao",
+        "__data_hora_atualizacao",
+        "__situacao",
+        "__data_situacao",
+        "__origem",
+        "__conta_corrente",
+        "__codigo_especie",
+        "__valor_total_recebimento",
+        "__motivo_cancelamento",
+    )
+
     def __init__(
         self,
         seu_numero: str,
@@ -238,14 +266,14 @@ class Boleto:
             raise BoletoNaoAtualizado
         return self.__motivo_cancelamento
 
-    def set_emissao(self, cobranca: "Cobranca") -> None:
+    def set_emissao(self, cobranca: "Cobranca | AsyncCobranca") -> None:
         data = cobranca.boletos_emitidos[self.__seu_numero]
         self.__nosso_numero = data["nossoNumero"]
         self.__codigo_barras = data["codigoBarras"]
         self.__linha_digitavel = data["linhaDigitavel"]
         self.__emitido = True
 
-    def set_atualizacao(self, cobranca: "Cobranca") -> None:
+    def set_atualizacao(self, cobranca: "Cobranca | AsyncCobranca") -> None:
         data = cobranca.boletos_emitidos[self.__seu_numero]
         data_hora_situacao = datetime.fromisoformat(data["dataHoraSituacao"]) + timedelta(hours=3)
         self.__data_emissao = date.fromisoformat(data["dataEmissao"])
@@ -259,37 +287,6 @@ class Boleto:
         self.__data_hora_atualizacao = datetime.now(timezone.utc).replace(tzinfo=None)
         self.__atualizado = True
 
-    def to_dict(self) -> dict[str, str | float | int | dict | None]:
-        mensagem = (
-            {f"linha{i + 1}": self.__mensagem[i] if i < len(self.__mensagem) else None for i in range(5)}
-            if self.__mensagem is not None
-            else None
-        )
-        multa = self.__multa.to_dict("MULTA") if self.__multa is not None else ComponenteFinanceiro.empty_dict("MULTA")
-        mora = self.__mora.to_dict("MORA") if self.__mora is not None else ComponenteFinanceiro.empty_dict("MORA")
-        descontos = {f"desconto{i + 1}": ComponenteFinanceiro.empty_dict("DESCONTO") for i in range(3)}
-        if self.__descontos is not None:
-            descontos = {
-                f"desconto{i + 1}": self.__descontos[i].to_dict("DESCONTO")
-                if i < len(self.__descontos)
-                else ComponenteFinanceiro.empty_dict("DESCONTO")
-                for i in range(3)
-            }
-        return {
-            "seuNumero": self.__seu_numero,
-            "valorNominal": self.__valor_nominal,
-            "dataVencimento": self.__data_vencimento.strftime("%Y-%m-%d"),
-            "numDiasAgenda": self.__num_dias_agenda,
-            "pagador": self.__pagador.to_dict(),
-            "mensagem": mensagem,
-            "desconto1": None,
-            "desconto2": None,
-            "desconto3": None,
-            "multa": multa,
-            "mora": mora,
-            "beneficiarioFinal": self.__beneficiario_final.to_dict() if self.__beneficiario_final else None,
-        } | descontos
-
     @classmethod
     def from_dict(cls, data: dict) -> "Boleto":
         descontos = [
@@ -0,0 +1,171 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Sequence
+
+from intersdk.misc.typing import MotivoCancelamento, TipoSituacao
+
+from .componente_financeiro import ComponenteFinanceiro
+from .pessoa import Pessoa
+
+
+class BoletoBase(ABC):
+    """Leitura comum a `Boleto`, montado localmente, e `BoletoRecuperado`, lido da API; sem estado próprio,
+    cada subclasse declara apenas os slots que usa."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def emitido(self) -> bool:
+        ...
+
+    @property
+    @abstractmethod
+    def atualizado(self) -> bool:
+        ...
+
+    @property
+    @abstractmethod
+    def seu_numero(self) -> str:
+        ...
+
+    @property
+    @abstractmethod
+    def valor_nominal(self) -> int | float:
+        ...
+
+    @property
+    @abstractmethod
+    def data_vencimento(self) -> date:
+        ...
+
+    @property
+    @abstractmethod
+    def num_dias_agenda(self) -> int:
+        ...
+
+    @property
+    @abstractmethod
+    def pagador(self) -> Pessoa:
+        ...
+
+    @property
+    @abstractmethod
+    def beneficiario_final(self) -> Pessoa | None:
+        ...
+
+    @property
+    @abstractmethod
+    def mensagem(self) -> Sequence[str] | None:
+        ...
+
+    @property
+    @abstractmethod
+    def descontos(self) -> Sequence[ComponenteFinanceiro] | None:
+        ...
+
+    @property
+    @abstractmethod
+    def multa(self) -> ComponenteFinanceiro | None:
+        ...
+
+    @property
+    @abstractmethod
+    def mora(self) -> ComponenteFinanceiro | None:
+        ...
+
+    @property
+    @abstractmethod
+    def data_limite(self) -> date:
+        ...
+
+    @property
+    @abstractmethod
+    def nosso_numero(self) -> str:
+        ...
+
+    @property
+    @abstractmethod
+    def codigo_barras(self) -> str:
+        ...
+
+    @property
+    @abstractmethod
+    def linha_digitavel(self) -> str:
+        ...
+
+    @property
+    @abstractmethod
+    def data_emissao(self) -> date:
+        ...
+
+    @property
+    @abstractmethod
+    def data_hora_atualizacao(self) -> datetime:
+        ...
+
+    @property
+    @abstractmethod
+    def situacao(self) -> TipoSituacao:
+        ...
+
+    @property
+    @abstractmethod
+    def data_situacao(self) -> date:
+        ...
+
+    @property
+    @abstractmethod
+    def origem(self) -> str:
+        ...
+
+    @property
+    @abstractmethod
+    def conta_corrente(self) -> str:
+        ...
+
+    @property
+    @abstractmethod
+    def codigo_especie(self) -> str:
+        ...
+
+    @property
+    @abstractmethod
+    def valor_total_recebimento(self) -> int | float | None:
+        ...
+
+    @property
+    @abstractmethod
+    def motivo_cancelamento(self) -> MotivoCancelamento | None:
+        ...
+
+    def to_dict(self) -> dict[str, str | float | int | dict | None]:
+        mensagem = (
+            {f"linha{i + 1}": self.mensagem[i] if i < len(self.mensagem) else None for i in range(5)}
+            if self.mensagem is not None
+            else None
+        )
+        multa = self.multa.to_dict("MULTA") if self.multa is not None else ComponenteFinanceiro.empty_dict("MULTA")
+        mora = self.mora.to_dict("MORA") if self.mora is not None else ComponenteFinanceiro.empty_dict("MORA")
+        descontos = {f"desconto{i + 1}": ComponenteFinanceiro.empty_dict("DESCONTO") for i in range(3)}
+        if self.descontos is not None:
+            descontos = {
+                f"desconto{i + 1}": self.descontos[i].to_dict("DESCONTO")
+                if i < len(self.descontos)
+                else ComponenteFinanceiro.empty_dict("DESCONTO")
+                for i in range(3)
+            }
+        return {
+            "seuNumero": self.seu_numero,
+            "valorNominal": self.valor_nominal,
+            "dataVencimento": self.data_vencimento.strftime("%Y-%m-%d"),
+            "numDiasAgenda": self.num_dias_agenda,
+            "pagador": self.pagador.to_dict(),
+            "mensagem": mensagem,
+            "desconto1": None,
+            "desconto2": None,
+            "desconto3": None,
+            "multa": multa,
+            "mora": mora,
+            "beneficiarioFinal": self.beneficiario_final.to_dict() if self.beneficiario_final else None,
+        } | descontos
@@ -0,0 +1,92 @@
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field, fields
+from datetime import date
+
+from .boleto import Boleto
+from .componente_financeiro import ComponenteFinanceiro
+from .pessoa import Pessoa
+
+
+@dataclass(slots=True)
+class BoletoBatch:
+    seu_numero: list[str] = field(default_factory=list)
+    valor_nominal: list[int | float] = field(default_factory=list)
+    data_vencimento: list[date] = field(default_factory=list)
+    num_dias_agenda: list[int] = field(default_factory=list)
+    pagador: list[Pessoa] = field(default_factory=list)
+    beneficiario_final: list[Pessoa | None] = field(default_factory=list)
+    mensagem: list[Sequence[str] | None] = field(default_factory=list)
+    descontos: list[Sequence[ComponenteFinanceiro] | None] = field(default_factory=list)
+    multa: list[ComponenteFinanceiro | None] = field(default_factory=list)
+    mora: list[ComponenteFinanceiro | None] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        tamanho = len(self.seu_numero)
+        for nome in ("beneficiario_final", "mensagem", "descontos", "multa", "mora"):
+            if not getattr(self, nome):
+                setattr(self, nome, [None] * tamanho)
+        for coluna in fields(self):
+            if len(getattr(self, coluna.name)) != tamanho:
+                raise ValueError(f"a coluna {coluna.name} deve ter {tamanho} linhas")
+
+    def __len__(self) -> int:
+        return len(self.seu_numero)
+
+    def append(
+        self,
+        seu_numero: str,
+        valor_nominal: int | float,
+        data_vencimento: date,
+        num_dias_agenda: int,
+        pagador: Pessoa,
+        beneficiario_final: Pessoa | None = None,
+        mensagem: Sequence[str] | None = None,
+        descontos: Sequence[ComponenteFinanceiro] | None = None,
+        multa: ComponenteFinanceiro | None = None,
+        mora: ComponenteFinanceiro | None = None,
+    ) -> None:
+        self.seu_numero.append(seu_numero)
+        self.valor_nominal.append(valor_nominal)
+        self.data_vencimento.append(data_vencimento)
+        self.num_dias_agenda.append(num_dias_agenda)
+        self.pagador.append(pagador)
+        self.beneficiario_final.append(beneficiario_final)
+        self.mensagem.append(mensagem)
+        self.descontos.append(descontos)
+        self.multa.append(multa)
+        self.mora.append(mora)
+
+    def boleto(self, linha: int) -> Boleto:
+        return Boleto(
+            seu_numero=self.seu_numero[linha],
+            valor_nominal=self.valor_nominal[linha],
+            data_vencimento=self.data_vencimento[linha],
+            num_dias_agenda=self.num_dias_agenda[linha],
+            pagador=self.pagador[linha],
+            beneficiario_final=self.beneficiario_final[linha],
+            mensagem=self.mensagem[linha],
+            descontos=self.descontos[linha],
+            multa=self.multa[linha],
+            mora=self.mora[linha],
+        )
+
+    def boletos(self) -> Iterator[Boleto]:
+        return (self.boleto(linha) for linha in range(len(self)))
+
+    @classmethod
+    def from_boletos(cls, boletos: Iterable[Boleto]) -> "BoletoBatch":
+        batch = cls()
+        for boleto in boletos:
+            batch.append(
+                seu_numero=boleto.seu_numero,
+                valor_nominal=boleto.valor_nominal,
+                data_vencimento=boleto.data_vencimento,
+                num_dias_agenda=boleto.num_dias_agenda,
+                pagador=boleto.pagador,
+                beneficiario_final=boleto.beneficiario_final,
+                mensagem=boleto.mensagem,
+                descontos=boleto.descontos,
+                multa=boleto.multa,
+                mora=boleto.mora,
+            )
+        return batch
@@ -0,0 +1,214 @@
+import time
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+if TYPE_CHECKING:
+    from intersdk.cobranca import AsyncCobranca, Cobranca
+
+from intersdk.misc.exceptions import BoletoJaEmitido, BoletoNaoEmitido
+from intersdk.misc.typing import MotivoCancelamento, TipoSituacao
+
+from .boleto_base import BoletoBase
+from .componente_financeiro import ComponenteFinanceiro
+from .pessoa import Pessoa
+
+
+def _descontos(data: dict) -> list[ComponenteFinanceiro] | None:
+    descontos = (ComponenteFinanceiro.from_dict(data[desconto]) for desconto in ("desconto1", "desconto2", "desconto3"))
+    return [componente for componente in descontos if componente is not None] or None
+
+
+_CONVERSORES: dict[str, Callable[[dict], Any]] = {
+    "data_vencimento": lambda data: date.fromisoformat(data["dataVencimento"]),
+    "data_limite": lambda data: date.fromisoformat(data["dataLimite"]),
+    "pagador": lambda data: Pessoa.from_dict(data["pagador"]),
+    "beneficiario_final": lambda data: (
+        Pessoa.from_dict(data["beneficiarioFinal"]) if data.get("beneficiarioFinal") else None
+    ),
+    "mensagem": lambda data: [linha for linha in data["mensagem"].values() if linha] or None,
+    "descontos": _descontos,
+    "multa": lambda data: ComponenteFinanceiro.from_dict(data["multa"]),
+    "mora": lambda data: ComponenteFinanceiro.from_dict(data["mora"]),
+    "data_emissao": lambda data: date.fromisoformat(data["dataEmissao"]),
+    "data_situacao": lambda data: (datetime.fromisoformat(data["dataHoraSituacao"]) + timedelta(hours=3)).date(),
+}
+
+
+class BoletoRecuperado(BoletoBase):
+    """Visão somente leitura sobre a resposta da API: objetos aninhados e datas são
+    convertidos apenas no primeiro acesso."""
+
+    __slots__ = ("__data", "__cache", "__atualizado_em")
+
+    def __init__(self, data: dict) -> None:
+        self.__data = data
+        self.__cache: dict[str, Any] = {}
+        self.__atualizado_em = time.time()
+
+    def __lazy(self, nome: str) -> Any:
+        try:
+            return self.__cache[nome]
+        except KeyError:
+            valor = self.__cache[nome] = _CONVERSORES[nome](self.__data)
+            return valor
+
+    @property
+    def data(self) -> Mapping[str, Any]:
+        # a resposta pode estar compartilhada com o cache de boletos
+        return MappingProxyType(self.__data)
+
+    @property
+    def emitido(self) -> bool:
+        return True
+
+    @property
+    def atualizado(self) -> bool:
+        return True
+
+    @property
+    def seu_numero(self) -> str:
+        return self.__data["seuNumero"]
+
+    @seu_numero.setter
+    def seu_numero(self, seu_numero: str) -> None:
+        raise BoletoJaEmitido
+
+    @property
+    def valor_nominal(self) -> int | float:
+        return self.__data["valorNominal"]
+
+    @valor_nominal.setter
+    def valor_nominal(self, valor_nominal: int | float) -> None:
+        raise BoletoJaEmitido
+
+    @property
+    def data_vencimento(self) -> date:
+        return self.__lazy("data_vencimento")
+
+    @data_vencimento.setter
+    def data_vencimento(self, data_vencimento: date) -> None:
+        raise BoletoJaEmitido
+
+    @property
+    def num_dias_agenda(self) -> int:
+        return (self.data_limite - self.data_vencimento).days
+
+    @num_dias_agenda.setter
+    def num_dias_agenda(self, num_dias_agenda: int) -> None:
+        raise BoletoJaEmitido
+
+    @property
+    def data_limite(self) -> date:
+        return self.__lazy("data_limite")
+
+    @property
+    def pagador(self) -> Pessoa:
+        return self.__lazy("pagador")
+
+    @pagador.setter
+    def pagador(self, pagador: Pessoa) -> None:
+        raise BoletoJaEmitido
+
+    @property
+    def beneficiario_final(self) -> Pessoa | None:
+        return self.__lazy("beneficiario_final")
+
+    @beneficiario_final.setter
+    def beneficiario_final(self, beneficiario_final: Pessoa | None) -> None:
+        raise BoletoJaEmitido
+
+    @property
+    def mensagem(self) -> Sequence[str] | None:
+        return self.__lazy("mensagem")
+
+    @mensagem.setter
+    def mensagem(self, mensagem: Sequence[str] | None) -> None:
+        raise BoletoJaEmitido
+
+    @property
+    def descontos(self) -> Sequence[ComponenteFinanceiro] | None:
+        return self.__lazy("descontos")
+
+    @descontos.setter
+    def descontos(self, descontos: Sequence[ComponenteFinanceiro] | None) -> None:
+        raise BoletoJaEmitido
+
+    @property
+    def multa(self) -> ComponenteFinanceiro | None:
+        return self.__lazy("multa")
+
+    @multa.setter
+    def multa(self, multa: ComponenteFinanceiro | None) -> None:
+        raise BoletoJaEmitido
+
+    @property
+    def mora(self) -> ComponenteFinanceiro | None:
+        return self.__lazy("mora")
+
+    @mora.setter
+    def mora(self, mora: ComponenteFinanceiro | None) -> None:
+        raise BoletoJaEmitido
+
+    @property
+    def nosso_numero(self) -> str:
+        if not self.__data.get("nossoNumero"):
+            raise BoletoNaoEmitido
+        return self.__data["nossoNumero"]
+
+    @property
+    def codigo_barras(self) -> str:
+        if not self.__data.get("codigoBarras"):
+            raise BoletoNaoEmitido
+        return self.__data["codigoBarras"]
+
+    @property
+    def linha_digitavel(self) -> str:
+        if not self.__data.get("linhaDigitavel"):
+            raise BoletoNaoEmitido
+        return self.__data["linhaDigitavel"]
+
+    @property
+    def data_emissao(self) -> date:
+        return self.__lazy("data_emissao")
+
+    @property
+    def data_hora_atualizacao(self) -> datetime:
+        return datetime.fromtimestamp(self.__atualizado_em, timezone.utc).replace(tzinfo=None)
+
+    @property
+    def situacao(self) -> TipoSituacao:
+        return self.__data["situacao"]
+
+    @property
+    def data_situacao(self) -> date:
+        return self.__lazy("data_situacao")
+
+    @property
+    def origem(self) -> str:
+        return self.__data["origem"]
+
+    @property
+    def conta_corrente(self) -> str:
+        return self.__data["contaCorrente"]
+
+    @property
+    def codigo_especie(self) -> str:
+        return self.__data["codigoEspecie"]
+
+    @property
+    def valor_total_recebimento(self) -> int | float | None:
+        return self.__data.get("valorTotalRecebimento") or None
+
+    @property
+    def motivo_cancelamento(self) -> MotivoCancelamento | None:
+        return self.__data.get("motivoCancelamento") or None
+
+    def set_emissao(self, cobranca: "Cobranca | AsyncCobranca") -> None:
+        self.__data = self.__data | cobranca.boletos_emitidos[self.seu_numero]
+
+    def set_atualizacao(self, cobranca: "Cobranca | AsyncCobranca") -> None:
+        self.__data = cobranca.boletos_emitidos[self.seu_numero]
+        self.__cache = {}
+        self.__atualizado_em = time.time()
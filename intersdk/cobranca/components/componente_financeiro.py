@@ -3,7 +3,7 @@ from datetime import date
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponenteFinanceiro:
     tipo: Literal["TAXA", "VALOR"]
     data: date
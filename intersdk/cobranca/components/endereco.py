@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from intersdk.misc.typing import Uf
 
 
-@dataclass
+@dataclass(slots=True)
 class Endereco:
     logradouro: str
     numero: str | None
@@ -4,7 +4,7 @@ from typing import Literal
 from .endereco import Endereco
 
 
-@dataclass
+@dataclass(slots=True)
 class Pessoa:
     tipo: Literal["FISICA", "JURIDICA"]
     cpf_cnpj: str
@@ -0,0 +1,63 @@
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from intersdk.misc.arquivo import escrita_atomica
+
+from .components import BoletoRecuperado
+
+# o filtro por data da listagem usa o horário de Brasília
+FUSO_INTER = timezone(timedelta(hours=-3))
+
+
+def hoje_inter() -> date:
+    return datetime.now(FUSO_INTER).date()
+
+
+@dataclass(slots=True)
+class CursorWatch:
+    """Posição de `Cobranca.watch`: a listagem recomeça em `data` e `vistos` guarda a última situação
+    entregue dos boletos alterados a partir dela, o que evita entregá-los de novo."""
+
+    data: date
+    vistos: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+    def registrar(self, boleto: BoletoRecuperado) -> bool:
+        """Retorna se a situação do boleto mudou desde a última entrega."""
+        visto = self.vistos.get(boleto.nosso_numero)
+        if visto is not None and visto[0] == boleto.situacao:
+            return False
+        # sem dataHoraSituacao, vale o início da listagem em que o boleto apareceu
+        dia = boleto.data_situacao if boleto.data.get("dataHoraSituacao") else self.data
+        self.vistos[boleto.nosso_numero] = (boleto.situacao, dia.isoformat())
+        return True
+
+    def avancar(self, data: date) -> None:
+        if data <= self.data:
+            return
+        self.data = data
+        inicio = data.isoformat()
+        self.vistos = {chave: visto for chave, visto in self.vistos.items() if visto[1] >= inicio}
+
+    def to_dict(self) -> dict:
+        return {"data": self.data.isoformat(), "vistos": self.vistos}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CursorWatch":
+        return cls(
+            data=date.fromisoformat(data["data"]),
+            vistos={chave: (situacao, dia) for chave, (situacao, dia) in data["vistos"].items()},
+        )
+
+    @classmethod
+    def carregar(cls, path: Path, desde: date | None = None) -> "CursorWatch":
+        try:
+            return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return cls(desde or hoje_inter())
+
+    def salvar(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with escrita_atomica(path) as file:
+            file.write(json.dumps(self.to_dict()).encode("utf-8"))
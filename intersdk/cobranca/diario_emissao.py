@@ -0,0 +1,98 @@
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from intersdk.misc.banco_sqlite import BancoSqlite
+from intersdk.misc.typing import EstadoEmissao
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS registros (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    seu_numero TEXT NOT NULL,
+    estado TEXT NOT NULL,
+    nosso_numero TEXT,
+    codigo_barras TEXT,
+    linha_digitavel TEXT,
+    erro TEXT,
+    registrado_em REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS registros_seu_numero ON registros (seu_numero, id);
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class RegistroEmissao:
+    seu_numero: str
+    estado: EstadoEmissao
+    nosso_numero: str | None = None
+    codigo_barras: str | None = None
+    linha_digitavel: str | None = None
+    erro: str | None = None
+
+    def to_response(self) -> dict:
+        return {
+            "nossoNumero": self.nosso_numero,
+            "codigoBarras": self.codigo_barras,
+            "linhaDigitavel": self.linha_digitavel,
+        }
+
+
+class DiarioEmissao(BancoSqlite):
+    """Diário append-only das emissões: a intenção é gravada antes do POST e o resultado depois, de modo
+    que, após uma queda, toda emissão sem resultado (PENDENTE) é conhecida e pode ser conciliada."""
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        # cada registro é persistido em disco antes de a chamada retornar
+        super().__init__(self.path, _ESQUEMA, "FULL")
+
+    def __registrar(self, registro: RegistroEmissao) -> None:
+        with self._lock:
+            self._conexao.execute(
+                "INSERT INTO registros (seu_numero, estado, nosso_numero, codigo_barras, linha_digitavel, erro, "
+                "registrado_em) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    registro.seu_numero,
+                    registro.estado,
+                    registro.nosso_numero,
+                    registro.codigo_barras,
+                    registro.linha_digitavel,
+                    registro.erro,
+                    time.time(),
+                ),
+            )
+
+    def registrar_intencao(self, seu_numero: str) -> None:
+        self.__registrar(RegistroEmissao(seu_numero, "PENDENTE"))
+
+    def registrar_confirmacao(self, seu_numero: str, response: dict) -> None:
+        self.__registrar(
+            RegistroEmissao(
+                seu_numero,
+                "CONFIRMADO",
+                nosso_numero=response["nossoNumero"],
+                codigo_barras=response.get("codigoBarras"),
+                linha_digitavel=response.get("linhaDigitavel"),
+            )
+        )
+
+    def registrar_falha(self, seu_numero: str, erro: str) -> None:
+        self.__registrar(RegistroEmissao(seu_numero, "FALHOU", erro=erro))
+
+    def estado(self, seu_numero: str) -> RegistroEmissao | None:
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT seu_numero, estado, nosso_numero, codigo_barras, linha_digitavel, erro FROM registros "
+                "WHERE seu_numero = ? ORDER BY id DESC LIMIT 1",
+                (seu_numero,),
+            ).fetchone()
+        return RegistroEmissao(*linha) if linha is not None else None
+
+    def registros(self, estado: EstadoEmissao | None = None) -> list[RegistroEmissao]:
+        with self._lock:
+            linhas = self._conexao.execute(
+                "SELECT r.seu_numero, r.estado, r.nosso_numero, r.codigo_barras, r.linha_digitavel, r.erro "
+                "FROM registros r JOIN (SELECT MAX(id) AS id FROM registros GROUP BY seu_numero) u ON r.id = u.id "
+                "ORDER BY r.id",
+            ).fetchall()
+        return [RegistroEmissao(*linha) for linha in linhas if estado is None or linha[1] == estado]
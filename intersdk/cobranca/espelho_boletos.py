@@ -0,0 +1,214 @@
+import json
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta
+from itertools import islice
+from pathlib import Path
+
+from intersdk.misc.banco_sqlite import BancoSqlite
+from intersdk.misc.typing import MotivoCancelamento, TipoSituacao
+
+from .components import Boleto, BoletoRecuperado
+from .cursor_watch import FUSO_INTER, hoje_inter
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS boletos (
+    nosso_numero TEXT PRIMARY KEY,
+    seu_numero TEXT NOT NULL,
+    situacao TEXT NOT NULL,
+    data_vencimento TEXT NOT NULL,
+    cpf_cnpj TEXT NOT NULL,
+    valor_total_recebimento REAL,
+    data_hora_situacao TEXT NOT NULL,
+    dados TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS boletos_seu_numero ON boletos (seu_numero);
+CREATE INDEX IF NOT EXISTS boletos_situacao ON boletos (situacao, data_vencimento);
+CREATE INDEX IF NOT EXISTS boletos_cpf_cnpj ON boletos (cpf_cnpj, data_vencimento);
+CREATE INDEX IF NOT EXISTS boletos_data_vencimento ON boletos (data_vencimento);
+CREATE INDEX IF NOT EXISTS boletos_valor_total_recebimento ON boletos (valor_total_recebimento);
+"""
+
+# uma versão mais antiga do boleto (uma página de listagem obtida antes de um cancelamento, por exemplo)
+# não sobrescreve a mais recente
+_UPSERT = """
+INSERT INTO boletos (
+    nosso_numero, seu_numero, situacao, data_vencimento, cpf_cnpj, valor_total_recebimento, data_hora_situacao, dados
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (nosso_numero) DO UPDATE SET
+    seu_numero = excluded.seu_numero,
+    situacao = excluded.situacao,
+    data_vencimento = excluded.data_vencimento,
+    cpf_cnpj = excluded.cpf_cnpj,
+    valor_total_recebimento = excluded.valor_total_recebimento,
+    data_hora_situacao = excluded.data_hora_situacao,
+    dados = excluded.dados
+WHERE excluded.data_hora_situacao >= boletos.data_hora_situacao
+"""
+
+
+def _componente(componente: dict) -> dict:
+    # o corpo da emissão usa codigoDesconto/codigoMulta/codigoMora; a consulta, apenas codigo
+    return {"codigo" if chave.startswith("codigo") else chave: valor for chave, valor in componente.items()}
+
+
+def _dados_emitidos(boleto: Boleto, response: dict) -> dict:
+    """Monta, no formato da consulta, o que se sabe do boleto logo após a emissão; origem, conta corrente
+    e espécie só são conhecidas após uma consulta ou sincronização."""
+    data: dict = boleto.to_dict()
+    return data | {
+        "nossoNumero": response["nossoNumero"],
+        "codigoBarras": response.get("codigoBarras"),
+        "linhaDigitavel": response.get("linhaDigitavel"),
+        "situacao": "EMABERTO",
+        "dataHoraSituacao": datetime.now(FUSO_INTER).isoformat(timespec="milliseconds"),
+        "dataEmissao": hoje_inter().isoformat(),
+        "dataLimite": (boleto.data_vencimento + timedelta(days=boleto.num_dias_agenda)).isoformat(),
+        "valorTotalRecebimento": 0,
+        "mensagem": data["mensagem"] or {f"linha{i}": None for i in range(1, 6)},
+        "desconto1": _componente(data["desconto1"]),
+        "desconto2": _componente(data["desconto2"]),
+        "desconto3": _componente(data["desconto3"]),
+        "multa": _componente(data["multa"]),
+        "mora": _componente(data["mora"]),
+    }
+
+
+def _linha(data: dict, data_hora_situacao: str | None = None) -> tuple:
+    return (
+        data["nossoNumero"],
+        data["seuNumero"],
+        data["situacao"],
+        data["dataVencimento"],
+        data["pagador"]["cpfCnpj"],
+        data.get("valorTotalRecebimento") or None,
+        data["dataHoraSituacao"] if data_hora_situacao is None else data_hora_situacao,
+        json.dumps(data, separators=(",", ":")),
+    )
+
+
+class EspelhoBoletos(BancoSqlite):
+    """Cópia local dos boletos em SQLite, atualizada por `Cobranca` a cada emissão, consulta e
+    cancelamento e em massa por `Cobranca.sincronizar_espelho`. As consultas não acessam a API."""
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        # o espelho pode ser reconstruído a partir da API; basta não corromper em uma queda
+        super().__init__(self.path, _ESQUEMA, "NORMAL")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conexao.execute("SELECT COUNT(*) FROM boletos").fetchone()[0]
+
+    def salvar(self, boleto: BoletoRecuperado | dict) -> None:
+        data = dict(boleto.data) if isinstance(boleto, BoletoRecuperado) else boleto
+        with self._lock:
+            self._conexao.execute(_UPSERT, _linha(data))
+
+    def salvar_lote(self, boletos: Iterable[BoletoRecuperado | dict], tamanho_lote: int = 1000) -> int:
+        """Grava os boletos em transações de `tamanho_lote` linhas e retorna quantos foram lidos."""
+        linhas = (_linha(dict(boleto.data) if isinstance(boleto, BoletoRecuperado) else boleto) for boleto in boletos)
+        total = 0
+        while lote := list(islice(linhas, tamanho_lote)):
+            with self._lock:
+                self._conexao.execute("BEGIN")
+                try:
+                    self._conexao.executemany(_UPSERT, lote)
+                except BaseException:
+                    self._conexao.execute("ROLLBACK")
+                    raise
+                self._conexao.execute("COMMIT")
+            total += len(lote)
+        return total
+
+    def registrar_emissao(self, boleto: Boleto, response: dict) -> None:
+        # sem data da situação: qualquer versão obtida da API substitui a montada localmente
+        with self._lock:
+            self._conexao.execute(_UPSERT, _linha(_dados_emitidos(boleto, response), data_hora_situacao=""))
+
+    def registrar_cancelamento(self, nosso_numero: str, motivo: MotivoCancelamento) -> None:
+        agora = datetime.now(FUSO_INTER).isoformat(timespec="milliseconds")
+        with self._lock:
+            self._conexao.execute(
+                "UPDATE boletos SET situacao = 'CANCELADO', data_hora_situacao = ?, dados = json_set(dados, "
+                "'$.situacao', 'CANCELADO', '$.motivoCancelamento', ?, '$.dataHoraSituacao', ?) "
+                "WHERE nosso_numero = ?",
+                (agora, motivo, agora, nosso_numero),
+            )
+
+    def obter(self, nosso_numero: str) -> BoletoRecuperado | None:
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT dados FROM boletos WHERE nosso_numero = ?", (nosso_numero,)
+            ).fetchone()
+        return BoletoRecuperado(json.loads(linha[0])) if linha is not None else None
+
+    @staticmethod
+    def __filtros(
+        situacao: TipoSituacao | None,
+        seu_numero: str | None,
+        cpf_cnpj: str | None,
+        vencimento_de: date | None,
+        vencimento_ate: date | None,
+        recebido_de: int | float | None,
+        recebido_ate: int | float | None,
+    ) -> tuple[list[str], list]:
+        condicoes = {
+            "situacao = ?": situacao,
+            "seu_numero = ?": seu_numero,
+            "cpf_cnpj = ?": cpf_cnpj,
+            "data_vencimento >= ?": vencimento_de.isoformat() if vencimento_de is not None else None,
+            "data_vencimento <= ?": vencimento_ate.isoformat() if vencimento_ate is not None else None,
+            "valor_total_recebimento >= ?": recebido_de,
+            "valor_total_recebimento <= ?": recebido_ate,
+        }
+        condicoes = {condicao: valor for condicao, valor in condicoes.items() if valor is not None}
+        return list(condicoes), list(condicoes.values())
+
+    def contar(
+        self,
+        situacao: TipoSituacao | None = None,
+        seu_numero: str | None = None,
+        cpf_cnpj: str | None = None,
+        vencimento_de: date | None = None,
+        vencimento_ate: date | None = None,
+        recebido_de: int | float | None = None,
+        recebido_ate: int | float | None = None,
+    ) -> int:
+        condicoes, parametros = self.__filtros(
+            situacao, seu_numero, cpf_cnpj, vencimento_de, vencimento_ate, recebido_de, recebido_ate
+        )
+        where = f" WHERE {' AND '.join(condicoes)}" if condicoes else ""
+        with self._lock:
+            return self._conexao.execute(f"SELECT COUNT(*) FROM boletos{where}", parametros).fetchone()[0]
+
+    def consultar(
+        self,
+        situacao: TipoSituacao | None = None,
+        seu_numero: str | None = None,
+        cpf_cnpj: str | None = None,
+        vencimento_de: date | None = None,
+        vencimento_ate: date | None = None,
+        recebido_de: int | float | None = None,
+        recebido_ate: int | float | None = None,
+        tamanho_lote: int = 1000,
+    ) -> Iterator[BoletoRecuperado]:
+        """Boletos em ordem de vencimento, lidos em lotes de `tamanho_lote` linhas: o lock é liberado entre
+        os lotes e o resultado pode ser consumido aos poucos, por maior que seja."""
+        condicoes, parametros = self.__filtros(
+            situacao, seu_numero, cpf_cnpj, vencimento_de, vencimento_ate, recebido_de, recebido_ate
+        )
+        # paginação por chave: cada lote continua após o último (vencimento, nosso número) lido
+        consulta = (
+            f"SELECT data_vencimento, nosso_numero, dados FROM boletos "
+            f"WHERE {' AND '.join([*condicoes, '(data_vencimento, nosso_numero) > (?, ?)'])} "
+            f"ORDER BY data_vencimento, nosso_numero LIMIT ?"
+        )
+        ultimo: tuple[str, str] = ("", "")
+        while True:
+            with self._lock:
+                linhas = self._conexao.execute(consulta, [*parametros, *ultimo, tamanho_lote]).fetchall()
+            for _, _, dados in linhas:
+                yield BoletoRecuperado(json.loads(dados))
+            if len(linhas) < tamanho_lote:
+                return
+            ultimo = (linhas[-1][0], linhas[-1][1])
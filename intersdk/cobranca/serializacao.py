@@ -0,0 +1,115 @@
+import json
+import math
+import time
+import typing
+from collections.abc import Sequence
+from datetime import date
+from json.encoder import encode_basestring_ascii  # type: ignore[attr-defined]
+from typing import Literal
+
+from intersdk.misc.metricas import ColetorMetricas, Medicao
+from intersdk.misc.validators import BoletoValidator
+
+from .components import Boleto, ComponenteFinanceiro, Pessoa
+
+TipoComponente = Literal["DESCONTO", "MULTA", "MORA"]
+
+_data = date.isoformat
+
+_CODIGOS: dict[str, tuple[str, dict[str, str]]] = {
+    "DESCONTO": ("codigoDesconto", {"TAXA": "PERCENTUALDATAINFORMADA", "VALOR": "VALORFIXODATAINFORMADA"}),
+    "MULTA": ("codigoMulta", {"TAXA": "PERCENTUAL", "VALOR": "VALORFIXO"}),
+    "MORA": ("codigoMora", {"TAXA": "TAXAMENSAL", "VALOR": "VALORDIA"}),
+}
+_FRAGMENTOS_VAZIOS = {
+    tipo: json.dumps(ComponenteFinanceiro.empty_dict(tipo), separators=(",", ":"))
+    for tipo in typing.get_args(TipoComponente)
+}
+_FRAGMENTO_ENDERECO_VAZIO = json.dumps(
+    dict.fromkeys(("endereco", "numero", "complemento", "bairro", "cidade", "uf", "cep")), separators=(",", ":")
+)[1:-1]
+
+
+def _texto(valor: str | None) -> str:
+    return "null" if valor is None else encode_basestring_ascii(valor)
+
+
+def _numero(valor: int | float) -> str:
+    # repr de subclasses (IntEnum, por exemplo) não é um número JSON; bool já foi recusado pelo validador
+    if isinstance(valor, int):
+        return int.__repr__(valor)
+    if not math.isfinite(valor):
+        # mesmo comportamento de json.dumps(allow_nan=False)
+        raise ValueError(f"valor numérico fora do JSON: {valor!r}")
+    return float.__repr__(valor)
+
+
+def _fragmento_componente(componente: ComponenteFinanceiro | None, tipo: TipoComponente) -> str:
+    if componente is None:
+        return _FRAGMENTOS_VAZIOS[tipo]
+    chave, codigos = _CODIGOS[tipo]
+    taxa = valor = "0"
+    if componente.tipo == "TAXA":
+        taxa = _numero(componente.taxa_valor)
+    else:
+        valor = _numero(componente.taxa_valor)
+    return f'{{"{chave}":"{codigos[componente.tipo]}","data":"{_data(componente.data)}","taxa":{taxa},"valor":{valor}}}'
+
+
+def _fragmento_pessoa(pessoa: Pessoa | None) -> str:
+    if not pessoa:
+        return "null"
+    endereco = pessoa.endereco
+    fragmento_endereco = (
+        _FRAGMENTO_ENDERECO_VAZIO
+        if endereco is None
+        else f'"endereco":{_texto(endereco.logradouro)},"numero":{_texto(endereco.numero)},'
+        f'"complemento":{_texto(endereco.complemento)},"bairro":{_texto(endereco.bairro)},'
+        f'"cidade":{_texto(endereco.cidade)},"uf":{_texto(endereco.estado)},"cep":{_texto(endereco.cep)}'
+    )
+    telefone = pessoa.telefone
+    ddd, numero = ("null", "null") if telefone is None else (_texto(telefone[:2]), _texto(telefone[2:]))
+    return (
+        f'{{"cpfCnpj":{_texto(pessoa.cpf_cnpj)},"tipoPessoa":{_texto(pessoa.tipo)},"nome":{_texto(pessoa.nome)},'
+        f'{fragmento_endereco},"email":{_texto(pessoa.email)},"ddd":{ddd},"telefone":{numero}}}'
+    )
+
+
+def _fragmento_mensagem(mensagem: Sequence[str] | None) -> str:
+    if mensagem is None:
+        return "null"
+    linhas = ",".join(f'"linha{i + 1}":{_texto(mensagem[i]) if i < len(mensagem) else "null"}' for i in range(5))
+    return f"{{{linhas}}}"
+
+
+def serializar_boleto(boleto: Boleto) -> bytes:
+    descontos = boleto.descontos or ()
+    desconto1, desconto2, desconto3 = (
+        _fragmento_componente(descontos[i] if i < len(descontos) else None, "DESCONTO") for i in range(3)
+    )
+    return (
+        f'{{"seuNumero":{_texto(boleto.seu_numero)},"valorNominal":{_numero(boleto.valor_nominal)},'
+        f'"dataVencimento":"{_data(boleto.data_vencimento)}","numDiasAgenda":{_numero(boleto.num_dias_agenda)},'
+        f'"pagador":{_fragmento_pessoa(boleto.pagador)},"mensagem":{_fragmento_mensagem(boleto.mensagem)},'
+        f'"desconto1":{desconto1},"desconto2":{desconto2},"desconto3":{desconto3},'
+        f'"multa":{_fragmento_componente(boleto.multa, "MULTA")},"mora":{_fragmento_componente(boleto.mora, "MORA")},'
+        f'"beneficiarioFinal":{_fragmento_pessoa(boleto.beneficiario_final)}}}'
+    ).encode("ascii")
+
+
+def validar_e_serializar(boleto: Boleto, metricas: ColetorMetricas | None = None) -> bytes:
+    if metricas is None:
+        BoletoValidator(boleto).validate()
+        return serializar_boleto(boleto)
+    inicio = time.perf_counter()
+    try:
+        BoletoValidator(boleto).validate()
+    except Exception as error:
+        metricas.registrar(Medicao("validacao", "boleto", time.perf_counter() - inicio, erro=type(error).__name__))
+        raise
+    meio = time.perf_counter()
+    corpo = serializar_boleto(boleto)
+    fim = time.perf_counter()
+    metricas.registrar(Medicao("validacao", "boleto", meio - inicio))
+    metricas.registrar(Medicao("serializacao", "boleto", fim - meio, bytes=len(corpo)))
+    return corpo
@@ -0,0 +1,203 @@
+import json
+import queue
+import ssl
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Any
+
+import loguru
+
+from intersdk.misc.log import amostrar
+from intersdk.misc.typing import TipoSituacao
+
+from .cache_boletos import CacheBoletos
+from .components import BoletoRecuperado
+
+
+@dataclass(slots=True, frozen=True)
+class Webhook:
+    webhook_url: str
+    criacao: datetime | None = None
+    atualizacao: datetime | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Webhook":
+        criacao, atualizacao = data.get("criacao"), data.get("atualizacao")
+        return cls(
+            webhook_url=data["webhookUrl"],
+            criacao=datetime.fromisoformat(criacao) if criacao else None,
+            atualizacao=datetime.fromisoformat(atualizacao) if atualizacao else None,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class AtualizacaoBoleto:
+    nosso_numero: str
+    seu_numero: str | None
+    situacao: TipoSituacao
+    data_situacao: date | None
+    valor_total_recebimento: int | float | None
+    data: dict
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AtualizacaoBoleto":
+        data_hora_situacao = data.get("dataHoraSituacao")
+        return cls(
+            nosso_numero=data["nossoNumero"],
+            seu_numero=data.get("seuNumero"),
+            situacao=data["situacao"],
+            # mesma conversão de BoletoRecuperado.data_situacao
+            data_situacao=(
+                (datetime.fromisoformat(data_hora_situacao) + timedelta(hours=3)).date() if data_hora_situacao else None
+            ),
+            valor_total_recebimento=data.get("valorTotalRecebimento") or None,
+            data=data,
+        )
+
+    def aplicar(self, boleto: BoletoRecuperado) -> BoletoRecuperado:
+        if boleto.nosso_numero != self.nosso_numero:
+            raise ValueError(f"Atualização do boleto {self.nosso_numero} aplicada ao boleto {boleto.nosso_numero}")
+        return BoletoRecuperado(boleto.data | self.data)
+
+
+def parse_callbacks(corpo: bytes) -> list[AtualizacaoBoleto]:
+    data = json.loads(corpo)
+    # o Inter envia os callbacks em lote, mas um objeto isolado também é aceito
+    return [AtualizacaoBoleto.from_dict(item) for item in (data if isinstance(data, list) else [data])]
+
+
+def _tamanho_corpo(content_length: str | None) -> int | None:
+    # Content-Length só admite dígitos: sinal, espaços e valores negativos são recusados
+    if not content_length:
+        return 0
+    if not content_length.isascii() or not content_length.isdigit():
+        return None
+    return int(content_length)
+
+
+class ReceptorWebhook:
+    """Recebe os callbacks do webhook de cobrança e entrega cada atualização a `destino`, uma função ou
+    uma fila. Pode ser embutido como aplicação WSGI ou servido diretamente com `servir`; corpos maiores
+    que `tamanho_maximo` bytes são recusados com 413 sem serem lidos."""
+
+    def __init__(
+        self,
+        destino: "Callable[[AtualizacaoBoleto], Any] | queue.Queue[AtualizacaoBoleto]",
+        cache: CacheBoletos | None = None,
+        tamanho_maximo: int = 1024 * 1024,
+    ) -> None:
+        self.__entregar: Callable[[AtualizacaoBoleto], Any]
+        if isinstance(destino, queue.Queue):
+            self.__entregar = destino.put
+        else:
+            self.__entregar = destino
+        self.cache = cache
+        self.tamanho_maximo = tamanho_maximo
+
+    def entregar(self, atualizacoes: list[AtualizacaoBoleto]) -> None:
+        for atualizacao in atualizacoes:
+            if self.cache is not None:
+                self.cache.invalidar(atualizacao.nosso_numero)
+            self.__entregar(atualizacao)
+        if amostrar():
+            loguru.logger.info("{} atualizações de boleto recebidas pelo webhook", len(atualizacoes))
+
+    def responder(self, metodo: str, corpo: bytes) -> int:
+        if metodo != "POST":
+            return 405
+        try:
+            atualizacoes = parse_callbacks(corpo)
+        except (ValueError, KeyError, TypeError) as error:
+            loguru.logger.error("Callback de webhook inválido: {!r}", error)
+            return 400
+        try:
+            self.entregar(atualizacoes)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # um erro diferente de 2xx faz o Inter reenviar o callback
+            loguru.logger.error("Erro ao processar callback de webhook: {!r}", error)
+            return 500
+        return 200
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        tamanho = _tamanho_corpo(environ.get("CONTENT_LENGTH"))
+        if tamanho is None:
+            status = 400
+        elif tamanho > self.tamanho_maximo:
+            status = 413
+        else:
+            status = self.responder(environ["REQUEST_METHOD"], environ["wsgi.input"].read(tamanho))
+        start_response(f"{status} {'OK' if status == 200 else 'Error'}", [("Content-Length", "0")])
+        return [b""]
+
+    def servir(
+        self, host: str = "0.0.0.0", port: int = 8443, contexto_ssl: ssl.SSLContext | None = None
+    ) -> "ServidorWebhook":
+        servidor = ServidorWebhook(self, host, port, contexto_ssl)
+        servidor.iniciar()
+        return servidor
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    timeout = 30
+    server: "ServidorWebhook"
+
+    def setup(self) -> None:
+        # o handshake TLS roda na thread da conexão: um cliente lento não bloqueia o accept dos demais
+        if isinstance(self.request, ssl.SSLSocket):
+            self.request.settimeout(self.timeout)
+            self.request.do_handshake()
+        super().setup()
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        tamanho = _tamanho_corpo(self.headers.get("Content-Length"))
+        if tamanho is None or tamanho > self.server.receptor.tamanho_maximo:
+            # o corpo não é lido: a conexão não pode ser reaproveitada
+            self.close_connection = True  # pylint: disable=attribute-defined-outside-init
+            status = 400 if tamanho is None else 413
+        else:
+            status = self.server.receptor.responder(self.command, self.rfile.read(tamanho))
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class ServidorWebhook(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, receptor: ReceptorWebhook, host: str, port: int, contexto_ssl: ssl.SSLContext | None) -> None:
+        super().__init__((host, port), _WebhookHandler)
+        if contexto_ssl is not None:
+            self.socket = contexto_ssl.wrap_socket(self.socket, server_side=True, do_handshake_on_connect=False)
+        self.receptor = receptor
+        self.__thread: Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"{'https' if isinstance(self.socket, ssl.SSLSocket) else 'http'}://{host!s}:{port}"
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        loguru.logger.warning("Erro na conexão de webhook de {}: {!r}", client_address, sys.exc_info()[1])
+
+    def iniciar(self) -> None:
+        self.__thread = Thread(target=self.serve_forever, name="intersdk-webhook", daemon=True)
+        self.__thread.start()
+
+    def server_close(self) -> None:
+        if self.__thread is not None:
+            self.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        super().server_close()
+
+    def close(self) -> None:
+        self.server_close()
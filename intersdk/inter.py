@@ -1,8 +1,30 @@
+from types import TracebackType
+
 from .autenticacao import Autenticacao
-from .cobranca import Cobranca
+from .cobranca import CacheBoletos, Cobranca, DiarioEmissao, EspelhoBoletos
 
 
 class Inter:
-    def __init__(self, autenticacao: Autenticacao) -> None:
+    def __init__(
+        self,
+        autenticacao: Autenticacao,
+        cache_boletos: CacheBoletos | None = None,
+        diario_emissao: DiarioEmissao | None = None,
+        espelho_boletos: EspelhoBoletos | None = None,
+    ) -> None:
         self.autenticacao = autenticacao
-        self.cobranca = Cobranca(self.autenticacao)
+        self.cobranca = Cobranca(self.autenticacao, cache_boletos, diario_emissao, espelho_boletos)
+
+    def close(self) -> None:
+        self.autenticacao.close()
+
+    def __enter__(self) -> "Inter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
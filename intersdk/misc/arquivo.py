@@ -0,0 +1,23 @@
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+
+@contextmanager
+def escrita_atomica(path: Path, mode: int = 0o644) -> Iterator[BinaryIO]:
+    # escreve em um arquivo temporário no mesmo diretório e o renomeia ao final, de modo que
+    # o destino nunca fica parcialmente escrito
+    descritor, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    try:
+        with os.fdopen(descritor, "wb") as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,21 @@
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Literal
+
+
+class BancoSqlite:
+    """Base dos armazenamentos locais em SQLite: uma conexão em modo WAL compartilhada entre threads,
+    serializada por `_lock`."""
+
+    def __init__(self, path: Path, esquema: str, sincronismo: Literal["FULL", "NORMAL"]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conexao = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute(f"PRAGMA synchronous={sincronismo}")
+        self._conexao.executescript(esquema)
+        self._lock = Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conexao.close()
@@ -0,0 +1,53 @@
+import base64
+import re
+from typing import BinaryIO
+
+
+class DecodificadorBase64Json:
+    def __init__(self, campo: str, destino: BinaryIO) -> None:
+        self.__inicio = re.compile(rb'"' + re.escape(campo.encode()) + rb'"\s*:\s*"')
+        self.__destino = destino
+        self.__prefixo = b""
+        self.__pendente = b""
+        self.__lendo = False
+        self.__concluido = False
+        self.bytes_escritos = 0
+
+    def feed(self, chunk: bytes) -> None:
+        if self.__concluido:
+            return
+        if not self.__lendo:
+            self.__prefixo += chunk
+            match = self.__inicio.search(self.__prefixo)
+            if match is None:
+                return
+            chunk = self.__prefixo[match.end() :]
+            self.__prefixo = b""
+            self.__lendo = True
+        fim = chunk.find(b'"')
+        if fim != -1:
+            chunk = chunk[:fim]
+            self.__concluido = True
+        # "\/" é um escape válido em JSON; a barra invertida nunca faz parte do alfabeto base64
+        dados = self.__pendente + chunk
+        if dados.endswith(b"\\") and not self.__concluido:
+            dados, self.__pendente = dados[:-1], b"\\"
+        else:
+            self.__pendente = b""
+        dados = dados.replace(b"\\/", b"/")
+        if self.__concluido:
+            self.__escrever(dados)
+            return
+        corte = len(dados) - len(dados) % 4
+        self.__escrever(dados[:corte])
+        self.__pendente = dados[corte:] + self.__pendente
+
+    def __escrever(self, dados: bytes) -> None:
+        if dados:
+            decodificado = base64.b64decode(dados)
+            self.__destino.write(decodificado)
+            self.bytes_escritos += len(decodificado)
+
+    def finalizar(self) -> None:
+        if not self.__concluido:
+            raise ValueError("resposta incompleta: campo base64 não encontrado ou não terminado")
@@ -0,0 +1,25 @@
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def exportacoes_preguicosas(
+    pacote: str, exportacoes: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Retorna `__getattr__` e `__dir__` para um pacote cujos nomes públicos (mapeados ao submódulo
+    relativo que os define) só são importados no primeiro acesso."""
+    namespace = importlib.import_module(pacote).__dict__
+
+    def __getattr__(nome: str) -> Any:
+        try:
+            submodulo = exportacoes[nome]
+        except KeyError:
+            raise AttributeError(f"module {pacote!r} has no attribute {nome!r}") from None
+        valor = getattr(importlib.import_module(submodulo, pacote), nome)
+        namespace[nome] = valor
+        return valor
+
+    def __dir__() -> list[str]:
+        return sorted(namespace.keys() | exportacoes.keys())
+
+    return __getattr__, __dir__
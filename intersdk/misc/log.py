@@ -0,0 +1,89 @@
+import random
+import re
+from collections.abc import Iterable
+from typing import Protocol
+
+import loguru
+
+LIMITE_CORPO = 512
+CAMPOS_SENSIVEIS = ("access_token", "client_secret", "cpfCnpj", "email", "telefone", "pdf")
+
+
+class _ComTexto(Protocol):
+    @property
+    def text(self) -> str:
+        ...
+
+
+class _Resposta(_ComTexto, Protocol):
+    def raise_for_status(self) -> object:
+        ...
+
+
+def _padrao_sensivel(campos: Iterable[str]) -> re.Pattern[str]:
+    # o valor pode ter sido cortado pelo truncamento, então a aspa final é opcional
+    return re.compile(r'"(' + "|".join(map(re.escape, campos)) + r')"\s*:\s*"(?:[^"\\]|\\.)*(?:"|$)')
+
+
+class _Configuracao:
+    __slots__ = ("amostragem", "limite_corpo", "padrao_sensivel")
+
+    def __init__(self) -> None:
+        self.amostragem = 0.0
+        self.limite_corpo = LIMITE_CORPO
+        self.padrao_sensivel = _padrao_sensivel(CAMPOS_SENSIVEIS)
+
+
+_configuracao = _Configuracao()
+# biblioteca silenciosa por padrão, como recomendado pelo loguru
+loguru.logger.disable("intersdk")
+
+
+def configurar_log(
+    ativo: bool = True,
+    amostragem: float = 1.0,
+    limite_corpo: int = LIMITE_CORPO,
+    campos_sensiveis: Iterable[str] = CAMPOS_SENSIVEIS,
+) -> None:
+    """O SDK é silencioso por padrão. Quando ativo, erros e avisos são sempre emitidos e as mensagens de
+    rotina de cada chamada (info, debug e success) com probabilidade `amostragem`."""
+    if not 0.0 <= amostragem <= 1.0:
+        raise ValueError("amostragem deve estar entre 0 e 1")
+    if ativo:
+        loguru.logger.enable("intersdk")
+    else:
+        loguru.logger.disable("intersdk")
+    _configuracao.amostragem = amostragem if ativo else 0.0
+    _configuracao.limite_corpo = limite_corpo
+    _configuracao.padrao_sensivel = _padrao_sensivel(campos_sensiveis)
+
+
+def amostrar() -> bool:
+    amostragem = _configuracao.amostragem
+    return amostragem >= 1.0 or (amostragem > 0.0 and random.random() < amostragem)
+
+
+def resumir(texto: str) -> str:
+    limite = _configuracao.limite_corpo
+    resumo = _configuracao.padrao_sensivel.sub(r'"\1": "***"', texto[:limite])
+    return resumo if len(texto) <= limite else f"{resumo}... ({len(texto)} caracteres)"
+
+
+def _registrar_resposta(response: _ComTexto, profundidade: int) -> None:
+    if amostrar():
+        loguru.logger.opt(depth=profundidade, lazy=True).debug(
+            "Resposta da requisição: {}", lambda: resumir(response.text)
+        )
+
+
+def log_resposta(response: _ComTexto) -> None:
+    _registrar_resposta(response, 2)
+
+
+def conferir_resposta(response: _Resposta, sucesso: bool, mensagem: str, *args: object) -> None:
+    """Registra o erro e levanta `raise_for_status` quando a resposta não teve `sucesso`; do contrário,
+    registra o corpo. Recebe `sucesso` porque requests e httpx o expõem com nomes diferentes."""
+    if not sucesso:
+        loguru.logger.opt(depth=1).error(mensagem + ": {}", *args, resumir(response.text))
+        response.raise_for_status()
+    _registrar_resposta(response, 2)
@@ -0,0 +1,48 @@
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class ResultadoLote(Generic[T, R]):
+    item: T
+    resultado: R | None = None
+    erro: Exception | None = None
+
+    @property
+    def ok(self) -> bool:  # pylint: disable=invalid-name
+        return self.erro is None
+
+
+def executar_em_lote(
+    funcao: Callable[[T], R], itens: Iterable[T], max_workers: int, fail_fast: bool = False
+) -> Iterator[ResultadoLote[T, R]]:
+    if max_workers < 1:
+        raise ValueError("max_workers deve ser maior ou igual a 1")
+    # a janela limita quantos itens são lidos de `itens` à frente do consumidor
+    janela: deque[tuple[T, Future[R]]] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in itens:
+                janela.append((item, executor.submit(funcao, item)))
+                if len(janela) >= 2 * max_workers:
+                    yield _resultado(*janela.popleft(), fail_fast)
+            while janela:
+                yield _resultado(*janela.popleft(), fail_fast)
+        finally:
+            for _, future in janela:
+                future.cancel()
+
+
+def _resultado(item: T, future: Future[R], fail_fast: bool) -> ResultadoLote[T, R]:
+    try:
+        return ResultadoLote(item=item, resultado=future.result())
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        if fail_fast:
+            raise
+        return ResultadoLote(item=item, erro=error)
@@ -0,0 +1,119 @@
+import bisect
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from threading import Lock
+
+from .typing import OperacaoMedida
+
+BUCKETS_PADRAO = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass(slots=True, frozen=True)
+class Medicao:
+    operacao: OperacaoMedida
+    endpoint: str
+    duracao: float
+    status: int | None = None
+    bytes: int | None = None
+    erro: str | None = None
+
+
+class ColetorMetricas(ABC):
+    @abstractmethod
+    def registrar(self, medicao: Medicao) -> None:
+        ...
+
+
+class _Serie:
+    __slots__ = ("contagens", "soma", "total", "bytes")
+
+    def __init__(self, buckets: int) -> None:
+        self.contagens = [0] * buckets
+        self.soma = 0.0
+        self.total = 0
+        self.bytes = 0
+
+
+class HistogramaMetricas(ColetorMetricas):
+    def __init__(self, buckets: Sequence[float] = BUCKETS_PADRAO, prefixo: str = "intersdk") -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.prefixo = prefixo
+        self.__series: dict[tuple[str, str, str], _Serie] = {}
+        self.__lock = Lock()
+
+    def registrar(self, medicao: Medicao) -> None:
+        resultado = medicao.erro or (str(medicao.status) if medicao.status is not None else "ok")
+        chave = (medicao.operacao, medicao.endpoint, resultado)
+        indice = bisect.bisect_left(self.buckets, medicao.duracao)
+        with self.__lock:
+            serie = self.__series.get(chave)
+            if serie is None:
+                serie = self.__series[chave] = _Serie(len(self.buckets) + 1)
+            serie.contagens[indice] += 1
+            serie.soma += medicao.duracao
+            serie.total += 1
+            serie.bytes += medicao.bytes or 0
+
+    def contagem(self, operacao: OperacaoMedida, endpoint: str | None = None) -> int:
+        with self.__lock:
+            return sum(
+                serie.total
+                for (serie_operacao, serie_endpoint, _), serie in self.__series.items()
+                if serie_operacao == operacao and endpoint in (None, serie_endpoint)
+            )
+
+    def quantil(self, fracao: float, operacao: OperacaoMedida, endpoint: str | None = None) -> float:
+        """Estimativa pelo limite superior do bucket, como histogram_quantile do Prometheus sem interpolação."""
+        with self.__lock:
+            contagens = [0] * (len(self.buckets) + 1)
+            for (serie_operacao, serie_endpoint, _), serie in self.__series.items():
+                if serie_operacao == operacao and endpoint in (None, serie_endpoint):
+                    contagens = [a + b for a, b in zip(contagens, serie.contagens)]
+        total = sum(contagens)
+        if total == 0:
+            return math.nan
+        acumulado = 0
+        for limite, contagem in zip((*self.buckets, math.inf), contagens):
+            acumulado += contagem
+            if acumulado >= fracao * total:
+                return limite
+        return math.inf
+
+    def exportar_prometheus(self) -> str:
+        duracao, bytes_total = f"{self.prefixo}_duracao_segundos", f"{self.prefixo}_bytes_total"
+        linhas = [
+            f"# HELP {duracao} Duração das operações do SDK.",
+            f"# TYPE {duracao} histogram",
+        ]
+        with self.__lock:
+            series = sorted(
+                (chave, serie.contagens[:], serie.soma, serie.total, serie.bytes)
+                for chave, serie in self.__series.items()
+            )
+        for chave, contagens, soma, total, _ in series:
+            rotulos = _rotulos(chave)
+            acumulado = 0
+            for limite, contagem in zip(self.buckets, contagens):
+                acumulado += contagem
+                linhas.append(f'{duracao}_bucket{{{rotulos},le="{limite}"}} {acumulado}')
+            linhas.append(f'{duracao}_bucket{{{rotulos},le="+Inf"}} {total}')
+            linhas.append(f"{duracao}_sum{{{rotulos}}} {soma}")
+            linhas.append(f"{duracao}_count{{{rotulos}}} {total}")
+        linhas += [
+            f"# HELP {bytes_total} Bytes transferidos ou produzidos pelas operações do SDK.",
+            f"# TYPE {bytes_total} counter",
+        ]
+        for chave, _, _, _, quantidade in series:
+            linhas.append(f"{bytes_total}{{{_rotulos(chave)}}} {quantidade}")
+        return "\n".join(linhas) + "\n"
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _rotulos(chave: tuple[str, str, str]) -> str:
+    operacao, endpoint, resultado = chave
+    return f'operacao="{operacao}",endpoint="{_escapar(endpoint)}",resultado="{_escapar(resultado)}"'
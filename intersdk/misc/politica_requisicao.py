@@ -0,0 +1,233 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import TYPE_CHECKING, Protocol, TypeVar
+
+import loguru
+import requests
+
+from .metricas import ColetorMetricas, Medicao
+from .typing import ClasseEndpoint
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class Resposta(Protocol):
+    @property
+    def status_code(self) -> int:
+        ...
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+R = TypeVar("R", bound=Resposta)
+
+
+def _medir(
+    metricas: ColetorMetricas,
+    classe: ClasseEndpoint,
+    inicio: float,
+    response: Resposta | None = None,
+    error: BaseException | None = None,
+) -> None:
+    tamanho = response.headers.get("Content-Length") if response is not None else None
+    metricas.registrar(
+        Medicao(
+            operacao="http",
+            endpoint=classe,
+            duracao=time.perf_counter() - inicio,
+            status=response.status_code if response is not None else None,
+            bytes=int(tamanho) if tamanho else None,
+            erro=type(error).__name__ if error is not None else None,
+        )
+    )
+
+
+class LimitadorTaxa:
+    """Token bucket: até `capacidade` requisições em rajada, repostas à razão de `taxa` por segundo."""
+
+    def __init__(
+        self, taxa: float, capacidade: float | None = None, relogio: Callable[[], float] = time.monotonic
+    ) -> None:
+        if taxa <= 0:
+            raise ValueError("taxa deve ser maior que 0")
+        self.taxa = taxa
+        self.capacidade = capacidade if capacidade is not None else max(taxa, 1.0)
+        self.__relogio = relogio
+        self.__fichas = self.capacidade
+        self.__atualizado_em = relogio()
+        self.__pausado_ate = 0.0
+        self.__lock = Lock()
+
+    def reservar(self) -> float:
+        """Reserva uma ficha e retorna quantos segundos aguardar antes de usá-la."""
+        with self.__lock:
+            agora = self.__relogio()
+            self.__fichas = min(self.capacidade, self.__fichas + (agora - self.__atualizado_em) * self.taxa)
+            self.__atualizado_em = agora
+            # as fichas podem ficar negativas: cada chamador reserva sua vez na fila
+            self.__fichas -= 1
+            espera = max(0.0, (0.0 - self.__fichas) / self.taxa)
+            return max(espera, self.__pausado_ate - agora)
+
+    def pausar(self, segundos: float) -> None:
+        with self.__lock:
+            self.__pausado_ate = max(self.__pausado_ate, self.__relogio() + segundos)
+
+    def adquirir(self) -> None:
+        espera = self.reservar()
+        if espera > 0:
+            time.sleep(espera)
+
+
+@dataclass
+class PoliticaRequisicao:
+    tentativas: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_after_max: float = 120.0
+    status_retentaveis: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    limites: dict[ClasseEndpoint, LimitadorTaxa] = field(default_factory=dict)
+    aleatorio: Callable[[], float] = random.random
+
+    def __post_init__(self) -> None:
+        if self.tentativas < 1:
+            raise ValueError("tentativas deve ser maior ou igual a 1")
+
+    def espera(self, tentativa: int, response: Resposta | None = None) -> float:
+        retry_after = self.__retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.retry_after_max)
+        # backoff exponencial com full jitter
+        return min(self.backoff_max, self.backoff_base * 2**tentativa) * self.aleatorio()
+
+    @staticmethod
+    def __retry_after(response: Resposta) -> float | None:
+        valor = response.headers.get("Retry-After")
+        if not valor:
+            return None
+        try:
+            return max(0.0, float(valor))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(valor) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def __repetir_status(self, classe: ClasseEndpoint, tentativa: int, response: Resposta, idempotente: bool) -> float:
+        # 429 significa que a requisição foi recusada sem ser processada; qualquer chamada pode ser repetida
+        if tentativa + 1 >= self.tentativas or response.status_code not in self.status_retentaveis:
+            return -1
+        if not idempotente and response.status_code != 429:
+            return -1
+        espera = self.espera(tentativa, response)
+        limitador = self.limites.get(classe)
+        if response.status_code == 429 and limitador is not None:
+            # todas as threads que compartilham o limitador recuam juntas
+            limitador.pausar(espera)
+        loguru.logger.warning(
+            "Requisição {} retornou {}; nova tentativa em {:.2f}s ({}/{})",
+            classe,
+            response.status_code,
+            espera,
+            tentativa + 2,
+            self.tentativas,
+        )
+        return espera
+
+    def __repetir_erro(self, classe: ClasseEndpoint, tentativa: int, error: Exception) -> float:
+        if tentativa + 1 >= self.tentativas:
+            return -1
+        espera = self.espera(tentativa)
+        loguru.logger.warning(
+            "Requisição {} falhou ({!r}); nova tentativa em {:.2f}s ({}/{})",
+            classe,
+            error,
+            espera,
+            tentativa + 2,
+            self.tentativas,
+        )
+        return espera
+
+    def executar(
+        self,
+        classe: ClasseEndpoint,
+        enviar: Callable[[], R],
+        idempotente: bool,
+        metricas: ColetorMetricas | None = None,
+    ) -> R:
+        # sem idempotência, apenas falhas em que a requisição certamente não chegou ao servidor são repetidas
+        erros = (requests.ConnectionError, requests.Timeout) if idempotente else (requests.ConnectTimeout,)
+        limitador = self.limites.get(classe)
+        for tentativa in range(self.tentativas):
+            if limitador is not None:
+                limitador.adquirir()
+            inicio = time.perf_counter() if metricas is not None else 0.0
+            try:
+                response = enviar()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                if metricas is not None:
+                    _medir(metricas, classe, inicio, error=error)
+                if isinstance(error, requests.exceptions.SSLError) or not isinstance(error, erros):
+                    raise
+                espera = self.__repetir_erro(classe, tentativa, error)
+                if espera < 0:
+                    raise
+                time.sleep(espera)
+                continue
+            if metricas is not None:
+                _medir(metricas, classe, inicio, response)
+            espera = self.__repetir_status(classe, tentativa, response, idempotente)
+            if espera < 0:
+                return response
+            response.close()
+            time.sleep(espera)
+        raise AssertionError("inalcançável")
+
+    async def executar_async(
+        self,
+        classe: ClasseEndpoint,
+        enviar: Callable[[], Awaitable["httpx.Response"]],
+        idempotente: bool,
+        metricas: ColetorMetricas | None = None,
+    ) -> "httpx.Response":
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        erros = (httpx.TransportError,) if idempotente else (httpx.ConnectError, httpx.ConnectTimeout)
+        limitador = self.limites.get(classe)
+        for tentativa in range(self.tentativas):
+            if limitador is not None and (espera := limitador.reservar()) > 0:
+                await asyncio.sleep(espera)
+            inicio = time.perf_counter() if metricas is not None else 0.0
+            try:
+                response = await enviar()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                if metricas is not None:
+                    _medir(metricas, classe, inicio, error=error)
+                if not isinstance(error, erros):
+                    raise
+                espera = self.__repetir_erro(classe, tentativa, error)
+                if espera < 0:
+                    raise
+                await asyncio.sleep(espera)
+                continue
+            if metricas is not None:
+                _medir(metricas, classe, inicio, response)
+            espera = self.__repetir_status(classe, tentativa, response, idempotente)
+            if espera < 0:
+                return response
+            await response.aclose()
+            await asyncio.sleep(espera)
+        raise AssertionError("inalcançável")
@@ -30,6 +30,9 @@ Uf = Literal[
     "TO",
 ]
 TipoSituacao = Literal["EXPIRADO", "VENCIDO", "EMABERTO", "PAGO", "CANCELADO"]
+TipoFiltroData = Literal["VENCIMENTO", "EMISSAO", "SITUACAO"]
+TipoOrdenacao = Literal["ASC", "DESC"]
+OrdenarPor = Literal["PAGADOR", "NOSSONUMERO", "SEUNUMERO", "DATASITUACAO", "DATAVENCIMENTO", "VALOR", "STATUS"]
 MotivoCancelamento = Literal["ACERTOS", "APEDIDODOCLIENTE", "PAGODIRETOAOCLIENTE", "SUBSTITUICAO"]
 TokenScope = Literal[
     "extrato.read",
@@ -53,3 +56,11 @@ TokenScope = Literal[
     "webhook-banking.write",
     "webhook-banking.read",
 ]
+
+ClasseEndpoint = Literal["token", "consulta", "listagem", "pdf", "emissao", "cancelamento", "webhook"]
+
+EstadoEmissao = Literal["PENDENTE", "CONFIRMADO", "FALHOU"]
+
+OperacaoMedida = Literal["http", "token", "validacao", "serializacao"]
+
+MetodoHttp = Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
@@ -1,2 +1,18 @@
-from .boleto_validator import BoletoValidator  # noqa: F401
-from .path_validator import PathValidator  # noqa: F401
+from typing import TYPE_CHECKING
+
+from intersdk.misc.importacao import exportacoes_preguicosas
+
+if TYPE_CHECKING:
+    from .boleto_batch_validator import BoletoBatchValidator  # noqa: F401
+    from .boleto_validator import BoletoValidator  # noqa: F401
+    from .path_validator import PathValidator  # noqa: F401
+
+_EXPORTACOES = {
+    "BoletoBatchValidator": ".boleto_batch_validator",
+    "BoletoValidator": ".boleto_validator",
+    "PathValidator": ".path_validator",
+}
+
+__all__ = list(_EXPORTACOES)
+
+__getattr__, __dir__ = exportacoes_preguicosas(__name__, _EXPORTACOES)
@@ -0,0 +1,165 @@
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from intersdk.cobranca.components.boleto_batch import BoletoBatch
+
+from intersdk.cobranca.components import Pessoa
+
+from .regras import (
+    regra_data_vencimento,
+    regra_descontos,
+    regra_mensagem,
+    regra_multa_mora,
+    regra_num_dias_agenda,
+    regra_pessoa,
+    regra_seu_numero,
+    regra_valor_nominal,
+)
+
+Regra = Callable[..., str | None]
+
+
+def _aplicar(regra: Regra, coluna: Sequence[Any], por_identidade: bool = False) -> list[tuple[int, str]]:
+    # colunas em lote repetem muito os mesmos valores: a regra roda uma vez por valor distinto e a coluna só é
+    # percorrida novamente quando algum valor é inválido
+    chaves: Sequence[Any] = coluna
+    if por_identidade:
+        chaves = list(map(id, coluna))
+    elif len(set(map(type, coluna))) > 1:
+        # 1 == 1.0 == True, mas as regras distinguem os tipos
+        chaves = list(zip(map(type, coluna), coluna))
+    try:
+        representantes = dict(zip(chaves, coluna))
+    except TypeError:
+        return _aplicar(regra, coluna, por_identidade=True)
+    invalidas = {chave: mensagem for chave, valor in representantes.items() if (mensagem := regra(valor)) is not None}
+    if not invalidas:
+        return []
+    return [(linha, invalidas[chave]) for linha, chave in enumerate(chaves) if chave in invalidas]
+
+
+def _aplicar_com_vencimento(
+    regra: Regra, coluna: Sequence[Any], *colunas_vencimento: Sequence[Any]
+) -> list[tuple[int, str]]:
+    # componentes dependem das colunas de vencimento da mesma linha, então a chave é a combinação de todas
+    if coluna.count(None) == len(coluna):
+        return []
+    chaves: list[Any] = list(zip(map(id, coluna), *colunas_vencimento))
+    try:
+        representantes = dict(zip(chaves, range(len(coluna))))
+    except TypeError:
+        chaves = list(range(len(coluna)))
+        representantes = dict(zip(chaves, chaves))
+    invalidas = {}
+    for chave, linha in representantes.items():
+        if (mensagem := regra(coluna[linha], *(outra[linha] for outra in colunas_vencimento))) is not None:
+            invalidas[chave] = mensagem
+    if not invalidas:
+        return []
+    return [(linha, invalidas[chave]) for linha, chave in enumerate(chaves) if chave in invalidas]
+
+
+class BoletoBatchValidator:
+    def __init__(self, batch: "BoletoBatch") -> None:
+        self.batch = batch
+        self.hoje = date.today()
+        self.erros: dict[int, list[str]] = {}
+
+    def __registrar(self, erros: Iterable[tuple[int, str]]) -> None:
+        for linha, mensagem in erros:
+            self.erros.setdefault(linha, []).append(mensagem)
+
+    def validate_seu_numero(self) -> None:
+        # seu_numero é único por linha: uma passada barata seleciona as linhas que precisam da regra completa
+        suspeitas = [
+            linha
+            for linha, seu_numero in enumerate(self.batch.seu_numero)
+            if not isinstance(seu_numero, str) or not seu_numero.isnumeric() or len(seu_numero) > 15
+        ]
+        self.__registrar(
+            (linha, mensagem)
+            for linha in suspeitas
+            if (mensagem := regra_seu_numero(self.batch.seu_numero[linha])) is not None
+        )
+
+    def validate_valor_nominal(self) -> None:
+        self.__registrar(_aplicar(regra_valor_nominal, self.batch.valor_nominal))
+
+    def validate_data_vencimento(self) -> None:
+        self.__registrar(_aplicar(partial(regra_data_vencimento, hoje=self.hoje), self.batch.data_vencimento))
+
+    def validate_num_dias_agenda(self) -> None:
+        self.__registrar(_aplicar(regra_num_dias_agenda, self.batch.num_dias_agenda))
+
+    def __regra_pessoa_em(self, nome: str, opcional: bool) -> Regra:
+        def regra(pessoa: Any) -> str | None:
+            if pessoa is None and opcional:
+                return None
+            if not isinstance(pessoa, Pessoa):
+                return f"{nome} deve ser uma instância de Pessoa"
+            mensagem = regra_pessoa(pessoa)
+            return f"{nome}: {mensagem}" if mensagem is not None else None
+
+        return regra
+
+    def validate_pagador(self) -> None:
+        self.__registrar(
+            _aplicar(self.__regra_pessoa_em("pagador", opcional=False), self.batch.pagador, por_identidade=True)
+        )
+
+    def validate_beneficiario_final(self) -> None:
+        regra = self.__regra_pessoa_em("beneficiario_final", opcional=True)
+        self.__registrar(_aplicar(regra, self.batch.beneficiario_final, por_identidade=True))
+
+    def validate_mensagem(self) -> None:
+        self.__registrar(_aplicar(regra_mensagem, self.batch.mensagem, por_identidade=True))
+
+    def __regra_multa_mora_em(self, nome: str) -> Regra:
+        return partial(regra_multa_mora, nome, hoje=self.hoje)
+
+    def validate_descontos(self) -> None:
+        self.__registrar(
+            _aplicar_com_vencimento(
+                partial(regra_descontos, hoje=self.hoje), self.batch.descontos, self.batch.data_vencimento
+            )
+        )
+
+    def validate_multa(self) -> None:
+        self.__registrar(
+            _aplicar_com_vencimento(
+                self.__regra_multa_mora_em("multa"),
+                self.batch.multa,
+                self.batch.data_vencimento,
+                self.batch.num_dias_agenda,
+            )
+        )
+
+    def validate_mora(self) -> None:
+        self.__registrar(
+            _aplicar_com_vencimento(
+                self.__regra_multa_mora_em("mora"),
+                self.batch.mora,
+                self.batch.data_vencimento,
+                self.batch.num_dias_agenda,
+            )
+        )
+
+    def validate(self) -> dict[int, list[str]]:
+        self.erros = {}
+        for validar_coluna in (
+            self.validate_seu_numero,
+            self.validate_valor_nominal,
+            self.validate_data_vencimento,
+            self.validate_num_dias_agenda,
+            self.validate_pagador,
+            self.validate_beneficiario_final,
+            self.validate_mensagem,
+            self.validate_descontos,
+            self.validate_multa,
+            self.validate_mora,
+        ):
+            validar_coluna()
+        return dict(sorted(self.erros.items()))
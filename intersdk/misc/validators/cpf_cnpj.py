@@ -0,0 +1,44 @@
+import re
+from functools import lru_cache
+from operator import mul
+
+TAMANHO_CACHE = 65536
+
+_MASCARA_CPF = str.maketrans("", "", ".-")
+_MASCARA_CNPJ = str.maketrans("", "", "./-")
+_FORMATO_CNPJ = re.compile(r"[0-9A-Z]{12}[0-9]{2}")
+
+_PESOS_CPF = ((10, 9, 8, 7, 6, 5, 4, 3, 2), (11, 10, 9, 8, 7, 6, 5, 4, 3, 2))
+_PESOS_CNPJ = ((5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2))
+
+
+def _digitos_validos(documento: bytes, pesos: tuple[tuple[int, ...], ...]) -> bool:
+    # cada caractere vale ord(c) - 48: "0"-"9" viram 0-9 e "A"-"Z" viram 17-42 (CNPJ alfanumérico);
+    # map para no menor iterável, então os pesos delimitam quantos caracteres entram na soma
+    for posicao, pesos_digito in enumerate(pesos, start=len(pesos[0])):
+        resto = (sum(map(mul, documento, pesos_digito)) - 48 * sum(pesos_digito)) % 11
+        if (0 if resto < 2 else 11 - resto) != documento[posicao] - 48:
+            return False
+    return True
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _cpf_normalizado_valido(cpf: str) -> bool:
+    if len(cpf) != 11 or not cpf.isascii() or not cpf.isdigit() or cpf.count(cpf[0]) == 11:
+        return False
+    return _digitos_validos(cpf.encode("ascii"), _PESOS_CPF)
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _cnpj_normalizado_valido(cnpj: str) -> bool:
+    if _FORMATO_CNPJ.fullmatch(cnpj) is None or cnpj.count(cnpj[0]) == 14:
+        return False
+    return _digitos_validos(cnpj.encode("ascii"), _PESOS_CNPJ)
+
+
+def cpf_valido(cpf: str) -> bool:
+    return _cpf_normalizado_valido(cpf.translate(_MASCARA_CPF))
+
+
+def cnpj_valido(cnpj: str) -> bool:
+    return _cnpj_normalizado_valido(cnpj.translate(_MASCARA_CNPJ).upper())
@@ -0,0 +1,285 @@
+# pylint: disable=too-many-return-statements
+import math
+import typing
+from datetime import date, timedelta
+from typing import Any
+
+from intersdk.cobranca.components import ComponenteFinanceiro, Endereco, Pessoa
+from intersdk.misc.typing import Uf
+
+from .cpf_cnpj import cnpj_valido, cpf_valido
+
+# cada regra retorna a mensagem de erro ou None; os validadores por objeto levantam a mensagem e
+# BoletoBatchValidator a aplica a colunas inteiras
+
+UF_LIST = list(typing.get_args(Uf))
+UF_SET = frozenset(UF_LIST)
+TIPOS_PESSOA = ["FISICA", "JURIDICA"]
+TIPOS_COMPONENTE = ["TAXA", "VALOR"]
+
+
+class ErroTipo(str):
+    """Mensagem de uma regra violada pelo tipo do valor: os validadores por objeto a levantam como TypeError."""
+
+
+def levantar(mensagem: str | None) -> None:
+    if mensagem is None:
+        return
+    if isinstance(mensagem, ErroTipo):
+        raise TypeError(mensagem)
+    raise ValueError(mensagem)
+
+
+def _mais_de_duas_casas(valor: int | float) -> bool:
+    texto = str(float(valor))
+    return "e" in texto or len(texto.partition(".")[2]) > 2
+
+
+def _texto(nome: str, valor: Any, maximo: int, opcional: bool = False) -> str | None:
+    if valor is None and opcional:
+        return None
+    if not isinstance(valor, str):
+        return ErroTipo(f"{nome} deve ser uma string")
+    if len(valor) < 1:
+        return f"{nome} deve conter ao menos 1 caractere"
+    if len(valor) > maximo:
+        return f"{nome} deve conter até {maximo} caracteres"
+    return None
+
+
+def regra_seu_numero(seu_numero: Any) -> str | None:
+    if not isinstance(seu_numero, str):
+        return ErroTipo("seu_numero deve ser uma string")
+    if not seu_numero.isnumeric():
+        return "seu_numero deve ser numérico"
+    if len(seu_numero) < 1:
+        return "seu_numero deve ter pelo menos 1 caractere"
+    if len(seu_numero) > 15:
+        return "seu_numero deve ter no máximo 15 caracteres"
+    return None
+
+
+def regra_valor_nominal(valor_nominal: Any) -> str | None:
+    if isinstance(valor_nominal, bool) or not isinstance(valor_nominal, (int, float)):
+        return ErroTipo("valor_nominal deve ser um inteiro ou float")
+    if not math.isfinite(valor_nominal):
+        return "valor_nominal deve ser um número finito"
+    if _mais_de_duas_casas(valor_nominal):
+        return "valor_nominal deve ter no máximo 2 casas decimais"
+    if valor_nominal < 2.5:
+        return "valor_nominal deve ser maior ou igual a 2.5"
+    return None
+
+
+def regra_data_vencimento(data_vencimento: Any, hoje: date) -> str | None:
+    if not isinstance(data_vencimento, date):
+        return ErroTipo("data_vencimento deve ser do tipo date")
+    if data_vencimento < hoje:
+        return "data_vencimento deve ser maior ou igual a data atual"
+    if data_vencimento > hoje + timedelta(1000):
+        return "data_vencimento deve ser menor ou igual a data atual + 1000 dias"
+    return None
+
+
+def regra_num_dias_agenda(num_dias_agenda: Any) -> str | None:
+    if isinstance(num_dias_agenda, bool) or not isinstance(num_dias_agenda, int):
+        return ErroTipo("num_dias_agenda deve ser um inteiro")
+    if num_dias_agenda > 60:
+        return "num_dias_agenda deve ser menor ou igual a 60"
+    return None
+
+
+def regra_logradouro(logradouro: Any) -> str | None:
+    return _texto("logradouro", logradouro, 100)
+
+
+def regra_numero(numero: Any) -> str | None:
+    return _texto("numero", numero, 10)
+
+
+def regra_bairro(bairro: Any) -> str | None:
+    return _texto("bairro", bairro, 60)
+
+
+def regra_cidade(cidade: Any) -> str | None:
+    return _texto("cidade", cidade, 60)
+
+
+def regra_estado(estado: Any) -> str | None:
+    if not isinstance(estado, str):
+        return ErroTipo("estado deve ser uma string")
+    if estado not in UF_SET:
+        return f"estado deve ser uma das opções: {UF_LIST}"
+    return None
+
+
+def regra_cep(cep: Any) -> str | None:
+    if not isinstance(cep, str):
+        return ErroTipo("cep deve ser uma string")
+    if not cep.isnumeric():
+        return "cep deve conter apenas números"
+    if len(cep) != 8:
+        return "cep deve conter 8 caracteres"
+    return None
+
+
+def regra_complemento(complemento: Any) -> str | None:
+    return _texto("complemento", complemento, 30, opcional=True)
+
+
+def regra_endereco(endereco: Any) -> str | None:
+    if not isinstance(endereco, Endereco):
+        return ErroTipo("endereco deve ser uma instância de Endereco")
+    return (
+        regra_logradouro(endereco.logradouro)
+        or regra_numero(endereco.numero)
+        or regra_bairro(endereco.bairro)
+        or regra_cidade(endereco.cidade)
+        or regra_estado(endereco.estado)
+        or regra_cep(endereco.cep)
+        or regra_complemento(endereco.complemento)
+    )
+
+
+def regra_tipo_pessoa(tipo: Any) -> str | None:
+    if not isinstance(tipo, str):
+        return ErroTipo("tipo deve ser uma string")
+    if tipo not in TIPOS_PESSOA:
+        return f"tipo deve ser uma das opções: {TIPOS_PESSOA}"
+    return None
+
+
+def regra_cpf_cnpj(cpf_cnpj: Any, tipo: Any) -> str | None:
+    if not isinstance(cpf_cnpj, str):
+        return ErroTipo("cpf_cnpj deve ser uma string")
+    if tipo == "FISICA" and not cpf_valido(cpf_cnpj):
+        return "cpf deve ser válido"
+    if tipo == "JURIDICA" and not cnpj_valido(cpf_cnpj):
+        return "cnpj deve ser válido"
+    return None
+
+
+def regra_nome(nome: Any) -> str | None:
+    return _texto("nome", nome, 100)
+
+
+def regra_email(email: Any) -> str | None:
+    return _texto("email", email, 50, opcional=True)
+
+
+def regra_telefone(telefone: Any) -> str | None:
+    if telefone is None:
+        return None
+    if not isinstance(telefone, str):
+        return ErroTipo("telefone deve ser uma string")
+    if not telefone.isnumeric():
+        return "telefone deve conter apenas números"
+    if len(telefone) not in (10, 11):
+        return "telefone deve conter 10 ou 11 dígitos"
+    return None
+
+
+def regra_pessoa(pessoa: Pessoa) -> str | None:
+    return (
+        regra_tipo_pessoa(pessoa.tipo)
+        or regra_cpf_cnpj(pessoa.cpf_cnpj, pessoa.tipo)
+        or regra_nome(pessoa.nome)
+        or regra_endereco(pessoa.endereco)
+        or regra_email(pessoa.email)
+        or regra_telefone(pessoa.telefone)
+    )
+
+
+def regra_tipo_componente(tipo: Any) -> str | None:
+    if not isinstance(tipo, str):
+        return ErroTipo("tipo deve ser uma string")
+    if tipo not in TIPOS_COMPONENTE:
+        return f"tipo deve ser uma das opções: {TIPOS_COMPONENTE}"
+    return None
+
+
+def regra_data_componente(data: Any, hoje: date) -> str | None:
+    if not isinstance(data, date):
+        return ErroTipo("data deve ser do tipo date")
+    if data < hoje:
+        return "data deve ser maior ou igual a data atual"
+    return None
+
+
+def regra_taxa_valor(taxa_valor: Any, tipo: Any) -> str | None:
+    if isinstance(taxa_valor, bool) or not isinstance(taxa_valor, (int, float)):
+        return ErroTipo("taxa_valor deve ser um inteiro ou float")
+    if not math.isfinite(taxa_valor):
+        return "taxa_valor deve ser um número finito"
+    if _mais_de_duas_casas(taxa_valor):
+        return "taxa_valor deve ter no máximo 2 casas decimais"
+    if taxa_valor < 0.01:
+        return "taxa_valor deve ser maior ou igual a 0.01"
+    if tipo == "TAXA" and taxa_valor >= 100:
+        return "taxa deve ser menor que 100"
+    return None
+
+
+def regra_componente_financeiro(componente: ComponenteFinanceiro, hoje: date) -> str | None:
+    return (
+        regra_tipo_componente(componente.tipo)
+        or regra_data_componente(componente.data, hoje)
+        or regra_taxa_valor(componente.taxa_valor, componente.tipo)
+    )
+
+
+def regra_mensagem(mensagem: Any) -> str | None:
+    if mensagem is None:
+        return None
+    if not isinstance(mensagem, (list, tuple)):
+        return ErroTipo("mensagem deve ser uma lista ou tupla")
+    if len(mensagem) < 1:
+        return "mensagem deve ter pelo menos 1 linha"
+    if len(mensagem) > 5:
+        return "mensagem deve ter no máximo 5 linhas"
+    for linha in mensagem:
+        if not isinstance(linha, str):
+            return ErroTipo("cada linha de mensagem deve ser uma string")
+        if len(linha) < 1:
+            return "cada linha de mensagem deve ter pelo menos 1 caractere"
+        if len(linha) > 78:
+            return "cada linha de mensagem deve ter no máximo 78 caracteres"
+    return None
+
+
+def regra_descontos(descontos: Any, data_vencimento: Any, hoje: date) -> str | None:
+    if descontos is None:
+        return None
+    if not isinstance(descontos, (list, tuple)):
+        return ErroTipo("descontos deve ser uma lista ou tupla")
+    if len(descontos) < 1:
+        return "descontos deve ter pelo menos 1 componente financeiro"
+    if len(descontos) > 3:
+        return "descontos deve ter no máximo 3 componentes financeiros"
+    for desconto in descontos:
+        if not isinstance(desconto, ComponenteFinanceiro):
+            return ErroTipo("cada item de descontos deve ser uma instância de ComponenteFinanceiro")
+        if (mensagem := regra_componente_financeiro(desconto, hoje)) is not None:
+            return mensagem
+        if isinstance(data_vencimento, date) and desconto.data > data_vencimento:
+            return "a data de desconto deve ser menor ou igual a data de vencimento"
+    if any(desconto.tipo != descontos[0].tipo for desconto in descontos):
+        return "todos os descontos devem ser do mesmo tipo"
+    return None
+
+
+def regra_multa_mora(nome: str, componente: Any, data_vencimento: Any, num_dias_agenda: Any, hoje: date) -> str | None:
+    if componente is None:
+        return None
+    if not isinstance(componente, ComponenteFinanceiro):
+        return ErroTipo(f"{nome} deve ser uma instância de ComponenteFinanceiro")
+    if (mensagem := regra_componente_financeiro(componente, hoje)) is not None:
+        return mensagem
+    # vencimento e agenda inválidos já têm as suas próprias mensagens
+    if not isinstance(data_vencimento, date) or regra_num_dias_agenda(num_dias_agenda) is not None:
+        return None
+    if componente.data <= data_vencimento:
+        return f"a data de {nome} deve ser maior que a data de vencimento"
+    if componente.data > data_vencimento + timedelta(num_dias_agenda):
+        return f"a data de {nome} deve ser menor ou igual a data limite"
+    return None
@@ -0,0 +1,197 @@
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Condition
+from types import TracebackType
+from typing import TypeVar
+
+import loguru
+
+from .autenticacao import Autenticacao, MemoryTokenStore, TokenStore
+from .inter import Inter
+from .misc.log import amostrar
+from .misc.metricas import ColetorMetricas
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True, frozen=True)
+class CredenciaisConta:
+    certificate_path: str
+    private_key_path: str
+    client_id: str
+    client_secret: str
+    ca_certificate_path: str | None = None
+
+
+class _Cliente:
+    __slots__ = ("inter", "em_uso")
+
+    def __init__(self, inter: Inter | None = None) -> None:
+        # None enquanto o cliente é criado fora do lock
+        self.inter = inter
+        self.em_uso = 0
+
+
+class PoolInter:
+    """Clientes `Inter` de várias contas, criados sob demanda e descartados do menos usado recentemente
+    para o mais. Cada cliente reserva `conexoes_por_conta` conexões e a soma das reservas nunca passa de
+    `max_conexoes`; os tokens ficam em `token_store`, compartilhado, e sobrevivem ao descarte do cliente.
+
+    O `Inter` de `usar` só deve ser usado dentro do bloco: fora dele pode ser descartado a qualquer
+    momento e voltaria a abrir conexões fora do limite."""
+
+    def __init__(
+        self,
+        credenciais: Mapping[str, CredenciaisConta] | Callable[[str], CredenciaisConta],
+        max_conexoes: int = 100,
+        conexoes_por_conta: int = 10,
+        base_url: str = "https://cdpj.partners.bancointer.com.br",
+        token_store: TokenStore | None = None,
+        metricas: ColetorMetricas | None = None,
+        criar_autenticacao: Callable[[CredenciaisConta], Autenticacao] | None = None,
+    ) -> None:
+        if not 1 <= conexoes_por_conta <= max_conexoes:
+            raise ValueError("conexoes_por_conta deve estar entre 1 e max_conexoes")
+        self.__credenciais = credenciais.__getitem__ if isinstance(credenciais, Mapping) else credenciais
+        self.max_conexoes = max_conexoes
+        self.conexoes_por_conta = conexoes_por_conta
+        self.base_url = base_url
+        self.token_store = token_store if token_store is not None else MemoryTokenStore()
+        self.metricas = metricas
+        self.__criar_autenticacao = criar_autenticacao or self.__autenticacao_padrao
+        self.__clientes: OrderedDict[str, _Cliente] = OrderedDict()
+        self.__condicao = Condition()
+
+    def __autenticacao_padrao(self, credenciais: CredenciaisConta) -> Autenticacao:
+        # pool_block faz cada conta esperar por uma conexão livre em vez de abrir uma além da reserva
+        return Autenticacao(
+            credenciais.certificate_path,
+            credenciais.private_key_path,
+            credenciais.client_id,
+            credenciais.client_secret,
+            base_url=self.base_url,
+            ca_certificate_path=credenciais.ca_certificate_path,
+            pool_connections=1,
+            pool_maxsize=self.conexoes_por_conta,
+            pool_block=True,
+            token_store=self.token_store,
+            metricas=self.metricas,
+        )
+
+    @property
+    def contas(self) -> list[str]:
+        """Contas com cliente aberto, da menos para a mais recentemente usada."""
+        with self.__condicao:
+            return list(self.__clientes)
+
+    def __len__(self) -> int:
+        with self.__condicao:
+            return len(self.__clientes)
+
+    def __reservar(self, conta_id: str) -> tuple[_Cliente, Inter]:
+        descartados: list[Inter] = []
+        try:
+            with self.__condicao:
+                while True:
+                    cliente = self.__clientes.get(conta_id)
+                    if cliente is not None:
+                        if cliente.inter is None:
+                            # outra thread está criando o cliente desta conta
+                            self.__condicao.wait()
+                            continue
+                        self.__clientes.move_to_end(conta_id)
+                        cliente.em_uso += 1
+                        return cliente, cliente.inter
+                    if (len(self.__clientes) + 1) * self.conexoes_por_conta <= self.max_conexoes:
+                        # a reserva é marcada já em uso para não ser descartada durante a criação
+                        cliente = self.__clientes[conta_id] = _Cliente()
+                        cliente.em_uso = 1
+                        break
+                    livre = next((conta for conta, cliente in self.__clientes.items() if not cliente.em_uso), None)
+                    if livre is None:
+                        # todas as reservas estão em uso: espera uma ser devolvida
+                        self.__condicao.wait()
+                        continue
+                    inter = self.__clientes.pop(livre).inter
+                    if inter is not None:
+                        descartados.append(inter)
+                    if amostrar():
+                        loguru.logger.info("Cliente da conta {} descartado", livre)
+        finally:
+            # as conexões são fechadas fora do lock; a reserva já foi liberada acima
+            for inter in descartados:
+                inter.close()
+        return cliente, self.__criar(conta_id, cliente)
+
+    def __criar(self, conta_id: str, cliente: _Cliente) -> Inter:
+        # credenciais e autenticação podem acessar disco ou rede: são criadas sem segurar o lock do pool
+        try:
+            inter = Inter(self.__criar_autenticacao(self.__credenciais(conta_id)))
+        except BaseException:
+            with self.__condicao:
+                if self.__clientes.get(conta_id) is cliente:
+                    del self.__clientes[conta_id]
+                self.__condicao.notify_all()
+            raise
+        with self.__condicao:
+            fechado = self.__clientes.get(conta_id) is not cliente
+            if not fechado:
+                cliente.inter = inter
+            self.__condicao.notify_all()
+        if fechado:
+            inter.close()
+            raise RuntimeError(f"PoolInter fechado durante a criação do cliente da conta {conta_id}")
+        if amostrar():
+            loguru.logger.info("Cliente da conta {} criado", conta_id)
+        return inter
+
+    def __devolver(self, cliente: _Cliente) -> None:
+        with self.__condicao:
+            cliente.em_uso -= 1
+            if not cliente.em_uso:
+                self.__condicao.notify_all()
+
+    @contextmanager
+    def usar(self, conta_id: str) -> Iterator[Inter]:
+        cliente, inter = self.__reservar(conta_id)
+        try:
+            yield inter
+        finally:
+            self.__devolver(cliente)
+
+    def executar(self, conta_id: str, funcao: Callable[[Inter], T]) -> T:
+        with self.usar(conta_id) as inter:
+            return funcao(inter)
+
+    def remover(self, conta_id: str) -> None:
+        """Descarta o cliente da conta, se existir e não estiver em uso; retorna sem erro caso contrário."""
+        with self.__condicao:
+            cliente = self.__clientes.get(conta_id)
+            if cliente is None or cliente.em_uso:
+                return
+            del self.__clientes[conta_id]
+            self.__condicao.notify_all()
+        if cliente.inter is not None:
+            cliente.inter.close()
+
+    def close(self) -> None:
+        with self.__condicao:
+            clientes = list(self.__clientes.values())
+            self.__clientes.clear()
+            self.__condicao.notify_all()
+        for cliente in clientes:
+            if cliente.inter is not None:
+                cliente.inter.close()
+
+    def __enter__(self) -> "PoolInter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
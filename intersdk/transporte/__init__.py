@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+
+from intersdk.misc.importacao import exportacoes_preguicosas
+
+if TYPE_CHECKING:
+    from .transporte import Transporte, TransporteMTLS  # noqa: F401
+    from .transporte_falso import TransporteFalso  # noqa: F401
+    from .transporte_requests import TransporteRequests  # noqa: F401
+    from .transporte_urllib3 import TransporteUrllib3  # noqa: F401
+
+_EXPORTACOES = {
+    "Transporte": ".transporte",
+    "TransporteMTLS": ".transporte",
+    "TransporteFalso": ".transporte_falso",
+    "TransporteRequests": ".transporte_requests",
+    "TransporteUrllib3": ".transporte_urllib3",
+}
+
+__all__ = list(_EXPORTACOES)
+
+__getattr__, __dir__ = exportacoes_preguicosas(__name__, _EXPORTACOES)
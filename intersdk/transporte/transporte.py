@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from threading import Lock
+from typing import Any
+
+import requests
+
+from intersdk.misc.typing import MetodoHttp
+
+
+class Transporte(ABC):
+    """Executa as requisições HTTP do SDK. Toda implementação devolve um `requests.Response` e sinaliza
+    falhas de rede com as exceções de `requests`, das quais dependem a política de repetição e a
+    conciliação de emissões."""
+
+    @abstractmethod
+    def requisitar(
+        self,
+        metodo: MetodoHttp,
+        url: str,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None = None,
+        corpo: bytes | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class TransporteMTLS(Transporte):
+    """Base dos transportes que abrem as conexões com o certificado da conta; `_lock` protege a criação
+    preguiçosa do pool de conexões."""
+
+    def __init__(
+        self,
+        certificate_path: str,
+        private_key_path: str,
+        ca_certificate_path: str | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ) -> None:
+        self.certificate_path = certificate_path
+        self.private_key_path = private_key_path
+        self.ca_certificate_path = ca_certificate_path
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self._lock = Lock()
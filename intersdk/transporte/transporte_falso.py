@@ -0,0 +1,313 @@
+import base64
+import io
+import json
+import random
+import time
+import urllib.request
+from collections.abc import Callable, Mapping
+from datetime import date, datetime, timedelta, timezone
+from http import HTTPStatus
+from threading import Lock
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from intersdk.cobranca.codigo_barras import CodigoBarras
+from intersdk.misc.typing import MetodoHttp
+
+from .transporte import Transporte
+
+_PREFIXO = "/cobranca/v2/boletos"
+_FUSO = timezone(timedelta(hours=-3))
+_CODIGOS_VAZIOS = {"desconto": "NAOTEMDESCONTO", "multa": "NAOTEMMULTA", "mora": "ISENTO"}
+_CAMPOS_CALLBACK = (
+    "nossoNumero",
+    "seuNumero",
+    "situacao",
+    "dataHoraSituacao",
+    "valorNominal",
+    "valorTotalRecebimento",
+    "codigoBarras",
+    "linhaDigitavel",
+    "dataVencimento",
+    "motivoCancelamento",
+)
+_CAMPOS_DATA = {"VENCIMENTO": "dataVencimento", "EMISSAO": "dataEmissao", "SITUACAO": "dataHoraSituacao"}
+_CAMPOS_ORDENACAO: dict[str, Callable[[dict], Any]] = {
+    "PAGADOR": lambda boleto: boleto["pagador"]["nome"],
+    "NOSSONUMERO": lambda boleto: boleto["nossoNumero"],
+    "SEUNUMERO": lambda boleto: boleto["seuNumero"],
+    "DATASITUACAO": lambda boleto: boleto["dataHoraSituacao"],
+    "DATAVENCIMENTO": lambda boleto: boleto["dataVencimento"],
+    "VALOR": lambda boleto: boleto["valorNominal"],
+    "STATUS": lambda boleto: boleto["situacao"],
+}
+
+
+def _componente(dados: dict | None, tipo: str) -> dict:
+    if not dados:
+        return {"codigo": _CODIGOS_VAZIOS[tipo], "taxa": 0, "valor": 0}
+    codigo = next(valor for chave, valor in dados.items() if chave.startswith("codigo"))
+    return {"codigo": codigo} | {chave: valor for chave, valor in dados.items() if not chave.startswith("codigo")}
+
+
+class _Resposta(Exception):
+    def __init__(self, status: int, data: dict | None = None, headers: dict[str, str] | None = None) -> None:
+        super().__init__(status)
+        self.status = status
+        self.data = data
+        self.headers = headers or {}
+
+
+class TransporteFalso(Transporte):
+    """Simula em memória a API do Inter: token OAuth, emissão, consulta, listagem, PDF e cancelamento de
+    boletos. A latência e a injeção de falhas são configuráveis, o que permite testes determinísticos e
+    benchmarks de carga sem acesso ao banco."""
+
+    def __init__(
+        self,
+        latencia: float | Callable[[], float] = 0.0,
+        taxa_falhas: float = 0.0,
+        status_falha: int = 503,
+        semente: int | None = None,
+        conta_corrente: str = "12345678",
+    ) -> None:
+        self.latencia = latencia
+        self.taxa_falhas = taxa_falhas
+        self.status_falha = status_falha
+        self.conta_corrente = conta_corrente
+        # devolvidas em ordem às requisições da API de cobrança antes de atendê-las normalmente: um status
+        # HTTP ou uma exceção a lançar
+        self.falhas: list[int | Exception] = []
+        self.requisicoes: list[tuple[str, str]] = []
+        self.boletos: dict[str, dict] = {}
+        self.webhook: dict | None = None
+        self.__notificacoes: list[tuple[str, dict]] = []
+        self.__tokens: dict[str, list[str]] = {}
+        self.__aleatorio = random.Random(semente)
+        self.__lock = Lock()
+
+    def requisitar(
+        self,
+        metodo: MetodoHttp,
+        url: str,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None = None,
+        corpo: bytes | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        partes = urlsplit(url)
+        query = dict(parse_qsl(partes.query)) | {chave: str(valor) for chave, valor in (params or {}).items()}
+        latencia = self.latencia() if callable(self.latencia) else self.latencia
+        if latencia > 0:
+            time.sleep(latencia)
+        with self.__lock:
+            self.requisicoes.append((metodo, partes.path))
+            falha = self.__sortear_falha() if partes.path.startswith(_PREFIXO) else None
+            if isinstance(falha, Exception):
+                raise falha
+            try:
+                if falha is not None:
+                    raise _Resposta(falha, headers={"Retry-After": "0"})
+                response = self.__resposta(
+                    url, *self.__atender(metodo, partes.path, CaseInsensitiveDict(headers), query, corpo)
+                )
+            except _Resposta as resposta:
+                response = self.__resposta(url, resposta.status, resposta.data, resposta.headers)
+            notificacoes, self.__notificacoes = self.__notificacoes, []
+        self.__notificar(notificacoes)
+        return response
+
+    def pagar(self, nosso_numero: str, valor: int | float | None = None) -> None:
+        """Simula o pagamento do boleto, notificando o webhook registrado."""
+        with self.__lock:
+            boleto = self.boletos[nosso_numero]
+            boleto["situacao"] = "PAGO"
+            boleto["valorTotalRecebimento"] = valor if valor is not None else boleto["valorNominal"]
+            boleto["dataHoraSituacao"] = datetime.now(_FUSO).isoformat(timespec="milliseconds")
+            self.__agendar_notificacao(boleto)
+            notificacoes, self.__notificacoes = self.__notificacoes, []
+        self.__notificar(notificacoes)
+
+    def __agendar_notificacao(self, boleto: dict) -> None:
+        if self.webhook is not None:
+            callback = {chave: boleto[chave] for chave in _CAMPOS_CALLBACK if chave in boleto}
+            self.__notificacoes.append((self.webhook["webhookUrl"], callback))
+
+    @staticmethod
+    def __notificar(notificacoes: list[tuple[str, dict]]) -> None:
+        # fora do lock: o receptor pode consultar o próprio transporte ao tratar o callback
+        for webhook_url, callback in notificacoes:
+            request = urllib.request.Request(
+                webhook_url,
+                data=json.dumps([callback]).encode(),
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            with urllib.request.urlopen(request, timeout=10):
+                pass
+
+    def __sortear_falha(self) -> int | Exception | None:
+        if self.falhas:
+            return self.falhas.pop(0)
+        if self.taxa_falhas > 0 and self.__aleatorio.random() < self.taxa_falhas:
+            return self.status_falha
+        return None
+
+    @staticmethod
+    def __resposta(
+        url: str, status: int, data: dict | None, headers: dict[str, str] | None = None
+    ) -> requests.Response:
+        conteudo = json.dumps(data).encode() if data is not None else b""
+        response = requests.Response()
+        response.status_code = status
+        response.reason = HTTPStatus(status).phrase
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": "application/json", "Content-Length": str(len(conteudo))} | (headers or {})
+        )
+        response.encoding = "utf-8"
+        response.raw = io.BytesIO(conteudo)
+        response.url = url
+        return response
+
+    def __autorizar(self, headers: CaseInsensitiveDict, escopo: str) -> None:
+        tipo, _, token = headers.get("Authorization", "").partition(" ")
+        escopos = self.__tokens.get(token)
+        if tipo != "Bearer" or escopos is None:
+            raise _Resposta(401, {"title": "Token inválido"})
+        if escopo not in escopos:
+            raise _Resposta(403, {"title": f"Escopo {escopo} não concedido"})
+
+    def __atender(
+        self, metodo: str, caminho: str, headers: CaseInsensitiveDict, query: dict[str, str], corpo: bytes | None
+    ) -> tuple[int, dict | None]:
+        if caminho == "/oauth/v2/token" and metodo == "POST":
+            return 200, self.__token(corpo)
+        if not caminho.startswith(_PREFIXO):
+            raise _Resposta(404, {"title": "Recurso não encontrado"})
+        self.__autorizar(headers, "boleto-cobranca.read" if metodo == "GET" else "boleto-cobranca.write")
+        partes = caminho[len(_PREFIXO) :].strip("/").split("/") if caminho != _PREFIXO else []
+        if partes == ["webhook"]:
+            return self.__atender_webhook(metodo, corpo)
+        if partes:
+            return self.__atender_boleto(metodo, partes, corpo)
+        if metodo == "GET":
+            return 200, self.__listar(query)
+        if metodo == "POST":
+            return 200, self.__emitir(json.loads(corpo or b"{}"))
+        raise _Resposta(405, {"title": "Método não permitido"})
+
+    def __atender_boleto(self, metodo: str, partes: list[str], corpo: bytes | None) -> tuple[int, dict | None]:
+        boleto = self.boletos.get(partes[0])
+        if boleto is None:
+            raise _Resposta(404, {"title": "Boleto não encontrado"})
+        if partes[1:] == [] and metodo == "GET":
+            return 200, boleto
+        if partes[1:] == ["pdf"] and metodo == "GET":
+            pdf = f"%PDF-1.4\n% boleto {boleto['nossoNumero']}\n%%EOF\n".encode()
+            return 200, {"pdf": base64.b64encode(pdf).decode()}
+        if partes[1:] == ["cancelar"] and metodo == "POST":
+            self.__cancelar(boleto, json.loads(corpo or b"{}"))
+            return 202, None
+        raise _Resposta(404, {"title": "Recurso não encontrado"})
+
+    def __token(self, corpo: bytes | None) -> dict:
+        data = dict(parse_qsl((corpo or b"").decode()))
+        if not data.get("client_id") or not data.get("client_secret"):
+            raise _Resposta(401, {"title": "Credenciais inválidas"})
+        access_token = f"token-{len(self.__tokens) + 1}"
+        self.__tokens[access_token] = data.get("scope", "").split()
+        return {
+            "token_type": "Bearer",
+            "access_token": access_token,
+            "scope": data.get("scope", ""),
+            "expires_in": 3600,
+        }
+
+    def __emitir(self, data: dict) -> dict:
+        nosso_numero = f"{len(self.boletos) + 1:011d}"
+        vencimento = date.fromisoformat(data["dataVencimento"])
+        codigo_barras = CodigoBarras.gerar(vencimento, data["valorNominal"], f"{nosso_numero:0>25}")
+        boleto = {
+            "nossoNumero": nosso_numero,
+            "seuNumero": data["seuNumero"],
+            "codigoBarras": codigo_barras.codigo,
+            "linhaDigitavel": codigo_barras.linha_digitavel,
+            "situacao": "EMABERTO",
+            "dataHoraSituacao": datetime.now(_FUSO).isoformat(timespec="milliseconds"),
+            "valorNominal": data["valorNominal"],
+            "dataEmissao": date.today().isoformat(),
+            "dataVencimento": vencimento.isoformat(),
+            "dataLimite": (vencimento + timedelta(days=data.get("numDiasAgenda", 0))).isoformat(),
+            "valorTotalRecebimento": 0,
+            "origem": "EXTERNA",
+            "contaCorrente": self.conta_corrente,
+            "codigoEspecie": "OUTROS",
+            "mensagem": {f"linha{i}": (data.get("mensagem") or {}).get(f"linha{i}") or "" for i in range(1, 6)},
+            "desconto1": _componente(data.get("desconto1"), "desconto"),
+            "desconto2": _componente(data.get("desconto2"), "desconto"),
+            "desconto3": _componente(data.get("desconto3"), "desconto"),
+            "multa": _componente(data.get("multa"), "multa"),
+            "mora": _componente(data.get("mora"), "mora"),
+            "pagador": data["pagador"],
+        }
+        if data.get("beneficiarioFinal"):
+            boleto["beneficiarioFinal"] = data["beneficiarioFinal"]
+        self.boletos[nosso_numero] = boleto
+        return {chave: boleto[chave] for chave in ("nossoNumero", "codigoBarras", "linhaDigitavel")}
+
+    def __cancelar(self, boleto: dict, data: dict) -> None:
+        if boleto["situacao"] not in ("EMABERTO", "VENCIDO"):
+            raise _Resposta(400, {"title": f"Boleto na situação {boleto['situacao']} não pode ser cancelado"})
+        boleto["situacao"] = "CANCELADO"
+        boleto["motivoCancelamento"] = data.get("motivoCancelamento")
+        boleto["dataHoraSituacao"] = datetime.now(_FUSO).isoformat(timespec="milliseconds")
+        self.__agendar_notificacao(boleto)
+
+    def __atender_webhook(self, metodo: str, corpo: bytes | None) -> tuple[int, dict | None]:
+        if metodo == "PUT":
+            agora = datetime.now(_FUSO).isoformat(timespec="milliseconds")
+            criacao = self.webhook["criacao"] if self.webhook is not None else agora
+            self.webhook = {
+                "webhookUrl": json.loads(corpo or b"{}")["webhookUrl"],
+                "criacao": criacao,
+                "atualizacao": agora,
+            }
+            return 204, None
+        if self.webhook is None:
+            raise _Resposta(404, {"title": "Webhook não encontrado"})
+        if metodo == "GET":
+            return 200, self.webhook
+        if metodo == "DELETE":
+            self.webhook = None
+            return 204, None
+        raise _Resposta(405, {"title": "Método não permitido"})
+
+    def __listar(self, query: dict[str, str]) -> dict:
+        campo_data = _CAMPOS_DATA[query.get("filtrarDataPor", "VENCIMENTO")]
+        inicio, fim = query["dataInicial"], query["dataFinal"]
+        boletos = [
+            boleto
+            for boleto in self.boletos.values()
+            if inicio <= boleto[campo_data][:10] <= fim
+            and query.get("situacao", boleto["situacao"]) == boleto["situacao"]
+            and query.get("cpfCnpj", boleto["pagador"]["cpfCnpj"]) == boleto["pagador"]["cpfCnpj"]
+            and query.get("nome", "").lower() in boleto["pagador"]["nome"].lower()
+            and query.get("email", boleto["pagador"].get("email")) == boleto["pagador"].get("email")
+        ]
+        if "ordenarPor" in query:
+            boletos.sort(key=_CAMPOS_ORDENACAO[query["ordenarPor"]], reverse=query.get("tipoOrdenacao") == "DESC")
+        tamanho, pagina = int(query.get("itensPorPagina", 100)), int(query.get("paginaAtual", 0))
+        conteudo = boletos[pagina * tamanho : (pagina + 1) * tamanho]
+        return {
+            "totalPaginas": -(-len(boletos) // tamanho),
+            "totalElementos": len(boletos),
+            "primeiraPagina": pagina == 0,
+            "ultimaPagina": (pagina + 1) * tamanho >= len(boletos),
+            "tamanhoPagina": tamanho,
+            "numeroDeElementos": len(conteudo),
+            "content": conteudo,
+        }
@@ -0,0 +1,60 @@
+from collections.abc import Mapping
+from typing import Any
+
+import loguru
+import requests
+
+from intersdk.autenticacao.adapter import MTLSAdapter
+from intersdk.misc.log import amostrar
+from intersdk.misc.typing import MetodoHttp
+
+from .transporte import TransporteMTLS
+
+
+class TransporteRequests(TransporteMTLS):
+    __session: requests.Session | None = None
+
+    @property
+    def session(self) -> requests.Session:
+        if self.__session is None:
+            with self._lock:
+                if self.__session is None:
+                    self.__session = self.__create_session()
+        return self.__session
+
+    def __create_session(self) -> requests.Session:
+        if amostrar():
+            loguru.logger.info("Criando sessão HTTP com mTLS")
+        adapter = MTLSAdapter(
+            certificate_path=self.certificate_path,
+            private_key_path=self.private_key_path,
+            ca_certificate_path=self.ca_certificate_path,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def requisitar(
+        self,
+        metodo: MetodoHttp,
+        url: str,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None = None,
+        corpo: bytes | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        return self.session.request(
+            metodo, url, headers=headers, params=params, data=corpo, timeout=timeout, stream=stream
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self.__session is not None:
+                self.__session.close()
+                self.__session = None
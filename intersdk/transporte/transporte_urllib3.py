@@ -0,0 +1,99 @@
+from collections.abc import Mapping
+from typing import Any
+from urllib.parse import urlencode
+
+import loguru
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    HTTPError,
+    NewConnectionError,
+    ReadTimeoutError,
+    SSLError,
+)
+
+from intersdk.autenticacao.contexto_ssl import criar_contexto_ssl
+from intersdk.misc.log import amostrar
+from intersdk.misc.typing import MetodoHttp
+
+from .transporte import TransporteMTLS
+
+
+class TransporteUrllib3(TransporteMTLS):
+    """Usa diretamente o pool de conexões do urllib3, sem o processamento que `requests.Session` faz em
+    cada requisição (cookies, redirecionamentos, proxies do ambiente e hooks)."""
+
+    __pool: urllib3.PoolManager | None = None
+
+    @property
+    def pool(self) -> urllib3.PoolManager:
+        if self.__pool is None:
+            with self._lock:
+                if self.__pool is None:
+                    if amostrar():
+                        loguru.logger.info("Criando pool de conexões urllib3 com mTLS")
+                    self.__pool = urllib3.PoolManager(
+                        num_pools=self.pool_connections,
+                        maxsize=self.pool_maxsize,
+                        block=self.pool_block,
+                        ssl_context=criar_contexto_ssl(
+                            self.certificate_path, self.private_key_path, self.ca_certificate_path
+                        ),
+                    )
+        return self.__pool
+
+    def requisitar(
+        self,
+        metodo: MetodoHttp,
+        url: str,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None = None,
+        corpo: bytes | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        headers = dict(headers) if self.keep_alive else {**headers, "Connection": "close"}
+        # as exceções do urllib3 são convertidas nas equivalentes de requests, como faz o HTTPAdapter
+        try:
+            raw = self.pool.request(
+                metodo,
+                url,
+                body=corpo,
+                headers=headers,
+                timeout=urllib3.Timeout(connect=timeout, read=timeout),
+                retries=False,
+                redirect=False,
+                preload_content=False,
+            )
+        except NewConnectionError as error:
+            raise requests.ConnectionError(error) from error
+        except ConnectTimeoutError as error:
+            raise requests.ConnectTimeout(error) from error
+        except ReadTimeoutError as error:
+            raise requests.ReadTimeout(error) from error
+        except SSLError as error:
+            raise requests.exceptions.SSLError(error) from error
+        except HTTPError as error:
+            raise requests.ConnectionError(error) from error
+        response = requests.Response()
+        response.status_code = raw.status
+        response.headers = CaseInsensitiveDict(raw.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = raw.reason or ""
+        response.raw = raw
+        response.url = url
+        if not stream:
+            # lê o corpo inteiro e devolve a conexão ao pool
+            _ = response.content
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            if self.__pool is not None:
+                self.__pool.clear()
+                self.__pool = None
@@ -0,0 +1,43 @@
+import pytest
+
+from intersdk import Inter
+from intersdk.autenticacao import Autenticacao
+from intersdk.autenticacao.adapter import MTLSAdapter
+from intersdk.transporte import TransporteFalso, TransporteRequests
+
+
+def test_sessao_compartilhada(servidor_inter) -> None:
+    autenticacao = Autenticacao(
+        servidor_inter.certificate_path,
+        servidor_inter.private_key_path,
+        client_id="client_id",
+        client_secret="client_secret",
+        base_url=servidor_inter.base_url,
+        ca_certificate_path=servidor_inter.certificate_path,
+        pool_connections=2,
+        pool_maxsize=3,
+        pool_block=True,
+    )
+    with Inter(autenticacao) as inter:
+        transporte = autenticacao.transporte
+        assert isinstance(transporte, TransporteRequests)
+        session = transporte.session
+        assert autenticacao.session is session
+        for nosso_numero in ("1", "2", "3"):
+            inter.cobranca.recuperar_boleto(nosso_numero)
+        assert transporte.session is session
+
+        adapter = session.get_adapter(servidor_inter.base_url)
+        assert isinstance(adapter, MTLSAdapter)
+        assert adapter.poolmanager.connection_pool_kw["ssl_context"] is adapter.ssl_context
+        # o token e as três consultas usaram a mesma conexão
+        pool = adapter.poolmanager.connection_from_url(servidor_inter.base_url)
+        assert (pool.pool.maxsize, pool.block, pool.num_connections) == (3, True, 1)
+        assert len(adapter.poolmanager.pools) == 1 and adapter.poolmanager.pools._maxsize == 2
+    assert [metodo for metodo, _ in servidor_inter.requisicoes] == ["POST", "GET", "GET", "GET"]
+
+
+def test_sessao_sem_transporte_requests() -> None:
+    autenticacao = Autenticacao("", "", "client_id", "client_secret", transporte=TransporteFalso())
+    with pytest.raises(AttributeError):
+        _ = autenticacao.session
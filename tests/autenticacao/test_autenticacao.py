@@ -0,0 +1,100 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from intersdk.autenticacao import Autenticacao, FileTokenStore
+from intersdk.misc.typing import TokenScope
+
+
+@pytest.fixture
+def requisicoes() -> list[list[TokenScope]]:
+    return []
+
+
+@pytest.fixture
+def criar_autenticacao(
+    monkeypatch: pytest.MonkeyPatch, requisicoes: list[list[TokenScope]]
+) -> Callable[..., Autenticacao]:
+    lock = threading.Lock()
+
+    def request_token(scope: list[TokenScope]) -> dict:
+        with lock:
+            requisicoes.append(sorted(scope))
+            access_token = f"token{len(requisicoes)}"
+        time.sleep(0.05)
+        return {"token_type": "Bearer", "access_token": access_token, "scope": " ".join(scope), "expires_in": 3600}
+
+    def criar(**kwargs) -> Autenticacao:
+        autenticacao = Autenticacao(
+            "cert.pem", "key.pem", client_id="client_id", client_secret="client_secret", **kwargs
+        )
+        monkeypatch.setattr(autenticacao, "_Autenticacao__request_token", request_token)
+        return autenticacao
+
+    return criar
+
+
+@pytest.fixture
+def autenticacao(criar_autenticacao: Callable[..., Autenticacao]) -> Autenticacao:
+    return criar_autenticacao()
+
+
+def martelar(autenticacao: Autenticacao, scopes: list[list[TokenScope]], threads: int = 64) -> None:
+    barreira = threading.Barrier(threads)
+
+    def chamar(indice: int) -> None:
+        barreira.wait()
+        for _ in range(20):
+            scope = scopes[indice % len(scopes)]
+            assert autenticacao.token(scope).covers(scope)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(chamar, range(threads)))
+
+
+def test_token_single_flight(autenticacao: Autenticacao, requisicoes: list[list[TokenScope]]) -> None:
+    martelar(autenticacao, [["boleto-cobranca.read"]])
+    assert len(requisicoes) == 1
+
+    autenticacao.token(["boleto-cobranca.read"]).expires_in = datetime(2000, 1, 1)
+    martelar(autenticacao, [["boleto-cobranca.read"]])
+    assert len(requisicoes) == 2
+
+
+def test_token_merge_scope(autenticacao: Autenticacao, requisicoes: list[list[TokenScope]]) -> None:
+    martelar(autenticacao, [["boleto-cobranca.read"], ["boleto-cobranca.write"]])
+    assert len(requisicoes) <= 2
+    assert requisicoes[-1] == ["boleto-cobranca.read", "boleto-cobranca.write"]
+
+
+def test_renovacao(autenticacao: Autenticacao, requisicoes: list[list[TokenScope]]) -> None:
+    token = autenticacao.token(["boleto-cobranca.read"])
+    token.issued_at = token.expires_in - timedelta(seconds=3600 * 1.01)
+    autenticacao.iniciar_renovacao(fracao=0.01)
+    inicio = time.monotonic()
+    # o token antigo continua sendo servido até a renovação terminar
+    while autenticacao.token(["boleto-cobranca.read"]) is token and time.monotonic() - inicio < 5:
+        time.sleep(0.01)
+    autenticacao.parar_renovacao()
+    assert autenticacao.token(["boleto-cobranca.read"]).access_token == "token2"
+    assert len(requisicoes) == 2
+
+
+def test_file_token_store(
+    criar_autenticacao: Callable[..., Autenticacao], requisicoes: list[list[TokenScope]], tmp_path: Path
+) -> None:
+    processos = [criar_autenticacao(token_store=FileTokenStore(str(tmp_path / "tokens.json"))) for _ in range(4)]
+    with ThreadPoolExecutor(max_workers=len(processos)) as executor:
+        tokens = list(executor.map(lambda autenticacao: autenticacao.token(["boleto-cobranca.read"]), processos))
+    assert len(requisicoes) == 1
+    assert {token.access_token for token in tokens} == {"token1"}
+    assert tokens[0] == processos[0].token_store.get("client_id")
+
+    processos[1].token(["boleto-cobranca.write"])
+    assert processos[2].token(["boleto-cobranca.write"]).scope == processos[1].token(["boleto-cobranca.write"]).scope
+    assert len(requisicoes) == 2
@@ -0,0 +1,21 @@
+import timeit
+
+import pytest
+
+from intersdk.cobranca import BoletoRecuperado
+from tests.cobranca.test_boleto_recuperado import RESPOSTA, boleto_hidratado
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_hidratacao_boleto() -> None:
+    respostas = [RESPOSTA | {"seuNumero": str(i)} for i in range(5000)]
+
+    def ler(boletos) -> None:
+        for boleto in boletos:
+            _ = boleto.situacao, boleto.valor_total_recebimento
+
+    antes = min(timeit.repeat(lambda: ler(map(boleto_hidratado, respostas)), number=1, repeat=3))
+    depois = min(timeit.repeat(lambda: ler(map(BoletoRecuperado, respostas)), number=1, repeat=3))
+
+    assert depois < antes / 5
@@ -0,0 +1,17 @@
+import timeit
+
+import pytest
+
+from intersdk.cobranca.codigo_barras import validar_linhas_digitaveis
+from tests.cobranca.test_codigo_barras import linha_valida_referencia, linhas_aleatorias
+
+pytestmark = pytest.mark.benchmark
+
+TOTAL = 50_000
+
+
+def test_validar_linhas_digitaveis() -> None:
+    linhas = linhas_aleatorias(TOTAL)
+    antes = min(timeit.repeat(lambda: [linha_valida_referencia(linha) for linha in linhas], number=1, repeat=3))
+    depois = min(timeit.repeat(lambda: validar_linhas_digitaveis(linhas), number=1, repeat=3))
+    assert depois < antes / 3
@@ -0,0 +1,32 @@
+import timeit
+
+import pytest
+
+from intersdk.misc.validators.cpf_cnpj import (
+    _cnpj_normalizado_valido,
+    _cpf_normalizado_valido,
+    cnpj_valido,
+    cpf_valido,
+)
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_cpf_cnpj_validate_docbr() -> None:
+    validate_docbr = pytest.importorskip("validate_docbr")
+    cpf, cnpj = validate_docbr.CPF(), validate_docbr.CNPJ()
+    # carteira repetida: 500 pagadores distintos validados 20 vezes cada
+    cpfs = [cpf.generate() for _ in range(500)] * 20
+    cnpjs = [cnpj.generate() for _ in range(500)] * 20
+
+    antes = timeit.timeit(lambda: [validate_docbr.CPF().validate(d) for d in cpfs], number=1)
+    antes += timeit.timeit(lambda: [validate_docbr.CNPJ().validate(d) for d in cnpjs], number=1)
+    _cpf_normalizado_valido.cache_clear()
+    _cnpj_normalizado_valido.cache_clear()
+    depois = timeit.timeit(lambda: [cpf_valido(d) for d in cpfs], number=1)
+    depois += timeit.timeit(lambda: [cnpj_valido(d) for d in cnpjs], number=1)
+    sem_cache = timeit.timeit(lambda: [_cpf_normalizado_valido.__wrapped__(d) for d in cpfs], number=1)
+    sem_cache += timeit.timeit(lambda: [_cnpj_normalizado_valido.__wrapped__(d) for d in cnpjs], number=1)
+
+    assert sem_cache < antes
+    assert depois < antes / 5
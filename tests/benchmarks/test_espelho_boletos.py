@@ -0,0 +1,28 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from intersdk.cobranca import EspelhoBoletos
+from tests.cobranca.test_espelho_boletos import dados_boleto
+
+pytestmark = pytest.mark.benchmark
+
+TOTAL = 100_000
+
+
+def test_espelho_salvar_lote(tmp_path: Path) -> None:
+    espelho = EspelhoBoletos(str(tmp_path / "espelho.db"))
+    inicio = time.perf_counter()
+    espelho.salvar_lote(dados_boleto(i) for i in range(TOTAL))
+    insercao = time.perf_counter() - inicio
+
+    # a segunda passada atualiza todas as linhas existentes
+    inicio = time.perf_counter()
+    espelho.salvar_lote(dados_boleto(i, "PAGO", "2023-10-02T10:00") for i in range(TOTAL))
+    atualizacao = time.perf_counter() - inicio
+
+    pagos = sum(1 for _ in espelho.consultar(situacao="PAGO", cpf_cnpj="52998224725"))
+    assert pagos == TOTAL // 2
+    assert TOTAL / insercao > 20_000 and TOTAL / atualizacao > 20_000
+    espelho.close()
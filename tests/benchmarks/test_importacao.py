@@ -0,0 +1,12 @@
+import pytest
+
+from tests.test_importacao import IMPORTACOES, tempos_importacao
+
+pytestmark = pytest.mark.benchmark
+
+ORCAMENTO_US = 20_000
+
+
+@pytest.mark.parametrize(("codigo", "modulo"), IMPORTACOES)
+def test_orcamento_importacao(codigo: str, modulo: str) -> None:
+    assert tempos_importacao(codigo)[modulo] < ORCAMENTO_US
@@ -0,0 +1,58 @@
+import dataclasses
+import tracemalloc
+from collections.abc import Callable
+from datetime import date, timedelta
+
+import pytest
+
+from intersdk.cobranca import Boleto, Endereco, Pessoa
+
+pytestmark = pytest.mark.benchmark
+
+
+def sem_slots(cls: type) -> type:
+    return dataclasses.make_dataclass(f"{cls.__name__}SemSlots", [(f.name, f.type, f) for f in dataclasses.fields(cls)])
+
+
+class BoletoSemSlots:
+    # mesmo layout do Boleto antes de __slots__: um __dict__ com todos os atributos por instância
+    def __init__(self, **kwargs) -> None:
+        for nome in Boleto.__slots__:
+            setattr(self, nome, None)
+        for nome, valor in kwargs.items():
+            setattr(self, f"__{nome}", valor)
+
+
+def bytes_por_boleto(
+    boleto_cls: Callable, pessoa_cls: Callable, endereco_cls: Callable, quantidade: int = 20000
+) -> float:
+    vencimento = date.today() + timedelta(days=10)
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    boletos = [
+        boleto_cls(
+            seu_numero=str(i),
+            valor_nominal=25.5,
+            data_vencimento=vencimento,
+            num_dias_agenda=30,
+            pagador=pessoa_cls(
+                tipo="FISICA",
+                cpf_cnpj="52998224725",
+                nome="Fulano de Tal",
+                endereco=endereco_cls(
+                    logradouro="Rua Um", numero="1", bairro="Centro", cidade="São Paulo", estado="SP", cep="01001000"
+                ),
+            ),
+        )
+        for i in range(quantidade)
+    ]
+    fim = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(boletos) == quantidade
+    return (fim - inicio) / quantidade
+
+
+def test_memoria_boleto() -> None:
+    antes = bytes_por_boleto(BoletoSemSlots, sem_slots(Pessoa), sem_slots(Endereco))
+    depois = bytes_por_boleto(Boleto, Pessoa, Endereco)
+    assert depois < antes * 0.9
@@ -0,0 +1,22 @@
+import json
+import timeit
+from collections.abc import Callable
+
+import pytest
+
+from intersdk.cobranca import Boleto
+from intersdk.cobranca.serializacao import serializar_boleto
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_serializacao_boleto(criar_boleto: Callable[[str], Boleto]) -> None:
+    boletos = [criar_boleto(str(i)) for i in range(5000)]
+
+    # caminho anterior: to_dict seguido do json= do requests (json.dumps com allow_nan=False)
+    antes = min(
+        timeit.repeat(lambda: [json.dumps(b.to_dict(), allow_nan=False).encode() for b in boletos], number=1, repeat=3)
+    )
+    depois = min(timeit.repeat(lambda: [serializar_boleto(b) for b in boletos], number=1, repeat=3))
+
+    assert depois < antes / 2
@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from intersdk import Inter
+from intersdk.autenticacao import Autenticacao
+from intersdk.transporte import TransporteFalso, TransporteRequests, TransporteUrllib3
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_transporte_requests_urllib3(servidor_inter) -> None:
+    tempos = {}
+    for classe in (TransporteRequests, TransporteUrllib3):
+        transporte = classe(
+            servidor_inter.certificate_path,
+            servidor_inter.private_key_path,
+            ca_certificate_path=servidor_inter.certificate_path,
+        )
+        autenticacao = Autenticacao(
+            "", "", "client_id", "client_secret", base_url=servidor_inter.base_url, transporte=transporte
+        )
+        with Inter(autenticacao) as inter:
+            inter.cobranca.recuperar_boleto("0")
+            inicio = time.perf_counter()
+            for i in range(300):
+                inter.cobranca.recuperar_boleto(str(i))
+            tempos[classe.__name__] = time.perf_counter() - inicio
+    assert tempos["TransporteUrllib3"] < tempos["TransporteRequests"]
+
+
+def test_carga_transporte_falso(criar_boleto) -> None:
+    transporte = TransporteFalso(latencia=0.005)
+    with Inter(Autenticacao("", "", "client_id", "client_secret", transporte=transporte, pool_maxsize=16)) as inter:
+        inicio = time.perf_counter()
+        resultados = list(inter.cobranca.emitir_boletos((criar_boleto(str(i)) for i in range(400)), max_workers=16))
+        duracao = time.perf_counter() - inicio
+    assert all(resultado.ok for resultado in resultados) and len(transporte.boletos) == 400
+    # em série, 400 requisições de 5ms levariam pelo menos 2s
+    assert duracao < 1.0
@@ -0,0 +1,80 @@
+import asyncio
+import random
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from intersdk import AsyncInter
+from intersdk.autenticacao import AsyncAutenticacao
+from intersdk.cobranca import Boleto, async_cobranca
+
+pytest.importorskip("httpx")
+
+
+def criar_inter(servidor) -> AsyncInter:
+    return AsyncInter(
+        AsyncAutenticacao(
+            servidor.certificate_path,
+            servidor.private_key_path,
+            client_id="client_id",
+            client_secret="client_secret",
+            base_url=servidor.base_url,
+            ca_certificate_path=servidor.certificate_path,
+            max_connections=4,
+        )
+    )
+
+
+def test_async_cobranca(servidor_inter, criar_boleto, tmp_path: Path) -> None:
+    boleto = criar_boleto("1")
+
+    async def main() -> list[Boleto]:
+        async with criar_inter(servidor_inter) as inter:
+            await inter.cobranca.emitir_boleto(boleto)
+            await inter.cobranca.recuperar_boleto_pdf(boleto.nosso_numero, str(tmp_path / "boleto.pdf"))
+            await inter.cobranca.cancelar_boleto(boleto.nosso_numero, "APEDIDODOCLIENTE")
+            return await asyncio.gather(*(inter.cobranca.recuperar_boleto(str(i)) for i in range(50)))
+
+    recuperados = asyncio.run(main())
+    assert boleto.nosso_numero == "00000000001"
+    assert (tmp_path / "boleto.pdf").read_bytes().startswith(b"%PDF")
+    assert [item.nosso_numero for item in recuperados] == [str(i) for i in range(50)]
+    assert all(item.situacao == "EMABERTO" for item in recuperados)
+    # concorrentes esperam um único token por escopo
+    assert servidor_inter.requisicoes.count(("POST", "/oauth/v2/token")) == 2
+
+
+def test_recuperar_boleto_pdf_fora_do_event_loop(
+    servidor_inter, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    escrita_atomica, threads, escritas = async_cobranca.escrita_atomica, [], []
+
+    @contextmanager
+    def registrar(path: Path) -> Iterator[SimpleNamespace]:
+        threads.append(threading.get_ident())
+        with escrita_atomica(path) as destino:
+
+            def write(dados: bytes) -> int:
+                threads.append(threading.get_ident())
+                escritas.append(len(dados))
+                return destino.write(dados)
+
+            yield SimpleNamespace(write=write)
+        threads.append(threading.get_ident())
+
+    monkeypatch.setattr(async_cobranca, "escrita_atomica", registrar)
+    servidor_inter.pdf = b"%PDF-1.4\n" + random.Random(0).randbytes(1024 * 1024)
+
+    async def main() -> None:
+        async with criar_inter(servidor_inter) as inter:
+            await inter.cobranca.recuperar_boleto_pdf("1", str(tmp_path / "boleto.pdf"))
+
+    asyncio.run(main())
+    assert (tmp_path / "boleto.pdf").read_bytes() == servidor_inter.pdf
+    assert threads and threading.get_ident() not in threads
+    # o PDF é gravado à medida que chega, sem ser acumulado em memória
+    assert len(escritas) > 10 and max(escritas) <= 64 * 1024
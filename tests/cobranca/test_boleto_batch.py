@@ -0,0 +1,83 @@
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import date, timedelta
+
+import pytest
+
+from intersdk.cobranca import Boleto, BoletoBatch, ComponenteFinanceiro
+from intersdk.misc.validators import BoletoBatchValidator, BoletoValidator
+
+VENCIMENTO = date.today() + timedelta(days=10)
+
+ALTERACOES: list[dict] = [
+    {},
+    {"seu_numero": "abc"},
+    {"seu_numero": "1" * 16},
+    {"valor_nominal": "25"},
+    {"valor_nominal": 25.123},
+    {"valor_nominal": 1},
+    {"valor_nominal": float("inf")},
+    {"valor_nominal": float("nan")},
+    {"data_vencimento": date.today() - timedelta(days=1)},
+    {"num_dias_agenda": 61},
+    {"num_dias_agenda": 1.0},
+    {"mensagem": ["a" * 79]},
+    {"descontos": [ComponenteFinanceiro("TAXA", VENCIMENTO + timedelta(days=1), 1)]},
+    {"descontos": [ComponenteFinanceiro("TAXA", VENCIMENTO, 1), ComponenteFinanceiro("VALOR", VENCIMENTO, 1)]},
+    {"multa": ComponenteFinanceiro("TAXA", VENCIMENTO, 2)},
+    {"multa": ComponenteFinanceiro("TAXA", VENCIMENTO + timedelta(days=31), 2)},
+    {"mora": ComponenteFinanceiro("TAXA", VENCIMENTO + timedelta(days=1), 100)},
+    {"mora": "1%"},
+    {"descontos": [ComponenteFinanceiro("VALOR", VENCIMENTO, float("inf"))]},
+    {"multa": ComponenteFinanceiro("VALOR", VENCIMENTO + timedelta(days=1), float("nan"))},
+]
+
+
+def mensagem_boleto_validator(boleto: Boleto) -> str | None:
+    try:
+        BoletoValidator(boleto).validate()
+    except (TypeError, ValueError) as error:
+        return str(error)
+    return None
+
+
+def test_boleto_batch_validator(criar_boleto: Callable[[str], Boleto]) -> None:
+    boletos = []
+    for indice, alteracoes in enumerate(ALTERACOES):
+        boleto = criar_boleto(str(indice))
+        for nome, valor in alteracoes.items():
+            setattr(boleto, nome, valor)
+        boletos.append(boleto)
+    pessoa_invalida = criar_boleto("99")
+    pessoa_invalida.pagador = replace(pessoa_invalida.pagador, cpf_cnpj="52998224724")
+    boletos.append(pessoa_invalida)
+
+    erros = BoletoBatchValidator(BoletoBatch.from_boletos(boletos)).validate()
+
+    for linha, boleto in enumerate(boletos):
+        esperado = mensagem_boleto_validator(boleto)
+        if esperado is None:
+            assert linha not in erros
+        else:
+            assert erros[linha][0].endswith(esperado)
+    assert erros[len(boletos) - 1] == ["pagador: cpf deve ser válido"]
+
+
+def test_boleto_batch_colunas() -> None:
+    with pytest.raises(ValueError):
+        BoletoBatch(seu_numero=["1", "2"], valor_nominal=[10])
+    batch = BoletoBatch()
+    assert len(batch) == 0
+    assert not BoletoBatchValidator(batch).validate()
+
+
+@pytest.mark.parametrize("valor", [float("inf"), float("-inf"), float("nan")])
+def test_valores_nao_finitos(criar_boleto: Callable[[str], Boleto], valor: float) -> None:
+    boleto = criar_boleto("1")
+    boleto.valor_nominal = valor
+    with pytest.raises(ValueError, match="valor_nominal deve ser um número finito"):
+        BoletoValidator(boleto).validate()
+    boleto = criar_boleto("1")
+    boleto.descontos = [ComponenteFinanceiro("VALOR", VENCIMENTO, valor)]
+    with pytest.raises(ValueError, match="taxa_valor deve ser um número finito"):
+        BoletoValidator(boleto).validate()
@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+
+import pytest
+
+from intersdk.cobranca import (
+    Boleto,
+    BoletoBase,
+    BoletoRecuperado,
+    ComponenteFinanceiro,
+    Pessoa,
+)
+from intersdk.misc.exceptions import BoletoJaEmitido
+from tests.conftest import BOLETO
+
+PROPRIEDADES = [
+    "seu_numero",
+    "valor_nominal",
+    "data_vencimento",
+    "num_dias_agenda",
+    "data_limite",
+    "pagador",
+    "beneficiario_final",
+    "mensagem",
+    "descontos",
+    "multa",
+    "mora",
+    "nosso_numero",
+    "codigo_barras",
+    "linha_digitavel",
+    "data_emissao",
+    "situacao",
+    "data_situacao",
+    "origem",
+    "conta_corrente",
+    "codigo_especie",
+    "valor_total_recebimento",
+    "motivo_cancelamento",
+]
+
+RESPOSTA = BOLETO | {
+    "desconto2": {"codigo": "PERCENTUALDATAINFORMADA", "data": "2023-10-20", "taxa": 1.5, "valor": 0},
+    "mora": {"codigo": "VALORDIA", "data": "2023-11-01", "taxa": 0, "valor": 0.33},
+    "situacao": "CANCELADO",
+    "motivoCancelamento": "APEDIDODOCLIENTE",
+}
+
+
+def boleto_hidratado(data: dict) -> Boleto:
+    boleto = Boleto.from_dict(data)
+    cobranca = SimpleNamespace(boletos_emitidos={boleto.seu_numero: data})
+    boleto.set_emissao(cobranca)  # type: ignore[arg-type]
+    boleto.set_atualizacao(cobranca)  # type: ignore[arg-type]
+    return boleto
+
+
+def test_boleto_recuperado_equivalente() -> None:
+    esperado, boleto = boleto_hidratado(RESPOSTA), BoletoRecuperado(RESPOSTA)
+    assert isinstance(boleto, BoletoBase) and boleto.emitido and boleto.atualizado
+    assert not hasattr(boleto, "__dict__")
+    for nome in PROPRIEDADES:
+        assert getattr(boleto, nome) == getattr(esperado, nome), nome
+    assert boleto.to_dict() == esperado.to_dict()
+
+
+def test_boleto_recuperado_lazy(monkeypatch: pytest.MonkeyPatch) -> None:
+    chamadas: list[dict] = []
+
+    def from_dict(data: dict) -> SimpleNamespace:
+        chamadas.append(data)
+        return SimpleNamespace(**data)
+
+    monkeypatch.setattr(Pessoa, "from_dict", from_dict)
+    boleto = BoletoRecuperado(RESPOSTA)
+    assert boleto.situacao == "CANCELADO" and boleto.valor_total_recebimento is None
+    assert not chamadas
+    assert boleto.pagador is boleto.pagador
+    assert len(chamadas) == 1
+
+
+def test_boleto_recuperado_somente_leitura() -> None:
+    boleto = BoletoRecuperado(RESPOSTA)
+    with pytest.raises(BoletoJaEmitido):
+        boleto.multa = ComponenteFinanceiro("TAXA", boleto.data_vencimento, 2)
+    with pytest.raises(AttributeError):
+        boleto.situacao = "PAGO"  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        boleto.data["situacao"] = "PAGO"  # type: ignore[index]
+    assert not hasattr(boleto, "_Boleto__multa")
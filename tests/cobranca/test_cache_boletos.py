@@ -0,0 +1,89 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from intersdk.cobranca import CacheBoletos
+from tests.cobranca.test_cobranca import criar_inter
+
+
+class Relogio:
+    def __init__(self) -> None:
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+def test_cache_ttl_por_situacao() -> None:
+    relogio = Relogio()
+    cache = CacheBoletos(ttls={"EMABERTO": 10}, relogio=relogio)
+    cache.set("1", {"situacao": "EMABERTO"})
+    cache.set("2", {"situacao": "PAGO"})
+    relogio.agora = 9
+    assert cache.get("1") is not None
+    relogio.agora = 10
+    assert cache.get("1") is None
+    relogio.agora = 10**9
+    assert cache.get("2") == {"situacao": "PAGO"}
+
+
+def test_cache_lru() -> None:
+    cache = CacheBoletos(maxsize=2)
+    cache.set("1", {"situacao": "PAGO"})
+    cache.set("2", {"situacao": "PAGO"})
+    assert cache.get("1") is not None
+    cache.set("3", {"situacao": "PAGO"})
+    assert cache.get("2") is None and cache.get("1") is not None and len(cache) == 2
+
+
+def test_cache_agrupa_buscas_concorrentes() -> None:
+    cache = CacheBoletos()
+    chamadas = []
+
+    def buscar(nosso_numero: str) -> dict:
+        chamadas.append(nosso_numero)
+        time.sleep(0.05)
+        return {"situacao": "EMABERTO"}
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        resultados = list(executor.map(lambda _: cache.obter("1", buscar), range(32)))
+    assert chamadas == ["1"]
+    assert all(resultado is resultados[0] for resultado in resultados)
+
+
+def test_cache_erro_e_invalidacao_durante_busca() -> None:
+    cache = CacheBoletos()
+
+    def falhar(_: str) -> dict:
+        raise RuntimeError("falha")
+
+    with pytest.raises(RuntimeError):
+        cache.obter("1", falhar)
+    assert cache.get("1") is None
+
+    iniciou, liberar = threading.Event(), threading.Event()
+
+    def buscar_lento(_: str) -> dict:
+        iniciou.set()
+        liberar.wait()
+        return {"situacao": "EMABERTO"}
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        futuro = executor.submit(cache.obter, "1", buscar_lento)
+        iniciou.wait()
+        cache.invalidar("1")
+        liberar.set()
+        assert futuro.result() == {"situacao": "EMABERTO"}
+    assert cache.get("1") is None
+
+
+def test_cobranca_com_cache(servidor_inter) -> None:
+    with criar_inter(servidor_inter) as inter:
+        inter.cobranca.cache = CacheBoletos()
+        assert inter.cobranca.recuperar_boleto("7").nosso_numero == "7"
+        assert inter.cobranca.recuperar_boleto("7").situacao == "EMABERTO"
+        inter.cobranca.cancelar_boleto("7", "APEDIDODOCLIENTE")
+        inter.cobranca.recuperar_boleto("7")
+    assert servidor_inter.requisicoes.count(("GET", "/cobranca/v2/boletos/7")) == 2
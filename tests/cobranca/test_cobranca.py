@@ -0,0 +1,54 @@
+from datetime import date
+from pathlib import Path
+
+from intersdk import Inter
+from intersdk.autenticacao import Autenticacao
+
+
+def criar_inter(servidor) -> Inter:
+    return Inter(
+        Autenticacao(
+            servidor.certificate_path,
+            servidor.private_key_path,
+            client_id="client_id",
+            client_secret="client_secret",
+            base_url=servidor.base_url,
+            ca_certificate_path=servidor.certificate_path,
+            pool_maxsize=4,
+        )
+    )
+
+
+def test_emitir_boletos(servidor_inter, criar_boleto) -> None:
+    boletos = (criar_boleto(str(i) if i % 10 else "invalido") for i in range(1, 101))
+    with criar_inter(servidor_inter) as inter:
+        resultados = list(inter.cobranca.emitir_boletos(boletos, max_workers=4))
+    assert len(resultados) == 100
+    assert [resultado.item.seu_numero for resultado in resultados if not resultado.ok] == ["invalido"] * 10
+    assert all(resultado.item.emitido for resultado in resultados if resultado.ok)
+    assert servidor_inter.requisicoes.count(("POST", "/cobranca/v2/boletos")) == 90
+
+
+def test_listar_boletos(servidor_inter) -> None:
+    servidor_inter.total_boletos = 250
+    with criar_inter(servidor_inter) as inter:
+        boletos = inter.cobranca.listar_boletos(date(2023, 10, 1), date(2023, 10, 31), itens_por_pagina=100)
+        assert next(boletos).nosso_numero == "0"
+        assert [boleto.nosso_numero for boleto in boletos] == [str(i) for i in range(1, 250)]
+    paginas = [path for metodo, path in servidor_inter.requisicoes if metodo == "GET"]
+    assert len(paginas) == 3
+    assert "paginaAtual=2" in paginas[-1] and "filtrarDataPor=VENCIMENTO" in paginas[-1]
+
+
+def test_recuperar_boletos_pdf(servidor_inter, tmp_path: Path) -> None:
+    (tmp_path / "3.pdf").write_bytes(b"existente")
+    with criar_inter(servidor_inter) as inter:
+        resultados = list(inter.cobranca.recuperar_boletos_pdf(map(str, range(10)), str(tmp_path), max_workers=4))
+    assert [resultado.item for resultado in resultados if not resultado.ok] == ["3"]
+    assert all(
+        resultado.resultado is not None and resultado.resultado.read_bytes().startswith(b"%PDF")
+        for resultado in resultados
+        if resultado.ok
+    )
+    assert (tmp_path / "3.pdf").read_bytes() == b"existente"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [f"{i}.pdf" for i in range(10)]
@@ -0,0 +1,127 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from intersdk import Inter
+from intersdk.autenticacao import Autenticacao
+from intersdk.cobranca import CodigoBarras
+from intersdk.cobranca.codigo_barras import (
+    analisar_linhas_digitaveis,
+    codigo_barras_valido,
+    linha_digitavel_valida,
+    validar_linhas_digitaveis,
+)
+from intersdk.transporte import TransporteFalso
+
+CODIGO_BARRAS = "00193373700000001000500940144816060680935031"
+LINHA_DIGITAVEL = "00190500954014481606906809350314337370000000100"
+
+
+def _mod10(campo: str) -> int:
+    soma = 0
+    for posicao, digito in enumerate(reversed(campo)):
+        produto = int(digito) * (2 if posicao % 2 == 0 else 1)
+        soma += produto // 10 + produto % 10
+    return (10 - soma % 10) % 10
+
+
+def _mod11(codigo: str) -> int:
+    soma = sum(int(digito) * (2 + posicao % 8) for posicao, digito in enumerate(reversed(codigo)))
+    digito = 11 - soma % 11
+    return 1 if digito in (0, 10, 11) else digito
+
+
+def linha_valida_referencia(linha: str) -> bool:
+    # implementação direta, dígito a dígito
+    linha = linha.replace(".", "").replace(" ", "")
+    if len(linha) != 47 or not linha.isdigit():
+        return False
+    campos = ((linha[0:9], linha[9]), (linha[10:20], linha[20]), (linha[21:31], linha[31]))
+    if any(_mod10(campo) != int(dv) for campo, dv in campos):
+        return False
+    codigo = linha[0:4] + linha[33:47] + linha[4:9] + linha[10:20] + linha[21:31]
+    return _mod11(codigo) == int(linha[32])
+
+
+def linhas_aleatorias(total: int) -> list[str]:
+    aleatorio = random.Random(0)
+    linhas = [
+        CodigoBarras.gerar(
+            date(2026, 1, 1) + timedelta(days=aleatorio.randrange(365)),
+            aleatorio.randrange(250, 10**7) / 100,
+            f"{aleatorio.randrange(10**25):025d}",
+        ).linha_digitavel
+        for _ in range(total)
+    ]
+    # um décimo das linhas com um dígito trocado
+    for indice in range(0, total, 10):
+        linha = linhas[indice]
+        linhas[indice] = linha[:20] + str((int(linha[20]) + 1) % 10) + linha[21:]
+    return linhas
+
+
+def test_codigo_barras() -> None:
+    codigo_barras = CodigoBarras.from_linha_digitavel("00190.50095 40144.816069 06809.350314 3 37370000000100")
+    assert codigo_barras.codigo == CODIGO_BARRAS and codigo_barras.linha_digitavel == LINHA_DIGITAVEL
+    assert (codigo_barras.banco, codigo_barras.moeda, codigo_barras.valor) == ("001", "9", 1.0)
+    assert codigo_barras.fator_vencimento == 3737
+    assert codigo_barras.vencimento(date(2008, 1, 1)) == date(2007, 12, 31)
+    # depois de 21/02/2025 o fator recomeça em 1000
+    assert codigo_barras.vencimento(date(2032, 1, 1)) == date(2032, 8, 21)
+
+
+@pytest.mark.parametrize(
+    "vencimento", [date(2000, 7, 3), date(2025, 2, 21), date(2025, 2, 22), date(2026, 10, 18), None]
+)
+def test_gerar(vencimento: date | None) -> None:
+    codigo_barras = CodigoBarras.gerar(vencimento, 1234.56, "0" * 24 + "1")
+    assert codigo_barras.vencimento(vencimento) == vencimento and codigo_barras.valor == 1234.56
+    assert CodigoBarras.from_linha_digitavel(codigo_barras.linha_digitavel) == codigo_barras
+    assert codigo_barras_valido(codigo_barras.codigo)
+
+
+@pytest.mark.parametrize(
+    ("linha_digitavel", "valida"),
+    [
+        (LINHA_DIGITAVEL, True),
+        ("00190500944014481606906809350314337370000000100", False),  # DV do campo 1
+        ("00190500954014481606906809350314437370000000100", False),  # DV geral
+        ("00190500954014481606906809350314337370000000200", False),  # valor alterado
+        (LINHA_DIGITAVEL[:-1], False),
+        (LINHA_DIGITAVEL[:-1] + "a", False),
+        ("", False),
+    ],
+)
+def test_linha_digitavel_valida(linha_digitavel: str, valida: bool) -> None:
+    assert linha_digitavel_valida(linha_digitavel) is valida
+    assert validar_linhas_digitaveis([linha_digitavel]) == [valida]
+    if valida:
+        assert analisar_linhas_digitaveis([linha_digitavel]) == [CodigoBarras(CODIGO_BARRAS)]
+    else:
+        assert analisar_linhas_digitaveis([linha_digitavel]) == [None]
+        with pytest.raises(ValueError):
+            CodigoBarras.from_linha_digitavel(linha_digitavel)
+
+
+def test_validar_linhas_digitaveis_referencia() -> None:
+    linhas = linhas_aleatorias(2000)
+    assert validar_linhas_digitaveis(linhas) == [linha_valida_referencia(linha) for linha in linhas]
+    assert sum(validar_linhas_digitaveis(linhas)) == 2000 - 2000 // 10
+
+
+def test_codigo_barras_invalido() -> None:
+    with pytest.raises(ValueError):
+        CodigoBarras(CODIGO_BARRAS[:4] + "4" + CODIGO_BARRAS[5:])
+    with pytest.raises(ValueError):
+        CodigoBarras.gerar(None, 10**8, "0" * 25)
+    assert not codigo_barras_valido(CODIGO_BARRAS[:-1])
+
+
+def test_boleto_emitido(criar_boleto) -> None:
+    with Inter(Autenticacao("", "", "client_id", "client_secret", transporte=TransporteFalso())) as inter:
+        boleto = criar_boleto("1")
+        inter.cobranca.emitir_boleto(boleto)
+    codigo_barras = CodigoBarras.from_linha_digitavel(boleto.linha_digitavel)
+    assert codigo_barras.codigo == boleto.codigo_barras
+    assert (codigo_barras.vencimento(), codigo_barras.valor) == (boleto.data_vencimento, boleto.valor_nominal)
@@ -0,0 +1,22 @@
+from datetime import date
+
+import pytest
+
+from intersdk.cobranca import Boleto, ComponenteFinanceiro, Endereco, Pessoa
+
+ENDERECO = Endereco("Rua Um", "1", "Centro", "São Paulo", "SP", "01001000")
+PESSOA = Pessoa("FISICA", "52998224725", "Fulano de Tal", ENDERECO)
+
+
+@pytest.mark.parametrize(
+    "componente",
+    [
+        Boleto("1", 2.5, date.today(), 0, PESSOA),
+        PESSOA,
+        ENDERECO,
+        ComponenteFinanceiro("TAXA", date.today(), 1),
+    ],
+    ids=type,
+)
+def test_componentes_sem_dict(componente: object) -> None:
+    assert not hasattr(componente, "__dict__")
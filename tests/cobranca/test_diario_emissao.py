@@ -0,0 +1,52 @@
+import pytest
+import requests
+
+from intersdk.cobranca import DiarioEmissao
+from tests.cobranca.test_cobranca import criar_inter
+
+
+def test_diario_emissao(tmp_path) -> None:
+    diario = DiarioEmissao(str(tmp_path / "diario.db"))
+    diario.registrar_intencao("1")
+    diario.registrar_intencao("2")
+    diario.registrar_confirmacao("1", {"nossoNumero": "10", "codigoBarras": "cb", "linhaDigitavel": "ld"})
+    diario.close()
+
+    diario = DiarioEmissao(str(tmp_path / "diario.db"))
+    registro = diario.estado("1")
+    assert registro is not None and registro.estado == "CONFIRMADO" and registro.nosso_numero == "10"
+    assert [registro.seu_numero for registro in diario.registros("PENDENTE")] == ["2"]
+    assert diario.estado("3") is None
+
+
+def test_emitir_boletos_retomando(servidor_inter, criar_boleto, tmp_path) -> None:
+    diario = DiarioEmissao(str(tmp_path / "diario.db"))
+    with criar_inter(servidor_inter) as inter:
+        inter.cobranca.diario = diario
+        inter.cobranca.emitir_boleto(criar_boleto("1"))
+        # queda simulada: a intenção de "2" e "9" foi gravada, mas o resultado não
+        diario.registrar_intencao("2")
+        diario.registrar_intencao("9")
+        servidor_inter.total_boletos = 5
+        servidor_inter.requisicoes.clear()
+
+        boletos = [criar_boleto(seu_numero) for seu_numero in ("1", "2", "9", "4")]
+        resultados = list(inter.cobranca.emitir_boletos(boletos, max_workers=1, retomar=True))
+
+    assert all(resultado.ok and resultado.item.emitido for resultado in resultados)
+    assert boletos[1].nosso_numero == "2"
+    # "1" já confirmado não gera requisições; "2" é conciliado; "9" não é encontrado e é emitido
+    assert [metodo for metodo, _ in servidor_inter.requisicoes].count("GET") == 2
+    assert servidor_inter.requisicoes.count(("POST", "/cobranca/v2/boletos")) == 2
+    assert {registro.estado for registro in diario.registros()} == {"CONFIRMADO"}
+
+
+def test_emitir_boleto_recusado(servidor_inter, criar_boleto, tmp_path) -> None:
+    diario = DiarioEmissao(str(tmp_path / "diario.db"))
+    servidor_inter.falhas = [400]
+    with criar_inter(servidor_inter) as inter:
+        inter.cobranca.diario = diario
+        with pytest.raises(requests.HTTPError):
+            inter.cobranca.emitir_boleto(criar_boleto("1"))
+    registro = diario.estado("1")
+    assert registro is not None and registro.estado == "FALHOU"
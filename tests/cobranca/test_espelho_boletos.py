@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+from intersdk import Inter
+from intersdk.autenticacao import Autenticacao
+from intersdk.cobranca import BoletoRecuperado, EspelhoBoletos
+from intersdk.transporte import TransporteFalso
+
+
+def dados_boleto(nosso_numero: int, situacao: str = "EMABERTO", data_hora_situacao: str = "2023-10-01T10:00") -> dict:
+    return {
+        "nossoNumero": f"{nosso_numero:011d}",
+        "seuNumero": str(nosso_numero),
+        "situacao": situacao,
+        "dataHoraSituacao": data_hora_situacao,
+        "dataVencimento": (date(2023, 10, 1) + timedelta(days=nosso_numero % 30)).isoformat(),
+        "valorTotalRecebimento": 10 if situacao == "PAGO" else 0,
+        "pagador": {"cpfCnpj": "52998224725" if nosso_numero % 2 else "11144477735"},
+    }
+
+
+def test_espelho_boletos(tmp_path: Path) -> None:
+    espelho = EspelhoBoletos(str(tmp_path / "espelho.db"))
+    assert espelho.salvar_lote((dados_boleto(i) for i in range(1, 101)), tamanho_lote=7) == 100
+    espelho.salvar(BoletoRecuperado(dados_boleto(5, "PAGO", "2023-10-02T10:00")))
+    # uma versão mais antiga não sobrescreve a gravada
+    espelho.salvar(dados_boleto(5, "EMABERTO", "2023-10-01T12:00"))
+
+    assert len(espelho) == 100
+    pago = espelho.obter("00000000005")
+    assert pago is not None and pago.situacao == "PAGO" and pago.valor_total_recebimento == 10
+    assert [boleto.nosso_numero for boleto in espelho.consultar(situacao="PAGO")] == ["00000000005"]
+    assert espelho.contar(recebido_de=1) == 1 and espelho.obter("0") is None
+
+    vencimentos = [boleto.data_vencimento for boleto in espelho.consultar(cpf_cnpj="11144477735", tamanho_lote=3)]
+    assert len(vencimentos) == 50 and vencimentos == sorted(vencimentos)
+    assert espelho.contar(vencimento_de=date(2023, 10, 2), vencimento_ate=date(2023, 10, 3)) == 8
+    espelho.close()
+
+
+def test_cobranca_espelho(criar_boleto, tmp_path: Path) -> None:
+    transporte, espelho = TransporteFalso(), EspelhoBoletos(str(tmp_path / "espelho.db"))
+    autenticacao = Autenticacao("", "", "client_id", "client_secret", transporte=transporte)
+    with Inter(autenticacao, espelho_boletos=espelho) as inter:
+        boletos = [criar_boleto(str(i)) for i in range(1, 4)]
+        for boleto in boletos:
+            inter.cobranca.emitir_boleto(boleto)
+        emitido = espelho.obter(boletos[0].nosso_numero)
+        assert emitido is not None and emitido.situacao == "EMABERTO"
+        assert emitido.linha_digitavel == boletos[0].linha_digitavel and emitido.multa is None
+
+        inter.cobranca.cancelar_boleto(boletos[1].nosso_numero, "ACERTOS")
+        assert [boleto.seu_numero for boleto in espelho.consultar(situacao="CANCELADO")] == ["2"]
+
+        inter.cobranca.recuperar_boleto(boletos[0].nosso_numero)
+        recuperado = espelho.obter(boletos[0].nosso_numero)
+        assert recuperado is not None and recuperado.conta_corrente == transporte.conta_corrente
+
+        transporte.pagar(boletos[2].nosso_numero)
+        hoje = date.today()
+        assert inter.cobranca.sincronizar_espelho(hoje - timedelta(days=1), hoje + timedelta(days=1)) == 3
+        assert [boleto.seu_numero for boleto in espelho.consultar(situacao="PAGO")] == ["3"]
+        assert espelho.contar(situacao="CANCELADO") == 1
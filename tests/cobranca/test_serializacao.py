@@ -0,0 +1,78 @@
+import json
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import date, timedelta
+from enum import IntEnum
+
+import pytest
+
+from intersdk.cobranca import Boleto, ComponenteFinanceiro, Pessoa
+from intersdk.cobranca.serializacao import serializar_boleto, validar_e_serializar
+
+VENCIMENTO = date.today() + timedelta(days=10)
+
+
+class Prazo(IntEnum):
+    CURTO = 5
+    LONGO = 30
+
+
+ALTERACOES: list[dict] = [
+    {},
+    {"valor_nominal": 10},
+    {"mensagem": ["linha única"]},
+    {"mensagem": ['aspas " e \\ barra', "ção", "3", "4", "5"]},
+    {"descontos": [ComponenteFinanceiro("TAXA", VENCIMENTO, 1.5)]},
+    {"descontos": [ComponenteFinanceiro("VALOR", VENCIMENTO, 2)] * 3},
+    {"multa": ComponenteFinanceiro("TAXA", VENCIMENTO, 2), "mora": ComponenteFinanceiro("VALOR", VENCIMENTO, 0.33)},
+    {"beneficiario_final": Pessoa("JURIDICA", "11222333000181", "Empresa Ltda")},
+    {"valor_nominal": Prazo.LONGO, "num_dias_agenda": Prazo.CURTO},
+    {"multa": ComponenteFinanceiro("VALOR", VENCIMENTO + timedelta(days=1), Prazo.CURTO)},
+]
+
+
+@pytest.mark.parametrize("alteracoes", ALTERACOES)
+def test_serializar_boleto(criar_boleto: Callable[[str], Boleto], alteracoes: dict) -> None:
+    boleto = criar_boleto("1")
+    for nome, valor in alteracoes.items():
+        setattr(boleto, nome, valor)
+    corpo = serializar_boleto(boleto)
+    assert corpo.isascii()
+    assert json.loads(corpo) == boleto.to_dict()
+    assert list(json.loads(corpo)) == list(boleto.to_dict())
+
+
+def test_serializar_boleto_pagador_completo(criar_boleto: Callable[[str], Boleto]) -> None:
+    boleto = criar_boleto("1")
+    boleto.pagador = replace(boleto.pagador, email="fulano@exemplo.com", telefone="11999998888")
+    assert json.loads(serializar_boleto(boleto)) == boleto.to_dict()
+
+
+@pytest.mark.parametrize(
+    "alteracoes",
+    [
+        {"num_dias_agenda": True},
+        {"valor_nominal": True},
+        {"descontos": [ComponenteFinanceiro("VALOR", VENCIMENTO, True)]},
+    ],
+)
+def test_validar_e_serializar_recusa_bool(criar_boleto: Callable[[str], Boleto], alteracoes: dict) -> None:
+    boleto = criar_boleto("1")
+    for nome, valor in alteracoes.items():
+        setattr(boleto, nome, valor)
+    with pytest.raises(TypeError):
+        validar_e_serializar(boleto)
+
+
+@pytest.mark.parametrize("valor", [float("inf"), float("nan")])
+def test_serializar_boleto_nao_finito(criar_boleto: Callable[[str], Boleto], valor: float) -> None:
+    boleto = criar_boleto("1")
+    boleto.valor_nominal = valor
+    with pytest.raises(ValueError):
+        serializar_boleto(boleto)
+    boleto = criar_boleto("1")
+    boleto.multa = ComponenteFinanceiro("TAXA", VENCIMENTO + timedelta(days=1), valor)
+    with pytest.raises(ValueError):
+        serializar_boleto(boleto)
+    with pytest.raises(ValueError):
+        validar_e_serializar(boleto)
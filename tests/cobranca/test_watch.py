@@ -0,0 +1,49 @@
+import threading
+from datetime import date
+from pathlib import Path
+
+from intersdk import Inter
+from intersdk.autenticacao import Autenticacao
+from intersdk.cobranca import BoletoRecuperado, CursorWatch
+from intersdk.transporte import TransporteFalso
+
+
+def test_watch(criar_boleto, tmp_path: Path) -> None:
+    transporte, cursor_path = TransporteFalso(), str(tmp_path / "cursor.json")
+    with Inter(Autenticacao("", "", "client_id", "client_secret", transporte=transporte)) as inter:
+        boletos = [criar_boleto(str(i)) for i in range(1, 3)]
+        for boleto in boletos:
+            inter.cobranca.emitir_boleto(boleto)
+        mudancas = inter.cobranca.watch(cursor_path, intervalo=0.01)
+        assert [next(mudancas).seu_numero for _ in range(2)] == ["1", "2"]
+        transporte.pagar(boletos[0].nosso_numero)
+        pago = next(mudancas)
+        assert (pago.seu_numero, pago.situacao) == ("1", "PAGO")
+        mudancas.close()
+
+        # o cursor salvo antes do pagamento faz o pagamento ser entregue de novo, e apenas ele
+        parar = threading.Event()
+        threading.Timer(0.2, parar.set).start()
+        assert [boleto.situacao for boleto in inter.cobranca.watch(cursor_path, intervalo=0.01, parar=parar)] == [
+            "PAGO"
+        ]
+        parar.clear()
+        threading.Timer(0.2, parar.set).start()
+        assert not list(inter.cobranca.watch(cursor_path, intervalo=0.01, parar=parar))
+
+
+def test_cursor_watch() -> None:
+    cursor = CursorWatch(date(2023, 10, 1))
+    boleto = BoletoRecuperado({"nossoNumero": "1", "situacao": "EMABERTO", "dataHoraSituacao": "2023-10-01T23:00"})
+    assert cursor.registrar(boleto) and not cursor.registrar(boleto)
+    assert CursorWatch.from_dict(cursor.to_dict()) == cursor
+    cursor.avancar(date(2023, 10, 1))
+    assert "1" in cursor.vistos
+    # o dia é o de data_situacao, não o prefixo de dataHoraSituacao
+    assert cursor.vistos["1"] == ("EMABERTO", boleto.data_situacao.isoformat())
+    assert cursor.registrar(BoletoRecuperado({"nossoNumero": "2", "situacao": "PAGO"}))
+    assert cursor.vistos["2"] == ("PAGO", "2023-10-01")
+    cursor.avancar(date(2023, 10, 2))
+    assert cursor.data == date(2023, 10, 2) and list(cursor.vistos) == ["1"]
+    cursor.avancar(date(2023, 10, 3))
+    assert not cursor.vistos
@@ -0,0 +1,111 @@
+import io
+import json
+import queue
+import socket
+import ssl
+from datetime import date
+
+import requests
+
+from intersdk import Inter
+from intersdk.autenticacao import Autenticacao
+from intersdk.cobranca import (
+    AtualizacaoBoleto,
+    BoletoRecuperado,
+    CacheBoletos,
+    ReceptorWebhook,
+)
+from intersdk.transporte import TransporteFalso
+
+
+def criar_inter(transporte: TransporteFalso, cache: CacheBoletos | None = None) -> Inter:
+    return Inter(Autenticacao("", "", "client_id", "client_secret", transporte=transporte), cache_boletos=cache)
+
+
+def test_registrar_consultar_excluir_webhook() -> None:
+    with criar_inter(TransporteFalso()) as inter:
+        assert inter.cobranca.consultar_webhook() is None
+        inter.cobranca.registrar_webhook("https://exemplo.com.br/webhook")
+        webhook = inter.cobranca.consultar_webhook()
+        assert webhook is not None and webhook.webhook_url == "https://exemplo.com.br/webhook"
+        assert webhook.criacao is not None and webhook.criacao.tzinfo is not None
+        inter.cobranca.excluir_webhook()
+        assert inter.cobranca.consultar_webhook() is None
+
+
+def test_receptor_webhook(criar_boleto) -> None:
+    transporte, cache = TransporteFalso(), CacheBoletos()
+    atualizacoes: queue.Queue[AtualizacaoBoleto] = queue.Queue()
+    with criar_inter(transporte, cache) as inter, ReceptorWebhook(atualizacoes, cache).servir(
+        "127.0.0.1", 0
+    ) as servidor:
+        inter.cobranca.registrar_webhook(f"{servidor.url}/webhook")
+        boleto = criar_boleto("1")
+        inter.cobranca.emitir_boleto(boleto)
+        recuperado = inter.cobranca.recuperar_boleto(boleto.nosso_numero)
+        assert isinstance(recuperado, BoletoRecuperado) and len(cache) == 1
+
+        transporte.pagar(boleto.nosso_numero, 25.5)
+        atualizacao = atualizacoes.get(timeout=5)
+        assert (atualizacao.nosso_numero, atualizacao.seu_numero) == (boleto.nosso_numero, "1")
+        assert atualizacao.situacao == "PAGO" and atualizacao.valor_total_recebimento == 25.5
+        assert atualizacao.data_situacao == date.today()
+        assert len(cache) == 0
+        atualizado = atualizacao.aplicar(recuperado)
+        assert atualizado.situacao == "PAGO" and atualizado.pagador.nome == "Fulano de Tal"
+
+        inter.cobranca.emitir_boleto(outro := criar_boleto("2"))
+        inter.cobranca.cancelar_boleto(outro.nosso_numero, "ACERTOS")
+        assert atualizacoes.get(timeout=5).situacao == "CANCELADO"
+
+        assert requests.post(servidor.url, data=b"{", timeout=5).status_code == 400
+        assert requests.post(servidor.url, json=[{"situacao": "PAGO"}], timeout=5).status_code == 400
+        assert requests.post(servidor.url, data=b"[" + b" " * (1024 * 1024), timeout=5).status_code == 413
+        with socket.create_connection(("127.0.0.1", servidor.server_address[1])) as conexao:
+            conexao.sendall(b"POST / HTTP/1.1\r\nHost: localhost\r\nContent-Length: -1\r\n\r\n[]")
+            assert conexao.recv(1024).startswith(b"HTTP/1.1 400")
+
+
+def test_servidor_webhook_tls(certificado: tuple[str, str]) -> None:
+    contexto = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    contexto.load_cert_chain(*certificado)
+    atualizacoes: queue.Queue[AtualizacaoBoleto] = queue.Queue()
+    with ReceptorWebhook(atualizacoes).servir("127.0.0.1", 0, contexto) as servidor:
+        host, port = servidor.server_address[:2]
+        # uma conexão que nunca inicia o handshake não impede as demais
+        with socket.create_connection((str(host), port)):
+            corpo = [{"nossoNumero": "1", "situacao": "PAGO", "dataHoraSituacao": "2023-10-01T12:00:00.000-03:00"}]
+            resposta = requests.post(f"https://localhost:{port}", json=corpo, verify=certificado[0], timeout=5)
+        assert resposta.status_code == 200 and atualizacoes.get(timeout=5).nosso_numero == "1"
+
+
+def test_receptor_webhook_wsgi() -> None:
+    recebidas: list[AtualizacaoBoleto] = []
+
+    def falhar(atualizacao: AtualizacaoBoleto) -> None:
+        recebidas.append(atualizacao)
+        if len(recebidas) > 1:
+            raise RuntimeError("fila indisponível")
+
+    receptor = ReceptorWebhook(falhar)
+    statuses: list[str] = []
+    corpo = json.dumps([{"nossoNumero": "1", "situacao": "PAGO", "dataHoraSituacao": "2023-10-01T12:00:00.000-03:00"}])
+    for _ in range(2):
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_LENGTH": str(len(corpo)),
+            "wsgi.input": io.BytesIO(corpo.encode()),
+        }
+        assert receptor(environ, lambda status, _: statuses.append(status)) == [b""]
+    # o segundo callback falha com 500 para que o Inter o reenvie
+    assert [status.split()[0] for status in statuses] == ["200", "500"]
+    assert recebidas[0].data_situacao == date(2023, 10, 1) and recebidas[0].valor_total_recebimento is None
+
+    entrada = io.BytesIO(b"[]")
+    environ = {"REQUEST_METHOD": "POST", "CONTENT_LENGTH": "11", "wsgi.input": entrada}
+    ReceptorWebhook(falhar, tamanho_maximo=10)(environ, lambda status, _: statuses.append(status))
+    assert statuses[-1].startswith("413") and entrada.tell() == 0
+    for tamanho in ("-1", "abc", "+2"):
+        environ = {"REQUEST_METHOD": "POST", "CONTENT_LENGTH": tamanho, "wsgi.input": entrada}
+        ReceptorWebhook(falhar, tamanho_maximo=10)(environ, lambda status, _: statuses.append(status))
+        assert statuses[-1].startswith("400") and entrada.tell() == 0
@@ -0,0 +1,194 @@
+import base64
+import json
+import shutil
+import ssl
+import subprocess
+import threading
+from collections.abc import Callable, Iterator
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from intersdk.cobranca import Boleto, Endereco, Pessoa
+
+BOLETO = {
+    "nossoNumero": "00000000001",
+    "seuNumero": "1",
+    "codigoBarras": "07791950700000250000001112054632100000000001",
+    "linhaDigitavel": "07790001161205463210800000000019195070000025000",
+    "situacao": "EMABERTO",
+    "dataHoraSituacao": "2023-10-01T12:00:00.000-03:00",
+    "valorNominal": 25.0,
+    "dataEmissao": "2023-10-01",
+    "dataVencimento": "2023-10-31",
+    "dataLimite": "2023-11-30",
+    "valorTotalRecebimento": 0,
+    "origem": "EXTERNA",
+    "contaCorrente": "12345678",
+    "codigoEspecie": "OUTROS",
+    "mensagem": {"linha1": "Mensagem", "linha2": "", "linha3": "", "linha4": "", "linha5": ""},
+    "desconto1": {"codigo": "NAOTEMDESCONTO", "taxa": 0, "valor": 0},
+    "desconto2": {"codigo": "NAOTEMDESCONTO", "taxa": 0, "valor": 0},
+    "desconto3": {"codigo": "NAOTEMDESCONTO", "taxa": 0, "valor": 0},
+    "multa": {"codigo": "NAOTEMMULTA", "taxa": 0, "valor": 0},
+    "mora": {"codigo": "ISENTO", "taxa": 0, "valor": 0},
+    "pagador": {
+        "cpfCnpj": "52998224725",
+        "tipoPessoa": "FISICA",
+        "nome": "Fulano de Tal",
+        "endereco": "Rua Um",
+        "numero": "1",
+        "complemento": "",
+        "bairro": "Centro",
+        "cidade": "São Paulo",
+        "uf": "SP",
+        "cep": "01001000",
+        "email": "",
+        "ddd": "",
+        "telefone": "",
+    },
+}
+
+
+class ServidorInterHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "ServidorInter"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def send_json(self, status: int, data: dict | None) -> None:
+        body = json.dumps(data).encode() if data is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def listar(self) -> None:
+        query = {chave: valor[0] for chave, valor in parse_qs(urlsplit(self.path).query).items()}
+        tamanho, pagina = int(query["itensPorPagina"]), int(query["paginaAtual"])
+        total = self.server.total_boletos
+        inicio, fim = pagina * tamanho, min((pagina + 1) * tamanho, total)
+        content = [BOLETO | {"nossoNumero": str(i), "seuNumero": str(i)} for i in range(inicio, fim)]
+        self.send_json(
+            200,
+            {
+                "totalPaginas": -(-total // tamanho),
+                "totalElementos": total,
+                "primeiraPagina": pagina == 0,
+                "ultimaPagina": fim >= total,
+                "tamanhoPagina": tamanho,
+                "numeroDeElementos": len(content),
+                "content": content,
+            },
+        )
+
+    def falhar(self) -> bool:
+        if not self.path.startswith("/cobranca") or not self.server.falhas:
+            return False
+        status = self.server.falhas.pop(0)
+        self.send_response(status)
+        self.send_header("Retry-After", "0")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        return True
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        self.server.requisicoes.append(("GET", self.path))
+        if self.falhar():
+            return
+        if urlsplit(self.path).path == "/cobranca/v2/boletos":
+            self.listar()
+        elif self.path.endswith("/pdf"):
+            self.send_json(200, {"pdf": base64.b64encode(self.server.pdf).decode()})
+        else:
+            self.send_json(200, BOLETO | {"nossoNumero": self.path.rsplit("/", 1)[-1]})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        body = self.read_body()
+        self.server.requisicoes.append(("POST", self.path))
+        if self.falhar():
+            return
+        if self.path == "/oauth/v2/token":
+            scope = dict(item.split("=", 1) for item in body.decode().split("&"))["scope"].replace("+", " ")
+            self.send_json(200, {"token_type": "Bearer", "access_token": "token", "scope": scope, "expires_in": 3600})
+        elif self.path.endswith("/cancelar"):
+            self.send_json(202, None)
+        else:
+            self.send_json(200, {k: BOLETO[k] for k in ("nossoNumero", "codigoBarras", "linhaDigitavel")})
+
+
+class ServidorInter(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, certificate_path: str, private_key_path: str) -> None:
+        super().__init__(("127.0.0.1", 0), ServidorInterHandler)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certificate_path, private_key_path)
+        context.verify_mode = ssl.CERT_REQUIRED
+        context.load_verify_locations(certificate_path)
+        self.socket = context.wrap_socket(self.socket, server_side=True)
+        self.certificate_path = certificate_path
+        self.private_key_path = private_key_path
+        self.requisicoes: list[tuple[str, str]] = []
+        self.total_boletos = 0
+        # status devolvidos, em ordem, antes de atender normalmente as próximas requisições à API de cobrança
+        self.falhas: list[int] = []
+        self.pdf = b"%PDF-1.4\n"
+
+    @property
+    def base_url(self) -> str:
+        return f"https://localhost:{self.server_address[1]}"
+
+
+@pytest.fixture(scope="session")
+def certificado(tmp_path_factory: pytest.TempPathFactory) -> tuple[str, str]:
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl não disponível")
+    path = tmp_path_factory.mktemp("certificado")
+    certificate_path, private_key_path = path / "cert.pem", path / "key.pem"
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=localhost"]
+        + ["-addext", "subjectAltName=DNS:localhost", "-keyout", str(private_key_path), "-out", str(certificate_path)],
+        check=True,
+        capture_output=True,
+    )
+    return str(certificate_path), str(private_key_path)
+
+
+@pytest.fixture
+def servidor_inter(certificado: tuple[str, str]) -> Iterator[ServidorInter]:
+    servidor = ServidorInter(*certificado)
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    yield servidor
+    servidor.shutdown()
+    servidor.server_close()
+
+
+@pytest.fixture
+def criar_boleto() -> Callable[[str], Boleto]:
+    def criar(seu_numero: str) -> Boleto:
+        return Boleto(
+            seu_numero=seu_numero,
+            valor_nominal=25,
+            data_vencimento=date.today() + timedelta(days=10),
+            num_dias_agenda=30,
+            pagador=Pessoa(
+                tipo="FISICA",
+                cpf_cnpj="52998224725",
+                nome="Fulano de Tal",
+                endereco=Endereco(
+                    logradouro="Rua Um", numero="1", bairro="Centro", cidade="São Paulo", estado="SP", cep="01001000"
+                ),
+            ),
+        )
+
+    return criar
@@ -0,0 +1,34 @@
+import base64
+import io
+import json
+import random
+
+import pytest
+
+from intersdk.misc.base64_json import DecodificadorBase64Json
+
+
+@pytest.mark.parametrize("escapar_barras", [False, True])
+def test_decodificador_base64_json(escapar_barras: bool) -> None:
+    aleatorio = random.Random(0)
+    for _ in range(50):
+        dados = aleatorio.randbytes(aleatorio.randrange(3000))
+        corpo = json.dumps({"outro": 1, "pdf": base64.b64encode(dados).decode()})
+        if escapar_barras:
+            corpo = corpo.replace("/", "\\/")
+        destino = io.BytesIO()
+        decodificador = DecodificadorBase64Json("pdf", destino)
+        inicio = 0
+        while inicio < len(corpo):
+            tamanho = aleatorio.randrange(1, 64)
+            decodificador.feed(corpo[inicio : inicio + tamanho].encode())
+            inicio += tamanho
+        decodificador.finalizar()
+        assert destino.getvalue() == dados
+
+
+def test_decodificador_base64_json_incompleto() -> None:
+    decodificador = DecodificadorBase64Json("pdf", io.BytesIO())
+    decodificador.feed(b'{"pdf": "JVBE')
+    with pytest.raises(ValueError):
+        decodificador.finalizar()
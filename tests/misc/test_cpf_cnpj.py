@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from intersdk.misc.validators.cpf_cnpj import cnpj_valido, cpf_valido
+
+
+@pytest.mark.parametrize(
+    ("cpf", "valido"),
+    [
+        ("52998224725", True),
+        ("529.982.247-25", True),
+        ("52998224724", False),
+        ("11111111111", False),
+        ("5299822472", False),
+        ("529/982/247-25", False),
+        ("5299822472a", False),
+        ("", False),
+    ],
+)
+def test_cpf_valido(cpf: str, valido: bool) -> None:
+    assert cpf_valido(cpf) is valido
+
+
+@pytest.mark.parametrize(
+    ("cnpj", "valido"),
+    [
+        ("11222333000181", True),
+        ("11.222.333/0001-81", True),
+        ("11222333000182", False),
+        ("00000000000000", False),
+        ("12ABC34501DE35", True),
+        ("12.abc.345/01de-35", True),
+        ("12ABC34501DE36", False),
+        ("12ABC34501DEA5", False),
+        ("", False),
+    ],
+)
+def test_cnpj_valido(cnpj: str, valido: bool) -> None:
+    assert cnpj_valido(cnpj) is valido
+
+
+def test_equivalente_validate_docbr() -> None:
+    validate_docbr = pytest.importorskip("validate_docbr")
+    cpf, cnpj = validate_docbr.CPF(), validate_docbr.CNPJ()
+    aleatorio = random.Random(11)
+    for _ in range(5000):
+        for gerador, valido in ((cpf, cpf_valido), (cnpj, cnpj_valido)):
+            documento = gerador.generate(mask=aleatorio.random() < 0.5)
+            if aleatorio.random() < 0.5:
+                posicao = aleatorio.randrange(len(documento))
+                documento = documento[:posicao] + aleatorio.choice("0123456789./-") + documento[posicao + 1 :]
+            assert valido(documento) is gerador.validate(documento), documento
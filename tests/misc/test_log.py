@@ -0,0 +1,71 @@
+from collections.abc import Iterator
+
+import loguru
+import pytest
+
+import intersdk  # noqa: F401  # pylint: disable=unused-import
+from intersdk.misc.log import conferir_resposta, configurar_log, log_resposta, resumir
+
+
+class RespostaFalsa:
+    def __init__(self, texto: str) -> None:
+        self.texto = texto
+        self.lido = 0
+
+    @property
+    def text(self) -> str:
+        self.lido += 1
+        return self.texto
+
+    def raise_for_status(self) -> None:
+        raise RuntimeError(self.texto)
+
+
+@pytest.fixture
+def mensagens() -> Iterator[list[str]]:
+    capturadas: list[str] = []
+    handler = loguru.logger.add(lambda mensagem: capturadas.append(mensagem.record["message"]), level="DEBUG")
+    yield capturadas
+    loguru.logger.remove(handler)
+    configurar_log(ativo=False)
+
+
+def test_silencioso_por_padrao(mensagens: list[str]) -> None:
+    response = RespostaFalsa('{"pdf": "JVBERi0="}')
+    log_resposta(response)
+    assert not mensagens and response.lido == 0
+
+
+def test_resumir() -> None:
+    configurar_log(limite_corpo=40)
+    try:
+        assert resumir('{"access_token": "segredo", "scope": "boleto-cobranca.read"}') == (
+            '{"access_token": "***", "scope": "bo... (60 caracteres)'
+        )
+        assert resumir('{"nome": "Fulano", "cpfCnpj": "52998224725123456789"}') == (
+            '{"nome": "Fulano", "cpfCnpj": "***"... (53 caracteres)'
+        )
+    finally:
+        configurar_log(ativo=False)
+
+
+def test_amostragem(mensagens: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    configurar_log(amostragem=0.5)
+    sorteios = iter([0.7, 0.2])
+    monkeypatch.setattr("random.random", lambda: next(sorteios))
+    response = RespostaFalsa('{"nossoNumero": "1"}')
+    log_resposta(response)
+    log_resposta(response)
+    assert mensagens == ['Resposta da requisição: {"nossoNumero": "1"}']
+    assert response.lido == 1
+
+
+def test_conferir_resposta(mensagens: list[str]) -> None:
+    configurar_log()
+    conferir_resposta(RespostaFalsa('{"nossoNumero": "1"}'), True, "Erro ao recuperar boleto {}", "1")
+    with pytest.raises(RuntimeError):
+        conferir_resposta(RespostaFalsa('{"title": "falhou"}'), False, "Erro ao recuperar boleto {}", "1")
+    assert mensagens == [
+        'Resposta da requisição: {"nossoNumero": "1"}',
+        'Erro ao recuperar boleto 1: {"title": "falhou"}',
+    ]
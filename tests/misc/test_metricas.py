@@ -0,0 +1,52 @@
+import math
+
+from intersdk import Inter
+from intersdk.autenticacao import Autenticacao
+from intersdk.misc.metricas import HistogramaMetricas, Medicao
+
+
+def test_histograma_quantil_e_exportacao() -> None:
+    metricas = HistogramaMetricas(buckets=(0.1, 0.5, 1.0))
+    assert math.isnan(metricas.quantil(0.5, "http"))
+    for duracao in (0.05, 0.05, 0.3, 0.7, 2.0):
+        metricas.registrar(Medicao("http", "consulta", duracao, status=200, bytes=100))
+    metricas.registrar(Medicao("http", "emissao", 0.2, erro="ConnectionError"))
+    assert metricas.contagem("http") == 6
+    assert metricas.contagem("http", "consulta") == 5
+    assert metricas.quantil(0.4, "http", "consulta") == 0.1
+    assert metricas.quantil(0.8, "http", "consulta") == 1.0
+    assert metricas.quantil(1.0, "http", "consulta") == math.inf
+    texto = metricas.exportar_prometheus()
+    rotulos = 'operacao="http",endpoint="consulta",resultado="200"'
+    assert "# TYPE intersdk_duracao_segundos histogram" in texto
+    assert f'intersdk_duracao_segundos_bucket{{{rotulos},le="0.1"}} 2' in texto
+    assert f'intersdk_duracao_segundos_bucket{{{rotulos},le="0.5"}} 3' in texto
+    assert f'intersdk_duracao_segundos_bucket{{{rotulos},le="+Inf"}} 5' in texto
+    assert f"intersdk_duracao_segundos_count{{{rotulos}}} 5" in texto
+    assert f"intersdk_bytes_total{{{rotulos}}} 500" in texto
+    assert 'resultado="ConnectionError"' in texto
+
+
+def test_metricas_emissao(servidor_inter, criar_boleto) -> None:
+    metricas = HistogramaMetricas()
+    autenticacao = Autenticacao(
+        servidor_inter.certificate_path,
+        servidor_inter.private_key_path,
+        client_id="client_id",
+        client_secret="client_secret",
+        base_url=servidor_inter.base_url,
+        ca_certificate_path=servidor_inter.certificate_path,
+        metricas=metricas,
+    )
+    with Inter(autenticacao) as inter:
+        inter.cobranca.emitir_boleto(criar_boleto("1"))
+        inter.cobranca.recuperar_boleto("1")
+    assert metricas.contagem("token", "obter") == 2
+    assert metricas.contagem("validacao", "boleto") == 1
+    assert metricas.contagem("serializacao", "boleto") == 1
+    assert metricas.contagem("http", "token") == 2
+    assert metricas.contagem("http", "emissao") == 1
+    assert metricas.contagem("http", "consulta") == 1
+    assert 'intersdk_bytes_total{operacao="serializacao",endpoint="boleto",resultado="ok"}' in (
+        metricas.exportar_prometheus()
+    )
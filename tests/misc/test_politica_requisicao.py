@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from intersdk.misc import politica_requisicao
+from intersdk.misc.politica_requisicao import LimitadorTaxa, PoliticaRequisicao
+from tests.cobranca.test_cobranca import criar_inter
+
+
+class Relogio:
+    def __init__(self) -> None:
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+@pytest.fixture
+def esperas(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    registradas: list[float] = []
+    monkeypatch.setattr(politica_requisicao.time, "sleep", registradas.append)
+    return registradas
+
+
+def resposta(status: int, **headers: str) -> SimpleNamespace:
+    return SimpleNamespace(status_code=status, headers=headers, close=lambda: None)
+
+
+def enviar_em_sequencia(*respostas: SimpleNamespace | Exception):
+    pendentes = list(respostas)
+
+    def enviar() -> SimpleNamespace:
+        item = pendentes.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return enviar
+
+
+def test_limitador_taxa() -> None:
+    relogio = Relogio()
+    limitador = LimitadorTaxa(taxa=2, capacidade=2, relogio=relogio)
+    assert [limitador.reservar() for _ in range(4)] == [0, 0, 0.5, 1.0]
+    relogio.agora = 10
+    assert limitador.reservar() == 0
+    limitador.pausar(3)
+    assert limitador.reservar() == 3
+
+
+def test_politica_retry_after_e_backoff(esperas: list[float]) -> None:
+    politica = PoliticaRequisicao(backoff_base=1, aleatorio=lambda: 0.5)
+    enviar = enviar_em_sequencia(resposta(503), resposta(429, **{"Retry-After": "7"}), resposta(200))
+    assert politica.executar("consulta", enviar, idempotente=True).status_code == 200
+    assert esperas == [0.5, 7.0]
+
+
+def test_politica_nao_idempotente(esperas: list[float]) -> None:
+    politica = PoliticaRequisicao(aleatorio=lambda: 0)
+    assert politica.executar("emissao", enviar_em_sequencia(resposta(503)), idempotente=False).status_code == 503
+    enviar = enviar_em_sequencia(resposta(429), resposta(201))
+    assert politica.executar("emissao", enviar, idempotente=False).status_code == 201
+    with pytest.raises(requests.ConnectionError):
+        politica.executar("emissao", enviar_em_sequencia(requests.ConnectionError()), idempotente=False)
+    enviar = enviar_em_sequencia(requests.ConnectTimeout(), resposta(201))
+    assert politica.executar("emissao", enviar, idempotente=False).status_code == 201
+    assert len(esperas) == 2
+
+
+def test_politica_esgota_tentativas(esperas: list[float]) -> None:
+    politica = PoliticaRequisicao(tentativas=3, aleatorio=lambda: 0)
+    assert politica.executar("consulta", enviar_em_sequencia(*[resposta(500)] * 3), idempotente=True).status_code == 500
+    with pytest.raises(requests.ConnectionError):
+        politica.executar("consulta", enviar_em_sequencia(*[requests.ConnectionError()] * 3), idempotente=True)
+    assert len(esperas) == 4
+
+
+def test_cobranca_repete_falhas_transitorias(servidor_inter, criar_boleto) -> None:
+    servidor_inter.falhas = [503, 429]
+    with criar_inter(servidor_inter) as inter:
+        assert inter.cobranca.recuperar_boleto("1").situacao == "EMABERTO"
+        servidor_inter.falhas = [429, 503]
+        with pytest.raises(requests.HTTPError):
+            inter.cobranca.emitir_boleto(criar_boleto("1"))
+    assert servidor_inter.requisicoes.count(("GET", "/cobranca/v2/boletos/1")) == 3
+    assert servidor_inter.requisicoes.count(("POST", "/cobranca/v2/boletos")) == 2
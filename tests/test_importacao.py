@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+import pytest
+
+import intersdk
+import intersdk.cobranca
+
+PESADOS = ("requests", "loguru", "httpx", "urllib3")
+IMPORTACOES = [
+    ("import intersdk", "intersdk"),
+    ("import intersdk.cobranca", "intersdk.cobranca"),
+    ("import intersdk.misc.validators", "intersdk.misc.validators"),
+]
+
+
+def tempos_importacao(codigo: str) -> dict[str, int]:
+    saida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo], capture_output=True, text=True, check=True
+    ).stderr
+    tempos = {}
+    for linha in saida.splitlines()[1:]:
+        _, _, cumulativo, modulo = (parte.strip() for parte in linha.replace("|", ":").split(":"))
+        tempos[modulo] = int(cumulativo)
+    return tempos
+
+
+@pytest.mark.parametrize(("codigo", "modulo"), IMPORTACOES)
+def test_importacao_preguicosa(codigo: str, modulo: str) -> None:
+    tempos = tempos_importacao(codigo)
+    assert modulo in tempos
+    assert not [pesado for pesado in PESADOS if pesado in tempos]
+
+
+def test_componentes_sem_dependencias_http() -> None:
+    tempos = tempos_importacao("from intersdk.cobranca.components import Boleto")
+    assert not [pesado for pesado in PESADOS if pesado in tempos]
+
+
+def test_exportacoes() -> None:
+    assert "Inter" in dir(intersdk) and "Cobranca" in dir(intersdk.cobranca)
+    assert intersdk.Inter.__module__ == "intersdk.inter"
+    assert intersdk.cobranca.Boleto.__name__ == "Boleto"
+    with pytest.raises(AttributeError):
+        intersdk.Inexistente  # pylint: disable=pointless-statement
@@ -0,0 +1,119 @@
+import threading
+
+import pytest
+
+from intersdk import CredenciaisConta, PoolInter
+from intersdk.autenticacao import Autenticacao
+from intersdk.transporte import TransporteFalso
+
+
+def criar_pool(max_conexoes: int, transportes: dict[str, TransporteFalso]) -> PoolInter:
+    def criar_autenticacao(credenciais: CredenciaisConta) -> Autenticacao:
+        transporte = transportes.setdefault(credenciais.client_id, TransporteFalso())
+        return Autenticacao(
+            "",
+            "",
+            credenciais.client_id,
+            credenciais.client_secret,
+            token_store=pool.token_store,
+            transporte=transporte,
+        )
+
+    pool = PoolInter(
+        lambda conta_id: CredenciaisConta("", "", f"client-{conta_id}", "secret"),
+        max_conexoes=max_conexoes,
+        conexoes_por_conta=1,
+        criar_autenticacao=criar_autenticacao,
+    )
+    return pool
+
+
+def test_pool_inter(criar_boleto) -> None:
+    transportes: dict[str, TransporteFalso] = {}
+    with criar_pool(2, transportes) as pool:
+        for conta_id, seu_numero in (("a", "1"), ("b", "2"), ("a", "3"), ("c", "4")):
+            with pool.usar(conta_id) as inter:
+                inter.cobranca.emitir_boleto(criar_boleto(seu_numero))
+        # "b" foi a menos usada recentemente quando "c" precisou de uma reserva
+        assert pool.contas == ["a", "c"]
+        assert [boleto["seuNumero"] for boleto in transportes["client-a"].boletos.values()] == ["1", "3"]
+
+        pool.executar("b", lambda inter: inter.cobranca.emitir_boleto(criar_boleto("5")))
+        assert pool.contas == ["c", "b"]
+        # o token de "b" sobreviveu ao descarte do cliente
+        assert transportes["client-b"].requisicoes.count(("POST", "/oauth/v2/token")) == 1
+
+        pool.remover("c")
+        assert pool.contas == ["b"] and len(pool) == 1
+    assert not pool.contas
+
+
+def test_pool_inter_limite() -> None:
+    pool = criar_pool(1, {})
+    usando, liberar, contas = threading.Event(), threading.Event(), []
+
+    def usar_a() -> None:
+        with pool.usar("a"):
+            usando.set()
+            liberar.wait()
+
+    def usar_b() -> None:
+        with pool.usar("b"):
+            contas.extend(pool.contas)
+
+    threads = [threading.Thread(target=usar_a), threading.Thread(target=usar_b)]
+    threads[0].start()
+    usando.wait()
+    threads[1].start()
+    # "a" em uso ocupa a única reserva: "b" espera
+    threads[1].join(0.1)
+    assert threads[1].is_alive() and pool.contas == ["a"]
+    liberar.set()
+    for thread in threads:
+        thread.join()
+    assert contas == ["b"]
+    pool.close()
+
+
+def test_pool_inter_parametros() -> None:
+    with pytest.raises(ValueError):
+        PoolInter({}, max_conexoes=5, conexoes_por_conta=10)
+    with PoolInter({}) as pool, pytest.raises(KeyError):
+        pool.executar("inexistente", lambda inter: None)
+
+
+def test_pool_inter_criacao_fora_do_lock() -> None:
+    criando, liberar, criadas = threading.Event(), threading.Event(), []
+
+    def criar_autenticacao(credenciais: CredenciaisConta) -> Autenticacao:
+        criadas.append(credenciais.client_id)
+        if credenciais.client_id == "a":
+            criando.set()
+            liberar.wait()
+        if credenciais.client_id == "falha":
+            raise OSError("certificado ilegível")
+        return Autenticacao("", "", credenciais.client_id, "secret", transporte=TransporteFalso())
+
+    pool = PoolInter(
+        lambda conta_id: CredenciaisConta("", "", conta_id, "secret"),
+        max_conexoes=3,
+        conexoes_por_conta=1,
+        criar_autenticacao=criar_autenticacao,
+    )
+    pool.executar("b", lambda inter: None)
+    inters: list = []
+    threads = [threading.Thread(target=pool.executar, args=("a", inters.append)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    criando.wait()
+    # enquanto o cliente de "a" é criado, as outras contas seguem usando o pool
+    assert pool.executar("b", lambda inter: inter.autenticacao.client_id) == "b"
+    with pytest.raises(OSError):
+        pool.executar("falha", lambda inter: None)
+    assert "falha" not in pool.contas
+    liberar.set()
+    for thread in threads:
+        thread.join()
+    # a segunda chamada esperou pela criação em andamento em vez de criar outro cliente
+    assert criadas.count("a") == 1 and inters[0] is inters[1]
+    pool.close()
@@ -0,0 +1,106 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+import requests
+
+from intersdk import Inter
+from intersdk.autenticacao import Autenticacao
+from intersdk.misc.politica_requisicao import PoliticaRequisicao
+from intersdk.transporte import Transporte, TransporteFalso, TransporteUrllib3
+
+
+def criar_inter(transporte: Transporte, **kwargs) -> Inter:
+    return Inter(
+        Autenticacao(
+            "cert.pem",
+            "key.pem",
+            client_id="client_id",
+            client_secret="client_secret",
+            transporte=transporte,
+            **kwargs,
+        )
+    )
+
+
+def test_transporte_falso(criar_boleto, tmp_path: Path) -> None:
+    transporte = TransporteFalso()
+    with criar_inter(transporte) as inter:
+        boletos = [criar_boleto(str(i)) for i in range(1, 4)]
+        for boleto in boletos:
+            inter.cobranca.emitir_boleto(boleto)
+        assert [boleto.nosso_numero for boleto in boletos] == ["00000000001", "00000000002", "00000000003"]
+        recuperado = inter.cobranca.recuperar_boleto("00000000002")
+        assert recuperado.seu_numero == "2" and recuperado.pagador.nome == "Fulano de Tal"
+        assert recuperado.data_vencimento == boletos[1].data_vencimento
+        inter.cobranca.cancelar_boleto("00000000002", "ACERTOS")
+        vencimento = date.today() + timedelta(days=10)
+        listados = list(inter.cobranca.listar_boletos(vencimento, vencimento, itens_por_pagina=2))
+        assert [(boleto.seu_numero, boleto.situacao) for boleto in listados] == [
+            ("1", "EMABERTO"),
+            ("2", "CANCELADO"),
+            ("3", "EMABERTO"),
+        ]
+        inter.cobranca.recuperar_boleto_pdf("00000000001", str(tmp_path / "1.pdf"))
+        assert (tmp_path / "1.pdf").read_bytes().startswith(b"%PDF")
+        with pytest.raises(requests.HTTPError):
+            inter.cobranca.recuperar_boleto("99")
+    assert transporte.requisicoes.count(("POST", "/oauth/v2/token")) == 2
+
+
+def test_transporte_falso_injecao_de_falhas(criar_boleto, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda _: None)
+    transporte = TransporteFalso(latencia=0.001)
+    with criar_inter(transporte, politica=PoliticaRequisicao(backoff_base=0)) as inter:
+        inter.cobranca.emitir_boleto(criar_boleto("1"))
+        transporte.falhas = [503, 502]
+        assert inter.cobranca.recuperar_boleto("00000000001").seu_numero == "1"
+        # emissão não é idempotente: falha de conexão não é repetida
+        transporte.falhas = [requests.ConnectionError()]
+        with pytest.raises(requests.ConnectionError):
+            inter.cobranca.emitir_boleto(criar_boleto("2"))
+    assert transporte.requisicoes.count(("GET", "/cobranca/v2/boletos/00000000001")) == 3
+
+    sorteios = []
+    for _ in range(2):
+        transporte = TransporteFalso(taxa_falhas=0.3, semente=42)
+        with criar_inter(transporte) as inter:
+            for i in range(20):
+                try:
+                    inter.cobranca.emitir_boleto(criar_boleto(str(i)))
+                except requests.HTTPError:
+                    pass
+        sorteios.append(transporte.requisicoes)
+    assert sorteios[0] == sorteios[1]
+
+
+def test_transporte_urllib3(servidor_inter, criar_boleto, tmp_path: Path) -> None:
+    servidor_inter.total_boletos = 3
+    transporte = TransporteUrllib3(
+        servidor_inter.certificate_path,
+        servidor_inter.private_key_path,
+        ca_certificate_path=servidor_inter.certificate_path,
+    )
+    autenticacao = Autenticacao(
+        servidor_inter.certificate_path,
+        servidor_inter.private_key_path,
+        client_id="client_id",
+        client_secret="client_secret",
+        base_url=servidor_inter.base_url,
+        transporte=transporte,
+    )
+    with Inter(autenticacao) as inter:
+        boleto = criar_boleto("1")
+        inter.cobranca.emitir_boleto(boleto)
+        assert boleto.nosso_numero == "00000000001"
+        assert [boleto.nosso_numero for boleto in inter.cobranca.listar_boletos(date.today(), date.today())] == [
+            "0",
+            "1",
+            "2",
+        ]
+        inter.cobranca.recuperar_boleto_pdf("1", str(tmp_path / "1.pdf"))
+        assert (tmp_path / "1.pdf").read_bytes().startswith(b"%PDF")
+        servidor_inter.falhas = [404]
+        with pytest.raises(requests.HTTPError):
+            inter.cobranca.recuperar_boleto("1")
+    assert ("POST", "/cobranca/v2/boletos") in servidor_inter.requisicoes